@@ -0,0 +1,38 @@
+"""pass_hash_size
+
+Revision ID: 6c1f0d2a9b41
+Revises: 00aaf5ea70b2
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '6c1f0d2a9b41'
+down_revision: Union[str, None] = '00aaf5ea70b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'users',
+        'pass_hash',
+        existing_type=sa.String(length=32),
+        type_=sa.String(length=255),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'users',
+        'pass_hash',
+        existing_type=sa.String(length=255),
+        type_=sa.String(length=32),
+        existing_nullable=False,
+    )
@@ -1,19 +1,88 @@
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Final, Iterator
+
 import uvicorn
 
 from src.configs.logger_settings import logger, setup_uvicorn_logger
-from src.configs.server_config import SERVER_HOST, SERVER_PORT
+from src.configs.server_config import (
+    SERVER_BACKLOG,
+    SERVER_GRACEFUL_SHUTDOWN_SECONDS,
+    SERVER_HOST,
+    SERVER_KEEP_ALIVE_SECONDS,
+    SERVER_MAX_REQUESTS,
+    SERVER_MODE,
+    SERVER_PORT,
+    SERVER_WORKERS,
+)
 
+_APP: str = 'src.api:app'
+_METRICS_DIR_VARIABLE: Final = 'PROMETHEUS_MULTIPROC_DIR'
 
-def main():
-    """Main method. Entry point."""
-    try:
+
+def _run_debug():
+    uvicorn.run(
+        _APP,
+        host=SERVER_HOST,
+        port=SERVER_PORT,
+        reload=True,
+        log_config=setup_uvicorn_logger(),
+    )
+
+
+@contextmanager
+def _multiprocess_metrics_dir() -> Iterator[None]:
+    # Воркеры пишут метрики в общий каталог, чтобы /metrics
+    # любого воркера отдавал сумму по всем процессам. Каталог,
+    # заданный в окружении, остается за тем, кто его задал;
+    # временный каталог удаляется после остановки сервера.
+    if SERVER_WORKERS < 2 or _METRICS_DIR_VARIABLE in os.environ:
+        yield
+        return
+    with tempfile.TemporaryDirectory(
+        prefix='inventory-control-metrics-',
+    ) as metrics_dir:
+        os.environ[_METRICS_DIR_VARIABLE] = metrics_dir
+        try:
+            yield
+        finally:
+            os.environ.pop(_METRICS_DIR_VARIABLE, None)
+
+
+def _run_release():
+    with _multiprocess_metrics_dir():
         uvicorn.run(
-            'src.api:app',
+            _APP,
             host=SERVER_HOST,
             port=SERVER_PORT,
-            reload=True,
+            workers=SERVER_WORKERS,
+            loop='uvloop',
+            http='httptools',
+            backlog=SERVER_BACKLOG,
+            timeout_keep_alive=SERVER_KEEP_ALIVE_SECONDS,
+            timeout_graceful_shutdown=SERVER_GRACEFUL_SHUTDOWN_SECONDS,
+            limit_max_requests=SERVER_MAX_REQUESTS or None,
             log_config=setup_uvicorn_logger(),
         )
+
+
+def main():
+    """
+    Main method. Entry point.
+
+    В режиме Release запускает SERVER_WORKERS воркеров на uvloop
+    и httptools. По SIGTERM воркеры перестают принимать соединения
+    и дожидаются завершения текущих запросов. Воркер, обработавший
+    SERVER_MAX_REQUESTS запросов, завершается и запускается заново.
+    В остальных режимах запускает один процесс с перезагрузкой
+    при изменении файлов.
+    """
+    try:
+        if SERVER_MODE == 'Release':
+            _run_release()
+        else:
+            _run_debug()
     except Exception as ex:
         logger.opt(exception=True).critical(
             'You have done something wrong! {0}'.format(str(ex)),
@@ -1,10 +1,59 @@
-from fastapi import FastAPI
+import asyncio
+import contextlib
+from typing import AsyncIterator
+
+from fastapi import FastAPI, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 
-from src.auth import auth_api
+from src.auth.dependencies import is_admin_request
+from src.auth.router import router as auth_api
+from src.configs.load_shedding_config import LOAD_SHEDDING_ENABLED
+from src.configs.logger_settings import AccessLogTimingMiddleware
+from src.configs.loop_monitor_config import LOOP_MONITOR_ENABLED
+from src.diagnostics.router import router as diagnostics_api
+from src.utils.compression import CompressionMiddleware
+from src.utils.database_session import get_engine
+from src.utils.deadline import DeadlineMiddleware
+from src.utils.json_response import FastJSONResponse
+from src.utils.load_shedding import LoadSheddingMiddleware
+from src.utils.loop_monitor import LoopLagMonitor
+from src.utils.metrics import (
+    MetricsMiddleware,
+    mark_process_dead,
+    render_metrics,
+)
+from src.utils.redis_client import close_redis_client
+from src.utils.request_profiler import RequestProfilerMiddleware
+from src.utils.tracing import TracingMiddleware
+from src.utils.warmup import WARM_UP
+
+
+@contextlib.asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """
+    Запускает прогрев при старте и закрывает соединения при остановке.
+
+    Прогрев выполняется в фоне, чтобы сервер сразу отвечал
+    на проверку готовности. На время работы запускается монитор
+    задержки цикла событий, если он включен.
+
+    Yields:
+        None: Управление приложению на время работы.
+    """
+    background_tasks = [asyncio.create_task(WARM_UP.run())]
+    if LOOP_MONITOR_ENABLED:
+        background_tasks.append(asyncio.create_task(LoopLagMonitor().run()))
+    yield
+    for task in background_tasks:
+        task.cancel()
+    await get_engine().dispose()
+    await close_redis_client()
+    mark_process_dead()
 
 app = FastAPI(
     title='inventory-control',
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 app.add_middleware(
@@ -15,4 +64,45 @@ app.add_middleware(
     allow_headers=['*'],
 )
 
+app.add_middleware(RequestProfilerMiddleware, authorize=is_admin_request)
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(TracingMiddleware)
+app.add_middleware(DeadlineMiddleware)
+if LOAD_SHEDDING_ENABLED:
+    app.add_middleware(LoadSheddingMiddleware)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(AccessLogTimingMiddleware)
+
 app.include_router(auth_api)
+app.include_router(diagnostics_api)
+
+
+@app.get('/metrics', include_in_schema=False)
+async def metrics() -> Response:
+    """
+    Возвращает метрики приложения в формате Prometheus.
+
+    Returns:
+        Response: Метрики в текстовом формате Prometheus.
+    """
+    metrics_body, content_type = render_metrics()
+    return Response(metrics_body, media_type=content_type)
+
+
+@app.get('/health/ready', include_in_schema=False)
+async def readiness() -> FastJSONResponse:
+    """
+    Сообщает, завершен ли прогрев приложения.
+
+    Returns:
+        FastJSONResponse: 200, если прогрев завершен и обязательные шаги
+        выполнены, иначе 503.
+    """
+    if not WARM_UP.ready:
+        return FastJSONResponse(
+            {'status': 'warming_up', 'failed_steps': WARM_UP.failed_steps},
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+    return FastJSONResponse(
+        {'status': 'ready', 'failed_steps': WARM_UP.failed_steps},
+    )
@@ -1,27 +1,52 @@
+import asyncio
 from functools import wraps
 from inspect import signature
 from typing import Callable, Optional
 
+from src.auth.configs.login_throttle_config import (
+    LOGIN_THROTTLE_ENABLED,
+    LOGIN_THROTTLE_IP_MAX_ATTEMPTS,
+    LOGIN_THROTTLE_IP_WINDOW_SECONDS,
+    LOGIN_THROTTLE_LOGIN_MAX_ATTEMPTS,
+    LOGIN_THROTTLE_LOGIN_WINDOW_SECONDS,
+)
 from src.auth.configs.token_config import (
+    ACCESS_TOKEN_CACHE_SIZE,
     ACCESS_TOKEN_EXPIRE_SECONDS,
-    PUBLIC_KEY,
+    REFRESH_GRACE_SECONDS,
     REFRESH_TOKEN_EXPIRE_SECONDS,
-    SECRET_KEY,
     TOKEN_ALGORITHM_NAME,
+    USER_ROLE_CACHE_SECONDS,
+    get_public_key,
+    get_secret_key,
+)
+from src.auth.schemas.tokens import (
+    AccessToken,
+    RefreshToken,
+    TokenIntrospection,
+    Tokens,
 )
-from src.auth.schemas.tokens import AccessToken, RefreshToken, Tokens
 from src.auth.schemas.user import UserAuth
 from src.auth.services import (
     AuthenticateService,
     LogoutService,
     RefreshService,
 )
+from src.auth.utils.exceptions import TooManyLoginAttemptsError
+from src.auth.utils.login_throttler import LoginThrottler, SlidingWindowLimit
 from src.auth.utils.password_manager import PasswordManager
+from src.auth.utils.permissions import Permissions
 from src.auth.utils.tokens.token_manager import TokenManager
+from src.configs.db_config import DB_POOL_SIZE
 from src.utils.database_session import session_connect
+from src.utils.metrics import AUTH_LOGINS, AUTH_REFRESHES
+from src.utils.redis_client import get_redis_client
+from src.utils.singleflight import SingleFlight
+from src.utils.stampede_cache import CachePolicy, StampedeCache
+from src.utils.tracing import traced
 
 
-class AuthServiceAggregator:
+class AuthServiceAggregator:  # noqa: WPS214
     """
     Предоставляет сервисы для аутентификации, выхода и обновления токенов.
 
@@ -29,11 +54,15 @@ class AuthServiceAggregator:
     обеспечения функциональности, связанной с аутентификацией пользователей.
 
     Methods:
+        login_throttle_counters (property): Счетчики попыток входа.
         authenticate: Аутентифицирует пользователя и возвращает токены.
         logout: Выполняет выход пользователя из системы.
         logout_from_all_devices: Выполняет выход пользователя со всех устройств.
         refresh: Обновляет токены, используя токен обновления.
+        introspect: Проверяет пакет токенов доступа.
         identification: Декоратор для идентификации по токену доступа.
+        authorization: Декоратор для проверки прав по токену доступа.
+        warm_up: Прогревает ключи, хеширование паролей и запросы.
     """
 
     def __init__(self) -> None:
@@ -46,12 +75,27 @@ class AuthServiceAggregator:
         self._token_manager = TokenManager(
             ACCESS_TOKEN_EXPIRE_SECONDS,
             TOKEN_ALGORITHM_NAME,
-            SECRET_KEY,
-            PUBLIC_KEY,
+            get_secret_key(),
+            get_public_key(),
+            ACCESS_TOKEN_CACHE_SIZE,
         )
 
         self._password_manager = PasswordManager()
 
+        self._login_throttler = LoginThrottler(
+            get_redis_client(),
+            login_limit=SlidingWindowLimit(
+                scope='login',
+                window_seconds=LOGIN_THROTTLE_LOGIN_WINDOW_SECONDS,
+                max_attempts=LOGIN_THROTTLE_LOGIN_MAX_ATTEMPTS,
+            ),
+            ip_limit=SlidingWindowLimit(
+                scope='ip',
+                window_seconds=LOGIN_THROTTLE_IP_WINDOW_SECONDS,
+                max_attempts=LOGIN_THROTTLE_IP_MAX_ATTEMPTS,
+            ),
+        )
+
         self._authenticate_service = AuthenticateService(
             self._token_manager,
             self._password_manager,
@@ -64,27 +108,62 @@ class AuthServiceAggregator:
 
         self._refresh_service = RefreshService(
             self._token_manager,
+            StampedeCache(
+                'user_roles',
+                get_redis_client(),
+                CachePolicy(ttl_seconds=USER_ROLE_CACHE_SECONDS),
+            ),
         )
+        self._refresh_flight = SingleFlight(REFRESH_GRACE_SECONDS)
+
+    @property
+    def login_throttle_counters(self) -> dict[str, int]:
+        """
+        Возвращает счетчики ограничителя попыток входа.
+
+        Returns:
+            dict[str, int]: Счетчики разрешенных и отклоненных попыток.
+        """
+        return self._login_throttler.counters
 
+    @traced()
     async def authenticate(
         self,
         user_auth: UserAuth,
+        client_ip: Optional[str] = None,
     ) -> Optional[Tokens]:
         """
         Аутентифицирует пользователя и возвращает токены доступа и обновления.
 
+        Перед обращением к базе данных и проверкой пароля попытка
+        проверяется ограничителем частоты входа по логину и IP-адресу.
+
         Args:
             user_auth (UserAuth): Данные аутентификации пользователя.
+            client_ip (Optional[str]): IP-адрес клиента, если известен.
 
         Returns:
             Optional[Tokens]: Токены доступа и обновления,
                 если аутентификация прошла успешно, иначе None.
         """
-        return await session_connect(
-            self._authenticate_service.authenticate,
-            user_auth,
-        )
+        if LOGIN_THROTTLE_ENABLED:
+            await self._check_login_throttle(user_auth.login, client_ip)
 
+        try:
+            tokens: Optional[Tokens] = await session_connect(
+                self._authenticate_service.authenticate,
+                user_auth,
+            )
+        except Exception:
+            AUTH_LOGINS.labels('failure').inc()
+            raise
+        AUTH_LOGINS.labels('success').inc()
+
+        if LOGIN_THROTTLE_ENABLED:
+            await self._login_throttler.reset(user_auth.login)
+        return tokens
+
+    @traced()
     async def logout(
         self,
         refresh_token: RefreshToken,
@@ -92,6 +171,11 @@ class AuthServiceAggregator:
         """
         Выполняет выход пользователя из системы.
 
+        Пара токенов, сохраненная для повторов обновления этим токеном
+        или выданная в обмен на него, забывается: иначе повтор старого
+        токена в течение REFRESH_GRACE_SECONDS вернул бы ее без
+        обращения к базе данных.
+
         Args:
             refresh_token (RefreshToken): Токен обновления
                                     для выхода из системы.
@@ -100,11 +184,21 @@ class AuthServiceAggregator:
             Optional[Tokens]: Токены доступа и обновления,
                     если выход прошел успешно, иначе None.
         """
-        return await session_connect(
-            self._logout_service.logout,
-            refresh_token,
-        )
+        token_id = refresh_token.refresh_token
+        try:
+            return await session_connect(
+                self._logout_service.logout,
+                refresh_token,
+            )
+        finally:
+            self._refresh_flight.forget(token_id)
+            self._refresh_flight.forget_where(
+                lambda tokens: tokens is not None and (
+                    tokens.refresh_token == token_id
+                ),
+            )
 
+    @traced()
     async def logout_from_all_devices(
         self,
         access_token: AccessToken,
@@ -112,6 +206,9 @@ class AuthServiceAggregator:
         """
         Выполняет выход пользователя из системы со всех устройств.
 
+        Все пары токенов, сохраненные для повторов обновления,
+        забываются, чтобы ни одна из них не пережила выход.
+
         Args:
             access_token (AccessToken): Токен доступа для
                                 выхода со всех устройств.
@@ -120,11 +217,15 @@ class AuthServiceAggregator:
             Optional[Tokens]: Токены доступа и обновления,
                     если выход прошел успешно, иначе None.
         """
-        return await session_connect(
-            self._logout_service.logout_from_all_devices,
-            access_token,
-        )
+        try:
+            return await session_connect(
+                self._logout_service.logout_from_all_devices,
+                access_token,
+            )
+        finally:
+            self._refresh_flight.clear()
 
+    @traced()
     async def refresh(
         self,
         refresh_token: RefreshToken,
@@ -132,6 +233,11 @@ class AuthServiceAggregator:
         """
         Обновляет токены доступа и обновления, используя токен обновления.
 
+        Одновременные запросы с одним токеном обновления выполняют
+        одну операцию в базе данных и получают одну и ту же новую пару
+        токенов. Повторы в течение REFRESH_GRACE_SECONDS получают
+        ту же пару без обращения к базе данных.
+
         Args:
             refresh_token (RefreshToken): Токен обновления
                                     для обновления токенов.
@@ -140,10 +246,34 @@ class AuthServiceAggregator:
             Optional[Tokens]: Новые токены доступа и обновления,
                     если обновление прошло успешно, иначе None.
         """
-        return await session_connect(
-            self._refresh_service.refresh,
-            refresh_token,
-        )
+        try:
+            tokens: Optional[Tokens] = await self._refresh_flight.run(
+                refresh_token.refresh_token,
+                session_connect,
+                self._refresh_service.refresh,
+                refresh_token,
+            )
+        except Exception:
+            AUTH_REFRESHES.labels('failure').inc()
+            raise
+        AUTH_REFRESHES.labels('success').inc()
+        return tokens
+
+    def introspect(
+        self,
+        access_tokens: list[str],
+    ) -> list[TokenIntrospection]:
+        """
+        Проверяет пакет токенов доступа без обращения к базе данных.
+
+        Args:
+            access_tokens (list[str]): Токены доступа для проверки.
+
+        Returns:
+            list[TokenIntrospection]: Утверждения или причина отказа
+                для каждого токена в порядке запроса.
+        """
+        return self._token_manager.decode_tokens(access_tokens)
 
     def identification(
         self,
@@ -175,3 +305,69 @@ class AuthServiceAggregator:
 
             return func(*args, **kwargs)
         return ind_decorate
+
+    def authorization(
+        self,
+        required: Permissions,
+    ) -> Callable:
+        """
+        Декоратор для проверки прав пользователя по токену доступа.
+
+        Права берутся из утверждений проверенного токена,
+        поэтому запрос к таблице пользователей не выполняется.
+
+        Args:
+            required (Permissions): Права, необходимые для вызова функции.
+
+        Returns:
+            Callable: Декоратор, проверяющий права перед вызовом функции.
+        """
+        def decorator(func: Callable) -> Callable:  # noqa: WPS430
+            arg_name: str = 'access_token'
+            func_args: dict = dict(signature(func).parameters)
+
+            if arg_name not in func_args:
+                raise KeyError('access_token отсутствует в kwargs')
+
+            args_position: int = list(func_args.keys()).index(arg_name)
+
+            @wraps(func)
+            def auth_decorate(*args, **kwargs):  # noqa: WPS430
+                access_token: str = kwargs.get(arg_name) or args[args_position]
+                self._token_manager.authorize(access_token, required)
+                return func(*args, **kwargs)
+            return auth_decorate
+        return decorator
+
+    async def warm_up(self) -> None:
+        """
+        Прогревает ключи, хеширование паролей и запросы.
+
+        Строит объекты ключей токенов, загружает алгоритм хеширования
+        паролей и выполняет запросы входа и обновления токенов
+        на DB_POOL_SIZE соединениях одновременно, чтобы каждое
+        соединение пула подготовило их заранее.
+        """
+        self._token_manager.warm_up()
+        await asyncio.to_thread(self._password_manager.hash, 'warm-up')
+        await asyncio.gather(
+            *(
+                session_connect(self._prepare_statements)
+                for _ in range(max(DB_POOL_SIZE, 1))
+            ),
+        )
+
+    async def _prepare_statements(self, session) -> None:
+        await self._authenticate_service.warm_up(session)
+        await self._refresh_service.warm_up(session)
+
+    async def _check_login_throttle(
+        self,
+        login: str,
+        client_ip: Optional[str],
+    ) -> None:
+        try:
+            await self._login_throttler.check(login, client_ip)
+        except TooManyLoginAttemptsError:
+            AUTH_LOGINS.labels('throttled').inc()
+            raise
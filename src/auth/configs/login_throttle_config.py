@@ -0,0 +1,42 @@
+import os
+from typing import Final
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+_LOGIN_WINDOW_SECONDS: Final = 300
+_LOGIN_MAX_ATTEMPTS: Final = 10
+_IP_WINDOW_SECONDS: Final = 60
+_IP_MAX_ATTEMPTS: Final = 100
+
+LOGIN_THROTTLE_ENABLED: Final = os.environ.get(
+    'LOGIN_THROTTLE_ENABLED',
+    default='true',
+).lower() == 'true'
+
+LOGIN_THROTTLE_LOGIN_WINDOW_SECONDS: Final = int(
+    os.environ.get(
+        'LOGIN_THROTTLE_LOGIN_WINDOW_SECONDS',
+        default=_LOGIN_WINDOW_SECONDS,
+    ),
+)
+LOGIN_THROTTLE_LOGIN_MAX_ATTEMPTS: Final = int(
+    os.environ.get(
+        'LOGIN_THROTTLE_LOGIN_MAX_ATTEMPTS',
+        default=_LOGIN_MAX_ATTEMPTS,
+    ),
+)
+
+LOGIN_THROTTLE_IP_WINDOW_SECONDS: Final = int(
+    os.environ.get(
+        'LOGIN_THROTTLE_IP_WINDOW_SECONDS',
+        default=_IP_WINDOW_SECONDS,
+    ),
+)
+LOGIN_THROTTLE_IP_MAX_ATTEMPTS: Final = int(
+    os.environ.get(
+        'LOGIN_THROTTLE_IP_MAX_ATTEMPTS',
+        default=_IP_MAX_ATTEMPTS,
+    ),
+)
@@ -0,0 +1,37 @@
+import os
+from typing import Final
+
+import yaml
+from dotenv import load_dotenv
+
+load_dotenv()
+
+_DEFAULT_TARGET_VERIFY_MS: Final = 250
+_DEFAULT_SCHEMES: Final = ('bcrypt',)
+
+PASSWORD_HASH_FILE_PATH: Final = os.environ.get(
+    'FILE_WITH_PASSWORD_HASH_CONFIG',
+    default='src/auth/configs/password_hash.yaml',
+)
+
+PASSWORD_HASH_TARGET_VERIFY_MS: Final = int(
+    os.environ.get(
+        'PASSWORD_HASH_TARGET_VERIFY_MS',
+        default=_DEFAULT_TARGET_VERIFY_MS,
+    ),
+)
+
+try:
+    with open(PASSWORD_HASH_FILE_PATH, 'r') as file:  # noqa: WPS110
+        _hash_config = yaml.safe_load(file) or {}
+except FileNotFoundError:
+    _hash_config = {}
+
+# Первая схема используется для новых хешей, остальные считаются
+# устаревшими и заменяются при следующем успешном входе.
+PASSWORD_HASH_SCHEMES: Final = tuple(
+    _hash_config.get('schemes', _DEFAULT_SCHEMES),
+)
+
+# Параметры CryptContext в формате passlib, например bcrypt__rounds.
+PASSWORD_HASH_SETTINGS: Final = dict(_hash_config.get('settings', {}))
@@ -1,6 +1,7 @@
 import base64
+import functools
 import os
-from typing import Final, Optional
+from typing import Final, Optional, Union
 
 import yaml
 from dotenv import load_dotenv
@@ -15,6 +16,10 @@ YAML_FILE_PATH: Final = os.environ.get(
 
 _ACCESS_TOKEN_EXPIRE_MINUTES: Final = 5
 _REFRESH_TOKEN_EXPIRE_DAYS: Final = 30
+_REFRESH_GRACE_SECONDS: Final = 10
+_ACCESS_TOKEN_CACHE_SIZE: Final = 4096
+_INTROSPECTION_MAX_BATCH_SIZE: Final = 1000
+_USER_ROLE_CACHE_SECONDS: Final = 30
 
 MAX_TOKEN_COUNT: Final = os.environ.get(
     'MAX_TOKEN_COUNT',
@@ -44,26 +49,80 @@ REFRESH_TOKEN_EXPIRE_SECONDS: Final = int(
     ),
 ) * 24 * 60
 
-try:
-    with open(YAML_FILE_PATH, 'r') as file:  # noqa: WPS110
-        _keys = yaml.safe_load(file)
-except FileNotFoundError:
-    _keys = {}
+# Сколько секунд повторный запрос с тем же токеном обновления
+# получает уже выданную пару токенов вместо ошибки.
+REFRESH_GRACE_SECONDS: Final = float(
+    os.environ.get(
+        'REFRESH_GRACE_SECONDS',
+        default=_REFRESH_GRACE_SECONDS,
+    ),
+)
 
+ACCESS_TOKEN_CACHE_SIZE: Final = int(
+    os.environ.get(
+        'ACCESS_TOKEN_CACHE_SIZE',
+        default=_ACCESS_TOKEN_CACHE_SIZE,
+    ),
+)
 
-_SECRET_KEY: Final = _keys.get('secret_key')
+INTROSPECTION_MAX_BATCH_SIZE: Final = int(
+    os.environ.get(
+        'INTROSPECTION_MAX_BATCH_SIZE',
+        default=_INTROSPECTION_MAX_BATCH_SIZE,
+    ),
+)
+
+# Сколько секунд роль пользователя, прочитанная при обновлении токенов,
+# берется из кеша. Еще CACHE_STALE_SECONDS после этого устаревшая роль
+# отдается, пока обновляется в фоне.
+USER_ROLE_CACHE_SECONDS: Final = float(
+    os.environ.get(
+        'USER_ROLE_CACHE_SECONDS',
+        default=_USER_ROLE_CACHE_SECONDS,
+    ),
+)
+
+# Общий секрет внутренних сервисов. Если не задан,
+# внутренние эндпоинты недоступны.
+INTERNAL_API_TOKEN: Final = os.environ.get('INTERNAL_API_TOKEN')
+
+
+@functools.cache
+def _load_keys() -> dict:
+    try:
+        with open(YAML_FILE_PATH, 'r') as file:  # noqa: WPS110
+            return yaml.safe_load(file) or {}
+    except FileNotFoundError:
+        return {}
 
-if TOKEN_ALGORITHM_TYPE == 'symmetric':  # noqa: S105
-    SECRET_KEY: Final[str] = base64.b64encode(_SECRET_KEY).decode('utf-8')
-else:
-    SECRET_KEY: Final[dict] = jwk.construct(
-        _SECRET_KEY,
-        TOKEN_ALGORITHM_NAME,
-    ).to_dict()
 
-PUBLIC_KEY: Final[Optional[dict]] = (
-    jwk.construct(
-        _keys.get('public_key'),
+@functools.cache
+def get_secret_key() -> Union[str, dict]:
+    """
+    Возвращает ключ подписи токенов.
+
+    Файл ключей читается и разбирается при первом вызове,
+    а не при импорте модуля.
+
+    Returns:
+        Union[str, dict]: Секрет для симметричного алгоритма
+        или JWK закрытого ключа для асимметричного.
+    """
+    secret_key = _load_keys().get('secret_key')
+    if TOKEN_ALGORITHM_TYPE == 'symmetric':  # noqa: S105
+        return base64.b64encode(secret_key).decode('utf-8')
+    return jwk.construct(secret_key, TOKEN_ALGORITHM_NAME).to_dict()
+
+
+@functools.cache
+def get_public_key() -> Optional[dict]:
+    """
+    Возвращает ключ проверки подписи токенов.
+
+    Returns:
+        Optional[dict]: JWK открытого ключа.
+    """
+    return jwk.construct(
+        _load_keys().get('public_key'),
         TOKEN_ALGORITHM_NAME,
     ).to_dict()
-)
@@ -0,0 +1,87 @@
+import functools
+import secrets
+from typing import Annotated, Optional
+
+from fastapi import Header, Request
+from starlette.datastructures import Headers
+
+from src.auth.auth_service_aggregator import AuthServiceAggregator
+from src.auth.configs.token_config import INTERNAL_API_TOKEN
+from src.auth.utils.exceptions import (
+    InsufficientPermissionsError,
+    InvalidInternalTokenError,
+)
+from src.auth.utils.permissions import Permissions, has_permissions
+
+
+@functools.cache
+def get_auth_service() -> AuthServiceAggregator:
+    """
+    Возвращает общий сервис аутентификации.
+
+    Сервис создается при первом обращении: его создание читает
+    ключи токенов, и это не должно замедлять импорт приложения.
+
+    Returns:
+        AuthServiceAggregator: Сервис аутентификации.
+    """
+    return AuthServiceAggregator()
+
+
+def verify_internal_token(
+    x_internal_token: Annotated[Optional[str], Header()] = None,
+) -> None:
+    """
+    Проверяет доступ к внутренним эндпоинтам по общему секрету.
+
+    Секрет передается в заголовке X-Internal-Token и сравнивается
+    с INTERNAL_API_TOKEN. Если секрет не настроен, доступ запрещен.
+
+    Args:
+        x_internal_token (Optional[str]): Значение заголовка X-Internal-Token.
+
+    Raises:
+        InvalidInternalTokenError: Если секрет не настроен или не совпадает.
+    """
+    if INTERNAL_API_TOKEN is None or x_internal_token is None:
+        raise InvalidInternalTokenError
+    if not secrets.compare_digest(x_internal_token, INTERNAL_API_TOKEN):
+        raise InvalidInternalTokenError
+
+
+def is_admin_request(headers: Headers) -> bool:
+    """
+    Проверяет, что запрос выполняется администратором.
+
+    Используется служебными middleware, которым недоступны зависимости
+    FastAPI. Права берутся из токена доступа в заголовке Authorization.
+
+    Args:
+        headers (Headers): Заголовки запроса.
+
+    Returns:
+        bool: True, если токен действителен и дает права manage_users.
+    """
+    scheme, _, access_token = headers.get('authorization', '').partition(' ')
+    if scheme.lower() != 'bearer' or not access_token:
+        return False
+    introspection = get_auth_service().introspect([access_token])[0]
+    return introspection.active and has_permissions(
+        introspection.claims,
+        Permissions.manage_users,
+    )
+
+
+def require_admin(request: Request) -> None:
+    """
+    Зависимость, допускающая к эндпоинту только администраторов.
+
+    Args:
+        request (Request): Текущий запрос.
+
+    Raises:
+        InsufficientPermissionsError: Если запрос выполняется
+        не администратором.
+    """
+    if not is_admin_request(request.headers):
+        raise InsufficientPermissionsError
@@ -4,7 +4,6 @@ from datetime import datetime
 import sqlalchemy as sa
 from sqlalchemy import event, func
 from sqlalchemy import orm as so
-from sqlalchemy import select
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql.expression import false
 
@@ -12,6 +11,7 @@ from src.auth.configs.token_config import MAX_TOKEN_COUNT
 from src.auth.utils.exceptions import TokenLimitExceededError
 from src.configs.logger_settings import logger
 from src.utils.database_session import BASE
+from src.utils.tracing import traced
 
 
 class RefreshSessionModel(BASE):
@@ -60,6 +60,7 @@ class RefreshSessionModel(BASE):
 
 
 @event.listens_for(RefreshSessionModel, 'before_insert')
+@traced()
 def check_token_limit(mapper, connection, target):
     """
     Проверка лимита токенов перед вставкой.
@@ -72,7 +73,7 @@ def check_token_limit(mapper, connection, target):
     Raises:
         TokenLimitExceededError: Если превышен лимит токенов.
     """
-    query = select(
+    query = sa.select(
         func.count(),
     ).filter(
         RefreshSessionModel.user_id == target.user_id,
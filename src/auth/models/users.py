@@ -8,7 +8,7 @@ from sqlalchemy import orm as so
 from src.utils.database_session import BASE
 
 MAX_LOGIN_SIZE: Final = 32
-PASS_HASH_SIZE: Final = 32
+PASS_HASH_SIZE: Final = 255
 MAX_NAME_SIZE: Final = 128
 
 
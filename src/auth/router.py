@@ -1,13 +1,85 @@
-from fastapi import APIRouter, Response
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Request, Response
 from starlette.status import HTTP_200_OK  # noqa: F401
 
-from src.auth import schemas  # noqa: F401
+from src.auth.configs.token_config import INTROSPECTION_MAX_BATCH_SIZE
+from src.auth.dependencies import get_auth_service, verify_internal_token
 from src.auth.models import users  # noqa: F401
+from src.auth.schemas.tokens import (
+    TokenIntrospection,
+    TokenIntrospectionRequest,
+    Tokens,
+)
+from src.auth.schemas.user import UserAuth
+from src.auth.utils.exceptions import BatchTooLargeError
+from src.utils.json_response import SERIALIZERS, FastJSONResponse
+from src.utils.warmup import WARM_UP
 
 router = APIRouter()
 
+SERIALIZERS.register(TokenIntrospection)
+
+
+async def _warm_up_auth() -> None:
+    await get_auth_service().warm_up()
+
+
+WARM_UP.register('auth', _warm_up_auth, required=True)
+
 
 @router.get('/echo/{string}')
 def set_task(string: str, response: Response) -> str:
     """Example."""
     return string[::-1]
+
+
+@router.post('/auth/login', response_model=Tokens)
+async def login(user_auth: UserAuth, request: Request) -> Optional[Tokens]:
+    """
+    Выполняет вход пользователя по логину и паролю.
+
+    IP-адрес клиента передается ограничителю попыток входа. За обратным
+    прокси uvicorn берет его из X-Forwarded-For, если прокси входит
+    в forwarded_allow_ips.
+
+    Args:
+        user_auth (UserAuth): Логин и пароль пользователя.
+        request (Request): Текущий запрос.
+
+    Returns:
+        Optional[Tokens]: Токены доступа и обновления.
+    """
+    client_ip = request.client.host if request.client else None
+    return await get_auth_service().authenticate(user_auth, client_ip)
+
+
+@router.post(
+    '/internal/introspect',
+    response_model=list[TokenIntrospection],
+    dependencies=[Depends(verify_internal_token)],
+    include_in_schema=False,
+)
+def introspect(
+    introspection_request: TokenIntrospectionRequest,
+) -> FastJSONResponse:
+    """
+    Проверяет пакет токенов доступа для внутренних шлюзов.
+
+    Обработчик синхронный: проверка подписей и сериализация ответа
+    выполняются в пуле потоков и не блокируют цикл событий. Ответ
+    сериализуется сразу в байты, без промежуточных словарей.
+
+    Args:
+        introspection_request (TokenIntrospectionRequest): Пакет токенов.
+
+    Returns:
+        FastJSONResponse: Результаты проверки в порядке токенов.
+
+    Raises:
+        BatchTooLargeError: Если пакет превышает допустимый размер.
+    """
+    access_tokens = introspection_request.access_tokens
+    if len(access_tokens) > INTROSPECTION_MAX_BATCH_SIZE:
+        raise BatchTooLargeError(INTROSPECTION_MAX_BATCH_SIZE)
+    return FastJSONResponse(get_auth_service().introspect(access_tokens))
@@ -1,4 +1,5 @@
 import uuid
+from typing import Optional
 
 from pydantic import BaseModel, Field
 
@@ -39,3 +40,29 @@ class AccessToken(BaseModel):
     """
 
     access_token: str
+
+
+class TokenIntrospectionRequest(BaseModel):
+    """
+    Класс для представления пакета токенов доступа на проверку.
+
+    Attributes:
+        access_tokens (list[str]): Токены доступа.
+    """
+
+    access_tokens: list[str]
+
+
+class TokenIntrospection(BaseModel):
+    """
+    Класс для представления результата проверки токена доступа.
+
+    Attributes:
+        active (bool): Действителен ли токен.
+        claims (Optional[dict]): Полезная нагрузка действительного токена.
+        error (Optional[str]): Причина отказа ('expired' или 'invalid').
+    """
+
+    active: bool = Field(False)
+    claims: Optional[dict] = Field(None)
+    error: Optional[str] = Field(None)
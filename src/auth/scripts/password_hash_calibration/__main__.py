@@ -0,0 +1,94 @@
+import os
+from types import MappingProxyType
+from typing import Final
+
+from passlib.exc import MissingBackendError
+
+from src.auth.configs.password_hash_config import (
+    PASSWORD_HASH_FILE_PATH,
+    PASSWORD_HASH_TARGET_VERIFY_MS,
+)
+from src.configs.logger_settings import logger
+
+from .hash_calibrators.argon2_hash_calibrator import Argon2HashCalibrator
+from .hash_calibrators.bcrypt_hash_calibrator import BcryptHashCalibrator
+from .hash_calibrators.hash_calibrator import IHashCalibrator
+from .password_hash_storage import save_password_hash_config
+
+_LABELS: Final = MappingProxyType(
+    {
+        'script': 'password_hash_calibration',
+    },
+)
+_MS_IN_SECOND: Final = 1000
+# bcrypt всегда остается в списке схем, чтобы проверять уже
+# сохраненные хеши и заменять их при следующем входе.
+_LEGACY_SCHEME: Final = 'bcrypt'
+
+CALIBRATORS: Final = (
+    Argon2HashCalibrator,
+    BcryptHashCalibrator,
+)
+
+
+def _selected_calibrators() -> list[IHashCalibrator]:
+    selected = os.environ.get(
+        'PASSWORD_HASH_SCHEMES',
+        default='argon2,bcrypt',
+    ).split(',')
+    calibrators: dict[str, IHashCalibrator] = {}
+    for calibrator_class in CALIBRATORS:
+        calibrator = calibrator_class()
+        calibrators[calibrator.scheme] = calibrator
+    return [
+        calibrators[scheme.strip()]
+        for scheme in selected
+        if scheme.strip() in calibrators
+    ]
+
+
+def _calibrate_and_save_config():
+    target_seconds = PASSWORD_HASH_TARGET_VERIFY_MS / _MS_IN_SECOND
+    schemes: list[str] = []
+    settings: dict[str, int] = {}
+
+    for calibrator in _selected_calibrators():
+        try:
+            scheme_settings = calibrator.calibrate(target_seconds)
+        except MissingBackendError:
+            logger.warning(
+                'Схема {0} недоступна и пропущена',
+                calibrator.scheme,
+                labels=_LABELS,
+            )
+            continue
+        logger.info(
+            'Параметры {0}: {1}',
+            calibrator.scheme,
+            scheme_settings,
+            labels=_LABELS,
+        )
+        schemes.append(calibrator.scheme)
+        settings.update(scheme_settings)
+
+    if _LEGACY_SCHEME not in schemes:
+        schemes.append(_LEGACY_SCHEME)
+
+    save_password_hash_config(PASSWORD_HASH_FILE_PATH, schemes, settings)
+
+
+def _main():
+    try:
+        _calibrate_and_save_config()
+    except Exception as ex:
+        logger.critical(
+            'You have done something wrong! {0}'.format(str(ex)),
+            labels=_LABELS,
+        )
+
+
+if __name__ == '__main__':
+    try:
+        _main()
+    except KeyboardInterrupt:
+        logger.critical('Shutting down, bye!')
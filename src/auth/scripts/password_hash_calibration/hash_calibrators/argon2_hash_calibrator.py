@@ -0,0 +1,103 @@
+from passlib.hash import argon2
+
+from .hash_calibrator import IHashCalibrator
+
+_KIB_IN_MIB = 1024
+
+
+class Argon2HashCalibrator(IHashCalibrator):
+    """
+    Калибратор параметров argon2.
+
+    Сначала при необходимости уменьшает объем памяти, пока одна итерация
+    не уложится в целевое время, затем увеличивает число итераций.
+
+    Args:
+        memory_cost_mib (int): Начальный объем памяти в МиБ.
+            По умолчанию: 64.
+        min_memory_cost_mib (int): Минимально допустимый объем памяти в МиБ.
+            По умолчанию: 8.
+        parallelism (int): Число потоков вычисления хеша.
+            По умолчанию: 2.
+        max_time_cost (int): Максимальное проверяемое число итераций.
+            По умолчанию: 10.
+    """
+
+    def __init__(  # noqa: WPS211
+        self,
+        memory_cost_mib: int = 64,
+        min_memory_cost_mib: int = 8,
+        parallelism: int = 2,
+        max_time_cost: int = 10,
+        samples: int = 3,
+    ):
+        """
+        Инициализирует калибратор argon2.
+
+        Args:
+            memory_cost_mib (int): Начальный объем памяти в МиБ.
+                По умолчанию: 64.
+            min_memory_cost_mib (int): Минимально допустимый объем памяти
+                в МиБ. По умолчанию: 8.
+            parallelism (int): Число потоков вычисления хеша.
+                По умолчанию: 2.
+            max_time_cost (int): Максимальное проверяемое число итераций.
+                По умолчанию: 10.
+            samples (int): Количество замеров для каждого набора параметров.
+                По умолчанию: 3.
+        """
+        super().__init__(samples)
+        self.memory_cost = memory_cost_mib * _KIB_IN_MIB
+        self.min_memory_cost = min_memory_cost_mib * _KIB_IN_MIB
+        self.parallelism = parallelism
+        self.max_time_cost = max_time_cost
+
+    @property
+    def scheme(self) -> str:
+        """
+        Название схемы хеширования в passlib.
+
+        Returns:
+            str: 'argon2'.
+        """
+        return 'argon2'
+
+    def calibrate(self, target_seconds: float) -> dict[str, int]:
+        """
+        Подбирает объем памяти и число итераций argon2.
+
+        Args:
+            target_seconds (float): Целевое время проверки в секундах.
+
+        Returns:
+            dict[str, int]: Параметры argon2 для CryptContext.
+        """
+        memory_cost = self._fit_memory_cost(target_seconds)
+        time_cost = 1
+        for candidate in range(2, self.max_time_cost + 1):
+            if self._verify_seconds(candidate, memory_cost) > target_seconds:
+                break
+            time_cost = candidate
+
+        return {
+            'argon2__rounds': time_cost,
+            'argon2__min_rounds': time_cost,
+            'argon2__memory_cost': memory_cost,
+            'argon2__parallelism': self.parallelism,
+        }
+
+    def _fit_memory_cost(self, target_seconds: float) -> int:
+        memory_cost = self.memory_cost
+        while memory_cost > self.min_memory_cost:
+            if self._verify_seconds(1, memory_cost) <= target_seconds:
+                break
+            memory_cost //= 2
+        return memory_cost
+
+    def _verify_seconds(self, time_cost: int, memory_cost: int) -> float:
+        hasher = argon2.using(
+            rounds=time_cost,
+            memory_cost=memory_cost,
+            parallelism=self.parallelism,
+        )
+        return self._measure_verify_seconds(hasher)
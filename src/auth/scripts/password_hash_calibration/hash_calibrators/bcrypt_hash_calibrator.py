@@ -0,0 +1,71 @@
+from passlib.hash import bcrypt
+
+from .hash_calibrator import IHashCalibrator
+
+
+class BcryptHashCalibrator(IHashCalibrator):
+    """
+    Калибратор числа раундов bcrypt.
+
+    Каждый следующий раунд удваивает время проверки, поэтому выбирается
+    наибольшее число раундов, при котором проверка не превышает цель.
+
+    Args:
+        min_rounds (int): Минимально допустимое число раундов.
+            По умолчанию: 10.
+        max_rounds (int): Максимальное проверяемое число раундов.
+            По умолчанию: 16.
+    """
+
+    def __init__(
+        self,
+        min_rounds: int = 10,
+        max_rounds: int = 16,
+        samples: int = 3,
+    ):
+        """
+        Инициализирует калибратор bcrypt.
+
+        Args:
+            min_rounds (int): Минимально допустимое число раундов.
+                По умолчанию: 10.
+            max_rounds (int): Максимальное проверяемое число раундов.
+                По умолчанию: 16.
+            samples (int): Количество замеров для каждого числа раундов.
+                По умолчанию: 3.
+        """
+        super().__init__(samples)
+        self.min_rounds = min_rounds
+        self.max_rounds = max_rounds
+
+    @property
+    def scheme(self) -> str:
+        """
+        Название схемы хеширования в passlib.
+
+        Returns:
+            str: 'bcrypt'.
+        """
+        return 'bcrypt'
+
+    def calibrate(self, target_seconds: float) -> dict[str, int]:
+        """
+        Подбирает число раундов bcrypt под целевое время проверки.
+
+        Args:
+            target_seconds (float): Целевое время проверки в секундах.
+
+        Returns:
+            dict[str, int]: Параметры bcrypt для CryptContext.
+        """
+        rounds = self.min_rounds
+        for candidate in range(self.min_rounds + 1, self.max_rounds + 1):
+            hasher = bcrypt.using(rounds=candidate)
+            if self._measure_verify_seconds(hasher) > target_seconds:
+                break
+            rounds = candidate
+
+        return {
+            'bcrypt__rounds': rounds,
+            'bcrypt__min_rounds': rounds,
+        }
@@ -0,0 +1,64 @@
+import abc
+import statistics
+import time
+
+_CALIBRATION_PASSWORD = 'calibration-password'  # noqa: S105
+
+
+class IHashCalibrator(abc.ABC):
+    """
+    Абстрактный базовый класс для калибровки стоимости хеширования паролей.
+
+    Калибратор подбирает параметры схемы так, чтобы проверка пароля
+    на текущем оборудовании укладывалась в заданное время.
+    """
+
+    def __init__(self, samples: int = 3):
+        """
+        Инициализирует калибратор.
+
+        Args:
+            samples (int): Количество замеров проверки для каждого набора
+                параметров. По умолчанию: 3.
+        """
+        self.samples = samples
+
+    @property
+    @abc.abstractmethod
+    def scheme(self) -> str:
+        """
+        Название схемы хеширования в passlib.
+
+        Returns:
+            str: Название схемы.
+        """
+
+    @abc.abstractmethod
+    def calibrate(self, target_seconds: float) -> dict[str, int]:
+        """
+        Подбирает параметры схемы под целевое время проверки пароля.
+
+        Args:
+            target_seconds (float): Целевое время проверки в секундах.
+
+        Returns:
+            dict[str, int]: Параметры CryptContext для схемы.
+        """
+
+    def _measure_verify_seconds(self, hasher) -> float:
+        """
+        Измеряет медианное время проверки пароля для обработчика passlib.
+
+        Args:
+            hasher: Обработчик passlib с установленными параметрами.
+
+        Returns:
+            float: Медианное время одной проверки в секундах.
+        """
+        password_hash = hasher.hash(_CALIBRATION_PASSWORD)
+        timings = []
+        for _ in range(self.samples):
+            started_at = time.perf_counter()
+            hasher.verify(_CALIBRATION_PASSWORD, password_hash)
+            timings.append(time.perf_counter() - started_at)
+        return statistics.median(timings)
@@ -0,0 +1,25 @@
+import yaml
+
+
+def save_password_hash_config(
+    filename: str,
+    schemes: list[str],
+    settings: dict[str, int],
+):
+    """
+    Сохраняет параметры хеширования паролей в файл в формате YAML.
+
+    Args:
+        filename (str): Путь к файлу, в который будут сохранены параметры.
+            По умолчанию: 'src/auth/configs/password_hash.yaml'.
+        schemes (list[str]): Схемы хеширования, первая из которых
+            используется для новых хешей.
+        settings (dict[str, int]): Параметры CryptContext
+            в формате passlib.
+    """
+    with open(filename, 'w') as file:  # noqa: WPS110
+        yaml.dump(
+            {'schemes': schemes, 'settings': settings},
+            file,
+            default_flow_style=False,
+        )
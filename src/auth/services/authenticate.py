@@ -7,10 +7,11 @@ from src.auth.dao.user import UserDAO
 from src.auth.models import UserModel
 from src.auth.schemas.refresh_session import RefreshSessionCreate
 from src.auth.schemas.tokens import Tokens
-from src.auth.schemas.user import UserAuth
+from src.auth.schemas.user import UserAuth, UserUpdateDB
 from src.auth.utils.exceptions import InvalidCredentialsError
 from src.auth.utils.password_manager import PasswordManager
 from src.auth.utils.tokens.token_manager import TokenManager
+from src.utils.tracing import traced
 
 
 class AuthenticateService:
@@ -50,6 +51,7 @@ class AuthenticateService:
         self._password_manager = password_manager
         self._refresh_token_expire_seconds = refresh_token_expire_seconds
 
+    @traced()
     async def authenticate(
         self,
         session: AsyncSession,
@@ -58,6 +60,9 @@ class AuthenticateService:
         """
         Аутентифицирует пользователя и возвращает токены.
 
+        Если пароль верный, а хеш создан с устаревшими параметрами,
+        хеш пересчитывается с текущими параметрами и сохраняется.
+
         Args:
             session (AsyncSession): Асинхронная сессия базы данных.
             user_auth (UserAuth): Данные аутентификации пользователя.
@@ -78,7 +83,7 @@ class AuthenticateService:
         if user is None:
             raise InvalidCredentialsError
 
-        conditions: bool = self._password_manager.compare(
+        conditions, new_pass_hash = self._password_manager.verify_and_update(
             user_auth.password,
             user.pass_hash,
         )
@@ -86,7 +91,17 @@ class AuthenticateService:
         if not conditions:
             raise InvalidCredentialsError
 
-        token: Tokens = self._token_manager.create_token(user.user_id)
+        if new_pass_hash is not None:
+            await UserDAO.update(
+                session,
+                UserModel.user_id == user.user_id,
+                obj_in=UserUpdateDB(pass_hash=new_pass_hash),
+            )
+
+        token: Tokens = self._token_manager.create_token(
+            user.user_id,
+            user.role.value,
+        )
         await RefreshSessionDAO.add(
             session,
             RefreshSessionCreate(
@@ -96,3 +111,12 @@ class AuthenticateService:
             ),
         )
         return token
+
+    async def warm_up(self, session: AsyncSession) -> None:
+        """
+        Выполняет запрос поиска пользователя с заведомо пустым результатом.
+
+        Args:
+            session (AsyncSession): Асинхронная сессия базы данных.
+        """
+        await UserDAO.find_one_or_none(session, login='')
@@ -6,6 +6,7 @@ from src.auth.dao.refresh_session import RefreshSessionDAO
 from src.auth.schemas.tokens import AccessToken, RefreshToken
 from src.auth.utils.exceptions import UnexpectedError
 from src.auth.utils.tokens.token_manager import TokenManager
+from src.utils.tracing import traced
 
 
 class LogoutService:
@@ -33,6 +34,7 @@ class LogoutService:
         """
         self._token_manager = token_manager
 
+    @traced()
     async def logout(
         self,
         session: AsyncSession,
@@ -57,6 +59,7 @@ class LogoutService:
         if count is None:
             raise UnexpectedError
 
+    @traced()
     async def logout_from_all_devices(
         self,
         session: AsyncSession,
@@ -1,3 +1,4 @@
+import uuid
 from typing import Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,6 +13,8 @@ from src.auth.utils.exceptions import (
     InvalidRefreshTokenError,
 )
 from src.auth.utils.tokens.token_manager import TokenManager
+from src.utils.stampede_cache import StampedeCache
+from src.utils.tracing import traced
 
 
 class RefreshService:
@@ -19,25 +22,34 @@ class RefreshService:
     Сервис обновления токенов доступа и обновления.
 
     Этот класс предоставляет метод для обновления токенов.
+    При обновлении роль пользователя берется из кеша ролей, который
+    перечитывает ее из базы данных, поэтому изменение роли попадает
+    в токены не позднее, чем через срок хранения роли в кеше
+    и время жизни одного токена доступа.
 
     Attributes:
         _token_manager (TokenManager): Менеджер токенов для создания и
         управления токенами.
+        _role_cache (StampedeCache): Кеш ролей пользователей.
     """
 
     def __init__(
         self,
         token_manager: TokenManager,
+        role_cache: StampedeCache,
     ):
         """
         Инициализирует экземпляр RefreshService.
 
         Args:
             token_manager (TokenManager): Менеджер токенов для
-                                создания и управления токенами.
+            создания и управления токенами.
+            role_cache (StampedeCache): Кеш ролей пользователей.
         """
         self._token_manager = token_manager
+        self._role_cache = role_cache
 
+    @traced()
     async def refresh(
         self,
         session: AsyncSession,
@@ -66,16 +78,16 @@ class RefreshService:
         if refresh_session is None:
             raise InvalidRefreshTokenError
 
-        user: Optional[UserModel] = await UserDAO.find_one_or_none(
+        # Фоновое обновление кеша выполняется после закрытия сессии,
+        # поэтому вычисление замыкает идентификатор, а не модель.
+        user_id = refresh_session.user_id
+        role: str = await self._role_cache.get_or_compute(
+            str(user_id),
+            lambda role_session: _read_role(role_session, user_id),
             session,
-            user_id=refresh_session.user_id,
         )
-        if user is None:
-            raise InvalidCredentialsError
 
-        token: Tokens = self._token_manager.create_token(
-            refresh_session.user_id,
-        )
+        token: Tokens = self._token_manager.create_token(user_id, role)
         await RefreshSessionDAO.update(
             session,
             RefreshSessionModel.token_id == refresh_session.token_id,
@@ -84,3 +96,28 @@ class RefreshService:
             ),
         )
         return token
+
+    async def warm_up(self, session: AsyncSession) -> None:
+        """
+        Выполняет запросы обновления токенов с заведомо пустым результатом.
+
+        Args:
+            session (AsyncSession): Асинхронная сессия базы данных.
+        """
+        await RefreshSessionDAO.find_one_or_none(
+            session,
+            refresh_token=uuid.uuid4(),
+        )
+        await UserDAO.find_one_or_none(session, user_id=uuid.uuid4())
+
+
+async def _read_role(session: AsyncSession, user_id: uuid.UUID) -> str:
+    # Отсутствие пользователя не кешируется: исключение прерывает
+    # вычисление, и следующий запрос снова читает базу данных.
+    user: Optional[UserModel] = await UserDAO.find_one_or_none(
+        session,
+        user_id=user_id,
+    )
+    if user is None:
+        raise InvalidCredentialsError
+    return user.role.value
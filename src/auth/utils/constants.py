@@ -6,3 +6,6 @@ LABELS_FOR_LOGGER: Final = MappingProxyType(
         'service': 'auth',
     },
 )
+
+ROLE_CLAIM: Final = 'role'
+PERMISSIONS_CLAIM: Final = 'perm'
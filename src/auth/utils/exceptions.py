@@ -166,3 +166,96 @@ class UnexpectedError(HTTPException):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail='хз че там',
         )
+
+
+class InsufficientPermissionsError(HTTPException):
+    """
+    Исключение, возникающее при недостатке прав у владельца токена.
+
+    Attributes:
+        status_code (int): HTTP-статус код ошибки (403).
+        detail (str): Детальное описание ошибки.
+    """
+
+    def __init__(self):
+        """
+        Инициализирует экземпляр исключения InsufficientPermissionsError.
+
+        Устанавливает HTTP-статус код 403 и детали ошибки.
+        """
+        super().__init__(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail='Недостаточно прав',
+        )
+
+
+class TooManyLoginAttemptsError(HTTPException):
+    """
+    Исключение, возникающее при превышении лимита попыток входа.
+
+    Attributes:
+        status_code (int): HTTP-статус код ошибки (429).
+        detail (str): Детальное описание ошибки.
+        headers (dict): Заголовок Retry-After с временем ожидания в секундах.
+    """
+
+    def __init__(self, retry_after: int):
+        """
+        Инициализирует экземпляр исключения TooManyLoginAttemptsError.
+
+        Устанавливает HTTP-статус код 429, детали ошибки
+        и заголовок Retry-After.
+
+        Args:
+            retry_after (int): Через сколько секунд можно повторить попытку.
+        """
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail='Слишком много попыток входа',
+            headers={'Retry-After': str(retry_after)},
+        )
+
+
+class InvalidInternalTokenError(HTTPException):
+    """
+    Исключение, возникающее при обращении к внутреннему эндпоинту без доступа.
+
+    Attributes:
+        status_code (int): HTTP-статус код ошибки (403).
+        detail (str): Детальное описание ошибки.
+    """
+
+    def __init__(self):
+        """
+        Инициализирует экземпляр исключения InvalidInternalTokenError.
+
+        Устанавливает HTTP-статус код 403 и детали ошибки.
+        """
+        super().__init__(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail='Недопустимый внутренний токен',
+        )
+
+
+class BatchTooLargeError(HTTPException):
+    """
+    Исключение, возникающее при превышении размера пакета в запросе.
+
+    Attributes:
+        status_code (int): HTTP-статус код ошибки (413).
+        detail (str): Детальное описание ошибки.
+    """
+
+    def __init__(self, max_batch_size: int):
+        """
+        Инициализирует экземпляр исключения BatchTooLargeError.
+
+        Устанавливает HTTP-статус код 413 и детали ошибки.
+
+        Args:
+            max_batch_size (int): Максимально допустимый размер пакета.
+        """
+        super().__init__(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f'Размер пакета превышает {max_batch_size}',
+        )
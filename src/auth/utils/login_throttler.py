@@ -0,0 +1,231 @@
+import math
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+from typing import Final, Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.auth.utils.constants import LABELS_FOR_LOGGER
+from src.auth.utils.exceptions import TooManyLoginAttemptsError
+from src.configs.logger_settings import logger
+from src.utils.metrics import AUTH_LOGIN_THROTTLE
+from src.utils.redis_client import REDIS_SCRIPTS, execute_pipeline
+
+_MS_IN_SECOND: Final = 1000
+
+# Проверяет все окна и только если ни одно не переполнено,
+# регистрирует попытку в каждом из них. Возвращает
+# {разрешено, индекс переполненного окна, миллисекунд до освобождения}.
+_SLIDING_WINDOW_SCRIPT: Final = """
+local now = tonumber(ARGV[1])
+local member = ARGV[2]
+for index, key in ipairs(KEYS) do
+    local window = tonumber(ARGV[1 + index * 2])
+    local limit = tonumber(ARGV[2 + index * 2])
+    redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+    if redis.call('ZCARD', key) >= limit then
+        local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+        return {0, index, tonumber(oldest[2]) + window - now}
+    end
+end
+for index, key in ipairs(KEYS) do
+    local window = tonumber(ARGV[1 + index * 2])
+    redis.call('ZADD', key, now, member)
+    redis.call('PEXPIRE', key, window)
+end
+return {1, 0, 0}
+"""
+_SLIDING_WINDOW: Final = REDIS_SCRIPTS.register(_SLIDING_WINDOW_SCRIPT)
+
+
+@dataclass(frozen=True)
+class SlidingWindowLimit:
+    """
+    Ограничение числа попыток в скользящем окне.
+
+    Attributes:
+        scope (str): Область ограничения ('login' или 'ip').
+        window_seconds (int): Размер окна в секундах.
+        max_attempts (int): Допустимое число попыток в окне.
+    """
+
+    scope: str
+    window_seconds: int
+    max_attempts: int
+
+
+class LoginThrottler:  # noqa: WPS214
+    """
+    Ограничитель частоты попыток входа на скользящих окнах в Redis.
+
+    Попытка проверяется и регистрируется одним Lua-скриптом до обращения
+    к базе данных и проверки хеша пароля, поэтому подбор паролей
+    не расходует процессорное время на bcrypt.
+    При недоступности Redis вход не блокируется. Результаты проверок
+    публикуются в метрике auth_login_throttle.
+
+    Attributes:
+        counters (dict[str, int]): Счетчики разрешенных и отклоненных
+        попыток, а также ошибок Redis.
+
+    Methods:
+        check: Проверяет лимиты и регистрирует попытку входа.
+        reset: Сбрасывает окно логина после успешного входа.
+        attempts: Возвращает текущее число попыток в окнах.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        login_limit: SlidingWindowLimit,
+        ip_limit: SlidingWindowLimit,
+        key_prefix: str = 'login_throttle',
+    ):
+        """
+        Инициализирует экземпляр LoginThrottler.
+
+        Args:
+            redis (Redis): Асинхронный клиент Redis.
+            login_limit (SlidingWindowLimit): Ограничение для логина.
+            ip_limit (SlidingWindowLimit): Ограничение для IP-адреса.
+            key_prefix (str): Префикс ключей Redis.
+        """
+        self._redis = redis
+        self._login_limit = login_limit
+        self._ip_limit = ip_limit
+        self._key_prefix = key_prefix
+        self._counters: Counter = Counter()
+
+    @property
+    def counters(self) -> dict[str, int]:
+        """
+        Возвращает снимок счетчиков ограничителя.
+
+        Returns:
+            dict[str, int]: Счетчики попыток по результатам проверки.
+        """
+        return dict(self._counters)
+
+    async def check(
+        self,
+        login: str,
+        client_ip: Optional[str] = None,
+    ) -> None:
+        """
+        Проверяет лимиты попыток входа и регистрирует новую попытку.
+
+        Args:
+            login (str): Логин, под которым выполняется вход.
+            client_ip (Optional[str]): IP-адрес клиента, если известен.
+
+        Raises:
+            TooManyLoginAttemptsError: Если превышен лимит попыток.
+        """
+        limits = self._limits(login, client_ip)
+        try:
+            allowed, blocked_index, retry_after_ms = await _SLIDING_WINDOW(
+                self._redis,
+                keys=[key for key, _ in limits],
+                args=self._script_args(limits),
+            )
+        except RedisError as ex:
+            self._on_redis_error('Ограничитель попыток входа недоступен', ex)
+            return
+
+        if allowed:
+            self._count('allowed')
+            return
+
+        self._reject(limits[blocked_index - 1][1], retry_after_ms)
+
+    async def reset(self, login: str) -> None:
+        """
+        Сбрасывает окно попыток для логина после успешного входа.
+
+        Args:
+            login (str): Логин пользователя.
+        """
+        try:
+            await self._redis.delete(self._key(self._login_limit, login))
+        except RedisError as ex:
+            self._on_redis_error('Не удалось сбросить окно попыток входа', ex)
+
+    async def attempts(  # noqa: WPS210
+        self,
+        login: str,
+        client_ip: Optional[str] = None,
+    ) -> dict[str, int]:
+        """
+        Возвращает текущее число попыток в окнах логина и IP-адреса.
+
+        Args:
+            login (str): Логин пользователя.
+            client_ip (Optional[str]): IP-адрес клиента.
+
+        Returns:
+            dict[str, int]: Число попыток по областям ограничения.
+        """
+        limits = self._limits(login, client_ip)
+        now_ms = int(time.time() * _MS_IN_SECOND)
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key, limit in limits:
+                pipe.zcount(
+                    key,
+                    now_ms - limit.window_seconds * _MS_IN_SECOND,
+                    '+inf',
+                )
+            counts = await execute_pipeline(pipe)
+        return {
+            window_limit.scope: count
+            for (_, window_limit), count in zip(limits, counts)
+        }
+
+    def _limits(
+        self,
+        login: str,
+        client_ip: Optional[str],
+    ) -> list[tuple[str, SlidingWindowLimit]]:
+        limits = [(self._key(self._login_limit, login), self._login_limit)]
+        if client_ip:
+            limits.append(
+                (self._key(self._ip_limit, client_ip), self._ip_limit),
+            )
+        return limits
+
+    def _script_args(
+        self,
+        limits: list[tuple[str, SlidingWindowLimit]],
+    ) -> list:
+        args = [int(time.time() * _MS_IN_SECOND), uuid.uuid4().hex]
+        for _, limit in limits:
+            args.append(limit.window_seconds * _MS_IN_SECOND)
+            args.append(limit.max_attempts)
+        return args
+
+    def _reject(
+        self,
+        limit: SlidingWindowLimit,
+        retry_after_ms: int,
+    ) -> None:
+        self._count(f'throttled_{limit.scope}')
+        logger.info(
+            f'Превышен лимит попыток входа. scope = {limit.scope}',
+            labels=LABELS_FOR_LOGGER,
+        )
+        raise TooManyLoginAttemptsError(
+            max(1, math.ceil(retry_after_ms / _MS_IN_SECOND)),
+        )
+
+    def _on_redis_error(self, message: str, ex: RedisError) -> None:
+        self._count('redis_errors')
+        logger.warning('{0}: {1}', message, ex, labels=LABELS_FOR_LOGGER)
+
+    def _count(self, outcome: str) -> None:
+        self._counters[outcome] += 1
+        AUTH_LOGIN_THROTTLE.labels(outcome).inc()
+
+    def _key(self, limit: SlidingWindowLimit, identity: str) -> str:
+        return f'{self._key_prefix}:{limit.scope}:{identity.lower()}'
@@ -2,6 +2,12 @@ from typing import Optional
 
 from passlib.context import CryptContext
 
+from src.auth.configs.password_hash_config import (
+    PASSWORD_HASH_SCHEMES,
+    PASSWORD_HASH_SETTINGS,
+)
+from src.utils.tracing import traced
+
 
 class PasswordManager:
     """
@@ -11,17 +17,22 @@ class PasswordManager:
 
     Attributes:
         _default_crypt_context (CryptContext): Контекст шифрования
-        по умолчанию, использующий схему 'bcrypt'
+        по умолчанию. Схемы и стоимость хеширования берутся из файла,
+        созданного скриптом password_hash_calibration.
 
     Methods:
         is_valid_password: Проверяет, соответствует ли открытый пароль
         хешированному паролю.
         get_password_hash: Генерирует хеш открытого пароля.
+        verify_and_update: Проверяет пароль и при необходимости
+        возвращает хеш с актуальными параметрами.
+        needs_update: Проверяет, устарели ли параметры хеша.
     """
 
     _default_crypt_context = CryptContext(
-        schemes=['bcrypt'],
+        schemes=PASSWORD_HASH_SCHEMES,
         deprecated='auto',
+        **PASSWORD_HASH_SETTINGS,
     )
 
     def __init__(
@@ -38,6 +49,7 @@ class PasswordManager:
         """
         self.crypt_context = crypt_context or self._default_crypt_context
 
+    @traced()
     def compare(
         self,
         plain_password: str,
@@ -60,6 +72,7 @@ class PasswordManager:
             hashed_password,
         )
 
+    @traced()
     def hash(
         self,
         password: str,
@@ -74,3 +87,42 @@ class PasswordManager:
             str: Хеш открытого пароля.
         """
         return self.crypt_context.hash(password)
+
+    @traced()
+    def verify_and_update(
+        self,
+        plain_password: str,
+        hashed_password: str,
+    ) -> tuple[bool, Optional[str]]:
+        """
+        Проверяет пароль и пересчитывает хеш с устаревшими параметрами.
+
+        Args:
+            plain_password (str): Открытый пароль, который нужно проверить.
+            hashed_password (str): Хешированный пароль, с которым нужно
+            сравнить открытый пароль.
+
+        Returns:
+            tuple[bool, Optional[str]]: Результат проверки и новый хеш,
+            если пароль верный, а сохраненный хеш создан устаревшей схемой
+            или с устаревшей стоимостью, иначе None.
+        """
+        return self.crypt_context.verify_and_update(
+            plain_password,
+            hashed_password,
+        )
+
+    def needs_update(
+        self,
+        hashed_password: str,
+    ) -> bool:
+        """
+        Проверяет, создан ли хеш с устаревшими параметрами.
+
+        Args:
+            hashed_password (str): Хешированный пароль.
+
+        Returns:
+            bool: True, если хеш нужно пересчитать.
+        """
+        return self.crypt_context.needs_update(hashed_password)
@@ -0,0 +1,79 @@
+import enum
+from types import MappingProxyType
+from typing import Final, Optional
+
+from src.auth.utils.constants import PERMISSIONS_CLAIM
+
+
+class Permissions(enum.IntFlag):
+    """
+    Набор прав пользователя в виде битовой маски.
+
+    Маска кодируется в токене доступа одним целым числом, поэтому
+    проверка прав не требует обращения к таблице пользователей.
+    Новые права добавляются следующими свободными битами.
+
+    Attributes:
+        none: Отсутствие прав.
+        read: Чтение данных.
+        write: Запись и редактирование данных.
+        manage_users: Управление пользователями и служебными функциями.
+    """
+
+    none = 0
+    read = 1
+    write = 2
+    manage_users = 4
+
+
+ROLE_PERMISSIONS: Final = MappingProxyType(
+    {
+        'reader': Permissions.read,
+        'writer': Permissions.read | Permissions.write,
+        'admin': (
+            Permissions.read |
+            Permissions.write |
+            Permissions.manage_users
+        ),
+    },
+)
+
+
+def permissions_for_role(role: Optional[str]) -> Permissions:
+    """
+    Возвращает набор прав, соответствующий роли пользователя.
+
+    Args:
+        role (Optional[str]): Значение роли пользователя (UserRoles.value).
+
+    Returns:
+        Permissions: Права роли или Permissions.none для неизвестной роли.
+    """
+    return ROLE_PERMISSIONS.get(role, Permissions.none)
+
+
+def permissions_from_claims(payload: dict) -> Permissions:
+    """
+    Извлекает набор прав из полезной нагрузки токена доступа.
+
+    Args:
+        payload (dict): Полезная нагрузка проверенного токена доступа.
+
+    Returns:
+        Permissions: Права, закодированные в токене.
+    """
+    return Permissions(int(payload.get(PERMISSIONS_CLAIM, 0)))
+
+
+def has_permissions(payload: dict, required: Permissions) -> bool:
+    """
+    Проверяет, содержит ли токен все требуемые права.
+
+    Args:
+        payload (dict): Полезная нагрузка проверенного токена доступа.
+        required (Permissions): Требуемые права.
+
+    Returns:
+        bool: True, если все требуемые права присутствуют в токене.
+    """
+    return permissions_from_claims(payload) & required == required
@@ -1,30 +1,47 @@
-from typing import Union
+import hashlib
+import time
+from functools import lru_cache
+from typing import Iterable, Optional, Union
 
-from jose import jwt
+from jose import jwk, jwt
+from jose.exceptions import JOSEError
 
+from src.auth.schemas.tokens import TokenIntrospection
 from src.auth.utils.constants import LABELS_FOR_LOGGER
 from src.auth.utils.exceptions import (
     InvalidAccessTokenError,
     TokenExpiredError,
 )
 from src.configs.logger_settings import logger
+from src.utils.metrics import AUTH_TOKEN_FAILURES
 
+_DEFAULT_CACHE_SIZE = 4096
+_EXPIRED_ERROR = 'expired'
+_INVALID_ERROR = 'invalid'
+_FINGERPRINT_LENGTH = 12
 
-class AccessTokenDecoder:
+
+class AccessTokenDecoder:  # noqa: WPS214
     """
     Класс для декодирования JWT-токенов доступа.
 
+    Объект ключа проверки строится один раз, а результаты проверки
+    подписи кешируются по строке токена. Срок действия токена,
+    найденного в кеше, проверяется при каждом обращении.
+
     Methods:
         verification_key (property): Возвращает текущий ключ проверки.
         verification_key (setter): Устанавливает новый ключ проверки.
         decode_token: Декодирует токен доступа и возвращает
         его полезную нагрузку.
+        decode_tokens: Проверяет пакет токенов доступа за один вызов.
     """
 
     def __init__(
         self,
         verification_key: Union[dict, str],
         algorithm_name: str,
+        cache_size: int = _DEFAULT_CACHE_SIZE,
     ):
         """
         Инициализация объекта AccessTokenDecoder.
@@ -33,9 +50,15 @@ class AccessTokenDecoder:
             verification_key (Union[dict, str]): Ключ для проверки
             подлинности токена.
             algorithm_name (str): Название алгоритма, подписывающего токены.
+            cache_size (int): Количество проверенных токенов,
+            хранимых в кеше. 0 отключает кеш.
         """
         self._verification_key = verification_key
         self._algorithm_name = algorithm_name
+        self._key_object: Optional[jwk.Key] = None
+        self._verify_signature = lru_cache(maxsize=cache_size)(
+            self._decode_payload,
+        )
 
     @property
     def verification_key(self) -> Union[dict, str]:
@@ -61,6 +84,8 @@ class AccessTokenDecoder:
         if not isinstance(verification_key, Union[dict, str]):
             raise ValueError('Ключ проверки должен словарем')
         self._verification_key = verification_key
+        self._key_object = None
+        self._verify_signature.cache_clear()
 
     def decode_token(
         self,
@@ -80,28 +105,95 @@ class AccessTokenDecoder:
             InvalidAccessTokenError: Если токен недействителен.
         """
         try:
-            decoded_payload = jwt.decode(
-                access_token,
-                self._verification_key,
-                algorithms=self._algorithm_name,
-            )
+            decoded_payload = self._decode(access_token)
         except jwt.ExpiredSignatureError:
+            AUTH_TOKEN_FAILURES.labels(_EXPIRED_ERROR).inc()
             logger.info(
-                (
-                    'Cрок действия токена доступа истек.'
-                    f'access_token = {access_token}'
-                ),
+                'Cрок действия токена доступа истек. token_sha256 = {0}',
+                _fingerprint(access_token),
                 labels=LABELS_FOR_LOGGER,
             )
             raise TokenExpiredError
-        except jwt.JWTError:
+        except JOSEError:
+            AUTH_TOKEN_FAILURES.labels(_INVALID_ERROR).inc()
             logger.info(
-                (
-                    'Неверный токен доступа.'
-                    f'access_token = {access_token}'
-                ),
+                'Неверный токен доступа. token_sha256 = {0}',
+                _fingerprint(access_token),
                 labels=LABELS_FOR_LOGGER,
             )
             raise InvalidAccessTokenError
 
         return decoded_payload
+
+    def decode_tokens(
+        self,
+        access_tokens: Iterable[str],
+    ) -> list[TokenIntrospection]:
+        """
+        Проверяет пакет токенов доступа за один вызов.
+
+        В отличие от decode_token, не логирует каждый недействительный
+        токен и не прерывается на первой ошибке.
+
+        Args:
+            access_tokens (Iterable[str]): Токены доступа для проверки.
+
+        Returns:
+            list[TokenIntrospection]: Результаты проверки в порядке токенов.
+        """
+        introspections = []
+        for access_token in access_tokens:
+            try:
+                claims = self._decode(access_token)
+            except jwt.ExpiredSignatureError:
+                introspection = TokenIntrospection(error=_EXPIRED_ERROR)
+            except JOSEError:
+                introspection = TokenIntrospection(error=_INVALID_ERROR)
+            else:
+                introspection = TokenIntrospection(active=True, claims=claims)
+            introspections.append(introspection)
+        return introspections
+
+    def _decode(self, access_token: str) -> dict:
+        """
+        Проверяет токен с использованием кеша проверенных подписей.
+
+        Args:
+            access_token (str): Токен доступа.
+
+        Returns:
+            dict: Копия полезной нагрузки токена.
+
+        Raises:
+            ExpiredSignatureError: Если срок действия токена истек.
+        """
+        payload = self._verify_signature(access_token)
+        expires_at = payload.get('exp')
+        if expires_at is not None and int(expires_at) <= time.time():
+            raise jwt.ExpiredSignatureError('Signature has expired.')
+        return dict(payload)
+
+    def _decode_payload(self, access_token: str) -> dict:
+        return jwt.decode(
+            access_token,
+            self._get_key_object(),
+            algorithms=self._algorithm_name,
+        )
+
+    def _get_key_object(self) -> Union[jwk.Key, dict, str]:
+        if self._key_object is None:
+            try:
+                self._key_object = jwk.construct(
+                    self._verification_key,
+                    self._algorithm_name,
+                )
+            except JOSEError:
+                return self._verification_key
+        return self._key_object
+
+
+def _fingerprint(access_token: str) -> str:
+    # В лог попадает префикс хеша: по нему можно сопоставить записи
+    # одного токена, но нельзя восстановить сам токен.
+    digest = hashlib.sha256(access_token.encode())
+    return digest.hexdigest()[:_FINGERPRINT_LENGTH]
@@ -1,16 +1,21 @@
 import uuid
 from datetime import datetime, timedelta, timezone
-from typing import Union
+from typing import Optional, Union
 
-from jose import jwt
+from jose import jwk, jwt
+from jose.exceptions import JOSEError
 
 from src.auth.schemas.tokens import Tokens
+from src.auth.utils.constants import PERMISSIONS_CLAIM, ROLE_CLAIM
+from src.auth.utils.permissions import permissions_for_role
 
 
 class TokenFactory:
     """
     Класс для создания токенов доступа и обновления.
 
+    Объект ключа подписи строится один раз при первом создании токена.
+
     Methods:
         secret_key (property): Возвращает текущий секретный ключ.
         secret_key (setter): Устанавливает новый секретный ключ.
@@ -37,6 +42,7 @@ class TokenFactory:
         self._access_token_expire_seconds = access_token_expire_seconds
         self._secret_key = secret_key
         self._algorithm_name = algorithm_name
+        self._key_object: Optional[jwk.Key] = None
 
     @property
     def secret_key(self) -> Union[dict, str]:
@@ -62,10 +68,12 @@ class TokenFactory:
         if not isinstance(secret_key, Union[dict, str]):
             raise ValueError('Секретный ключ должен быть словарем')
         self._secret_key = secret_key
+        self._key_object = None
 
     def create_token(
         self,
         user_id: uuid.UUID,
+        role: Optional[str] = None,
     ) -> Tokens:
         """
         Создает и возвращает токены доступа и обновления для пользователя.
@@ -73,12 +81,15 @@ class TokenFactory:
         Args:
             user_id (int): ID пользователя, для которого создается
             токен подтверждения доступа.
+            role (Optional[str]): Роль пользователя (UserRoles.value).
+            Если указана, роль и права кодируются в токене доступа.
 
         Returns:
             Tokens: Объект Token, содержащий токены доступа и обновления.
         """
         access_token = self._create_access_token(
             user_id=user_id,
+            role=role,
         )
         refresh_token = self._create_refresh_token()
 
@@ -90,6 +101,7 @@ class TokenFactory:
     def _create_access_token(
         self,
         user_id: uuid.UUID,
+        role: Optional[str] = None,
     ) -> str:
         """
         Создает токен доступа для указанного пользователя.
@@ -97,6 +109,8 @@ class TokenFactory:
         Args:
             user_id (int): ID пользователя, для которого создается
             токен подтверждения доступа.
+            role (Optional[str]): Роль пользователя. Кодируется в токене
+            вместе с битовой маской прав.
 
         Returns:
             str: Сгенерированный токен доступа.
@@ -109,9 +123,12 @@ class TokenFactory:
             'iat': created_at,
             'exp': exp,
         }
+        if role is not None:
+            token_data[ROLE_CLAIM] = role
+            token_data[PERMISSIONS_CLAIM] = int(permissions_for_role(role))
         return jwt.encode(
             token_data,
-            key=self._secret_key,
+            key=self._get_key_object(),
             algorithm=self._algorithm_name,
         )
 
@@ -123,3 +140,14 @@ class TokenFactory:
             UUID: Уникальный идентификатор токена обновления.
         """
         return uuid.uuid4()
+
+    def _get_key_object(self) -> Union[jwk.Key, dict, str]:
+        if self._key_object is None:
+            try:
+                self._key_object = jwk.construct(
+                    self._secret_key,
+                    self._algorithm_name,
+                )
+            except JOSEError:
+                return self._secret_key
+        return self._key_object
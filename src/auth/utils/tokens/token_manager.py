@@ -1,13 +1,18 @@
 import uuid
-from typing import Optional, Union
+from typing import Iterable, Optional, Union
 
 from src.auth.models import RefreshSessionModel
-from src.auth.schemas.tokens import Tokens
+from src.auth.schemas.tokens import TokenIntrospection, Tokens
+from src.auth.utils.constants import LABELS_FOR_LOGGER
+from src.auth.utils.exceptions import InsufficientPermissionsError
+from src.auth.utils.permissions import Permissions, has_permissions
 from src.auth.utils.tokens.access_token_decoder import AccessTokenDecoder
 from src.auth.utils.tokens.refresh_session_validator import (
     RefreshSessionValidator,
 )
 from src.auth.utils.tokens.token_factory import TokenFactory
+from src.configs.logger_settings import logger
+from src.utils.tracing import traced
 
 
 class TokenManager:  # noqa: WPS214
@@ -30,14 +35,19 @@ class TokenManager:  # noqa: WPS214
         refresh: Обновляет токены доступа и обновления.
         decode_token: Декодирует токен доступа и возвращает
         его полезную нагрузку.
+        authorize: Проверяет токен доступа и наличие в нем
+        требуемых прав.
+        decode_tokens: Проверяет пакет токенов доступа.
+        warm_up: Строит объекты ключей подписи и проверки.
     """
 
-    def __init__(
+    def __init__(  # noqa: WPS211
         self,
         access_token_expire_seconds: int,
         algorithm_name: str,
         secret_key: Union[dict, str],
         verification_key: Optional[Union[dict, str]],
+        access_token_cache_size: int = 4096,
     ):
         """
         Инициализация класса TokenFacade.
@@ -49,6 +59,8 @@ class TokenManager:  # noqa: WPS214
             для подписи токенов.
             verification_key (Optional[bytes]): Ключ для проверки подписи
             токенов. Если не указан, используется secret_key.
+            access_token_cache_size (int): Размер кеша проверенных
+            токенов доступа.
         """
         verification_key = verification_key if (
             verification_key is not None
@@ -63,6 +75,7 @@ class TokenManager:  # noqa: WPS214
         self._access_token_decoder = AccessTokenDecoder(
             verification_key,
             algorithm_name,
+            access_token_cache_size,
         )
 
     @property
@@ -115,22 +128,30 @@ class TokenManager:  # noqa: WPS214
             raise ValueError('Ключ проверки должен быть строкой или словарём')
         self._access_token_decoder.verification_key = verification_key
 
-    def create_token(self, user_id: uuid.UUID) -> Tokens:
+    @traced()
+    def create_token(
+        self,
+        user_id: uuid.UUID,
+        role: Optional[str] = None,
+    ) -> Tokens:
         """
         Создает токены доступа и обновления для указанного пользователя.
 
         Args:
             user_id (uuid.UUID): ID пользователя, для которого создаются токены.
+            role (Optional[str]): Роль пользователя, кодируемая в токене.
 
         Returns:
             Tokens: Объект, содержащий токены доступа и обновления.
         """
-        return self._token_factory.create_token(user_id)
+        return self._token_factory.create_token(user_id, role)
 
+    @traced()
     def refresh(
         self,
         refresh_session: RefreshSessionModel,
         user_id: uuid.UUID,
+        role: Optional[str] = None,
     ) -> Tokens:
         """
         Обновляет токены доступа и обновления.
@@ -139,6 +160,7 @@ class TokenManager:  # noqa: WPS214
             refresh_session (RefreshSessionModel): Объект обновления сессии.
             user_id (uuid.UUID): ID пользователя, для которого обновляются
             токены.
+            role (Optional[str]): Актуальная роль пользователя.
 
         Returns:
             Tokens: Объект, содержащий новые токены доступа и обновления.
@@ -147,8 +169,9 @@ class TokenManager:  # noqa: WPS214
             refresh_session,
             user_id,
         )
-        return self.create_token(user_id)
+        return self.create_token(user_id, role)
 
+    @traced()
     def decode_token(self, access_token: str) -> dict:
         """
         Декодирует токен доступа и возвращает его полезную нагрузку.
@@ -164,3 +187,62 @@ class TokenManager:  # noqa: WPS214
             InvalidAccessTokenError: Если токен недействителен.
         """
         return self._access_token_decoder.decode_token(access_token)
+
+    def decode_tokens(
+        self,
+        access_tokens: Iterable[str],
+    ) -> list[TokenIntrospection]:
+        """
+        Проверяет пакет токенов доступа за один вызов.
+
+        Args:
+            access_tokens (Iterable[str]): Токены доступа для проверки.
+
+        Returns:
+            list[TokenIntrospection]: Результаты проверки в порядке токенов.
+        """
+        return self._access_token_decoder.decode_tokens(access_tokens)
+
+    @traced()
+    def authorize(
+        self,
+        access_token: str,
+        required: Permissions,
+    ) -> dict:
+        """
+        Проверяет токен доступа и наличие в нем требуемых прав.
+
+        Проверка выполняется только по подписанным утверждениям токена,
+        без обращения к базе данных.
+
+        Args:
+            access_token (str): Токен доступа.
+            required (Permissions): Требуемые права.
+
+        Returns:
+            dict: Полезная нагрузка токена в виде словаря.
+
+        Raises:
+            InsufficientPermissionsError: Если в токене нет требуемых прав.
+        """
+        payload: dict = self.decode_token(access_token)
+        if not has_permissions(payload, required):
+            user_id = payload.get('sub')
+            logger.info(
+                'Недостаточно прав. user_id = {0}, required = {1!r}',
+                user_id,
+                required,
+                labels=LABELS_FOR_LOGGER,
+            )
+            raise InsufficientPermissionsError
+        return payload
+
+    def warm_up(self) -> None:
+        """
+        Строит объекты ключей подписи и проверки.
+
+        Создает и проверяет токен для случайного пользователя,
+        чтобы первый запрос не тратил время на разбор ключей.
+        """
+        tokens = self._token_factory.create_token(uuid.uuid4())
+        self._access_token_decoder.decode_token(tokens.access_token)
@@ -0,0 +1,19 @@
+import os
+from typing import Final
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Чем больше beta, тем раньше истечения начинается досрочное обновление.
+CACHE_XFETCH_BETA: Final = float(os.environ.get('CACHE_XFETCH_BETA', '1'))
+# Сколько секунд после истечения устаревшее значение еще отдается,
+# пока оно обновляется в фоне.
+CACHE_STALE_SECONDS: Final = float(os.environ.get('CACHE_STALE_SECONDS', '60'))
+# Срок блокировки пересчета ключа; за это время пересчет должен завершиться.
+CACHE_LOCK_TIMEOUT_SECONDS: Final = float(
+    os.environ.get('CACHE_LOCK_TIMEOUT_SECONDS', '5'),
+)
+CACHE_LOCK_POLL_SECONDS: Final = float(
+    os.environ.get('CACHE_LOCK_POLL_SECONDS', '0.05'),
+)
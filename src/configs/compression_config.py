@@ -0,0 +1,67 @@
+import os
+from types import MappingProxyType
+from typing import Final, Mapping
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+_DEFAULT_CONTENT_TYPES: Final = ','.join((
+    'application/json',
+    'application/x-ndjson',
+    'application/xml',
+    'application/javascript',
+    'image/svg+xml',
+    'text/',
+))
+
+
+def _parse_content_types(
+    raw_content_types: str,
+    default_min_size: int,
+) -> Mapping[str, int]:
+    """
+    Разбирает правила сжатия по типам содержимого.
+
+    Args:
+        raw_content_types (str): Строка вида 'application/json,text/=512'.
+        Число после '=' задает минимальный размер для этого типа.
+        default_min_size (int): Минимальный размер для типов без числа.
+
+    Returns:
+        Mapping[str, int]: Минимальный размер тела для префикса типа.
+    """
+    rules = {}
+    for rule in filter(None, raw_content_types.split(',')):
+        content_type, _, min_size = rule.partition('=')
+        rules[content_type.strip()] = (
+            int(min_size) if min_size else default_min_size
+        )
+    return MappingProxyType(rules)
+
+
+# Ответы меньше этого размера отправляются без сжатия:
+# заголовки и задержка сжатия не окупаются.
+COMPRESSION_MIN_SIZE: Final = int(
+    os.environ.get('COMPRESSION_MIN_SIZE', '1024'),
+)
+COMPRESSION_CONTENT_TYPES: Final = _parse_content_types(
+    os.environ.get('COMPRESSION_CONTENT_TYPES', _DEFAULT_CONTENT_TYPES),
+    COMPRESSION_MIN_SIZE,
+)
+# Порядок предпочтения сервера среди кодировок, принимаемых клиентом.
+COMPRESSION_ENCODINGS: Final = tuple(
+    map(
+        str.strip,
+        os.environ.get('COMPRESSION_ENCODINGS', 'zstd,br,gzip').split(','),
+    ),
+)
+COMPRESSION_GZIP_LEVEL: Final = int(
+    os.environ.get('COMPRESSION_GZIP_LEVEL', '5'),
+)
+COMPRESSION_BROTLI_QUALITY: Final = int(
+    os.environ.get('COMPRESSION_BROTLI_QUALITY', '4'),
+)
+COMPRESSION_ZSTD_LEVEL: Final = int(
+    os.environ.get('COMPRESSION_ZSTD_LEVEL', '3'),
+)
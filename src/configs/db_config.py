@@ -20,6 +20,27 @@ ASYNC_POSTGRES_URL: Final = (
     '{POSTGRES_DB}'.format(POSTGRES_DB=POSTGRES_DB)
 )
 
+DB_POOL_SIZE: Final = int(os.environ.get('DB_POOL_SIZE', '5'))
+DB_MAX_OVERFLOW: Final = int(os.environ.get('DB_MAX_OVERFLOW', '10'))
+# statement_timeout каждого соединения. Запросы со сроком длиннее
+# этого значения прерываются сервером по нему, поэтому для маршрутов
+# с длинными сроками его нужно увеличить.
+DB_STATEMENT_TIMEOUT_MS: Final = int(
+    os.environ.get('DB_STATEMENT_TIMEOUT_MS', '10000'),
+)
 
 REDIS_HOST: Final = os.environ.get('REDIS_HOST')
 REDIS_PORT: Final = os.environ.get('REDIS_PORT')
+REDIS_DB: Final = int(os.environ.get('REDIS_DB', '0'))
+REDIS_MAX_CONNECTIONS: Final = int(
+    os.environ.get('REDIS_MAX_CONNECTIONS', '50'),
+)
+# Сколько ждать свободного соединения, когда пул исчерпан.
+REDIS_POOL_TIMEOUT_SECONDS: Final = float(
+    os.environ.get('REDIS_POOL_TIMEOUT_SECONDS', '1'),
+)
+REDIS_SOCKET_TIMEOUT_SECONDS: Final = float(
+    os.environ.get('REDIS_SOCKET_TIMEOUT_SECONDS', '1'),
+)
+# Сколько ключей отправляется одной командой или одним пакетом конвейера.
+REDIS_BATCH_SIZE: Final = int(os.environ.get('REDIS_BATCH_SIZE', '500'))
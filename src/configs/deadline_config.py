@@ -0,0 +1,44 @@
+import os
+from types import MappingProxyType
+from typing import Final, Mapping
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+_MS_IN_SECOND: Final = 1000
+
+
+def _parse_route_timeouts(raw_route_timeouts: str) -> Mapping[str, float]:
+    """
+    Разбирает сроки обработки по префиксам путей.
+
+    Args:
+        raw_route_timeouts (str): Строка вида '/reports=60000,/auth=2000'
+        со сроками в миллисекундах.
+
+    Returns:
+        Mapping[str, float]: Срок в секундах для каждого префикса пути.
+    """
+    route_timeouts = {}
+    for rule in filter(None, raw_route_timeouts.split(',')):
+        prefix, timeout_ms = rule.rsplit('=', 1)
+        route_timeouts[prefix.strip()] = float(timeout_ms) / _MS_IN_SECOND
+    return MappingProxyType(route_timeouts)
+
+
+# Заголовок, в котором клиент передает срок ожидания ответа в мс.
+REQUEST_TIMEOUT_HEADER: Final = os.environ.get(
+    'REQUEST_TIMEOUT_HEADER',
+    'X-Request-Timeout-Ms',
+).lower()
+REQUEST_DEFAULT_TIMEOUT_SECONDS: Final = float(
+    os.environ.get('REQUEST_DEFAULT_TIMEOUT_MS', '30000'),
+) / _MS_IN_SECOND
+# Срок из заголовка не может превышать этого значения.
+REQUEST_MAX_TIMEOUT_SECONDS: Final = float(
+    os.environ.get('REQUEST_MAX_TIMEOUT_MS', '120000'),
+) / _MS_IN_SECOND
+REQUEST_ROUTE_TIMEOUTS: Final = _parse_route_timeouts(
+    os.environ.get('REQUEST_ROUTE_TIMEOUTS', ''),
+)
@@ -0,0 +1,69 @@
+import os
+from types import MappingProxyType
+from typing import Final, Mapping
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+_DEFAULT_ROUTE_CLASSES: Final = '/internal/introspect=critical'
+_DEFAULT_EXCLUDED_PATHS: Final = '/metrics,/health'
+
+
+def _parse_route_classes(raw_route_classes: str) -> Mapping[str, str]:
+    """
+    Разбирает классы маршрутов по префиксам путей.
+
+    Args:
+        raw_route_classes (str): Строка вида '/auth/refresh=critical'.
+
+    Returns:
+        Mapping[str, str]: Класс для каждого префикса пути.
+    """
+    route_classes = {}
+    for rule in filter(None, raw_route_classes.split(',')):
+        prefix, route_class = rule.rsplit('=', 1)
+        route_classes[prefix.strip()] = route_class.strip()
+    return MappingProxyType(route_classes)
+
+
+# Ограничение включается явно, после подбора лимитов под нагрузку.
+LOAD_SHEDDING_ENABLED: Final = os.environ.get(
+    'LOAD_SHEDDING_ENABLED',
+    'false',
+).lower() == 'true'
+LOAD_SHEDDING_MIN_LIMIT: Final = int(
+    os.environ.get('LOAD_SHEDDING_MIN_LIMIT', '2'),
+)
+LOAD_SHEDDING_MAX_LIMIT: Final = int(
+    os.environ.get('LOAD_SHEDDING_MAX_LIMIT', '200'),
+)
+# По умолчанию лимит начинается с максимума и снижается, только когда
+# задержка превышает целевую: свежий процесс не отклоняет запросы,
+# пока лимит не подстроился.
+LOAD_SHEDDING_INITIAL_LIMIT: Final = int(
+    os.environ.get(
+        'LOAD_SHEDDING_INITIAL_LIMIT',
+        str(LOAD_SHEDDING_MAX_LIMIT),
+    ),
+)
+# Если ответ начинается позже, лимит уменьшается.
+LOAD_SHEDDING_TARGET_LATENCY_SECONDS: Final = float(
+    os.environ.get('LOAD_SHEDDING_TARGET_LATENCY_MS', '250'),
+) / 1000
+LOAD_SHEDDING_RETRY_AFTER_SECONDS: Final = int(
+    os.environ.get('LOAD_SHEDDING_RETRY_AFTER_SECONDS', '1'),
+)
+# Незаданные маршруты: GET относится к bulk, остальные - к default.
+LOAD_SHEDDING_ROUTE_CLASSES: Final = _parse_route_classes(
+    os.environ.get('LOAD_SHEDDING_ROUTE_CLASSES', _DEFAULT_ROUTE_CLASSES),
+)
+LOAD_SHEDDING_EXCLUDED_PATHS: Final = tuple(
+    filter(
+        None,
+        os.environ.get(
+            'LOAD_SHEDDING_EXCLUDED_PATHS',
+            _DEFAULT_EXCLUDED_PATHS,
+        ).split(','),
+    ),
+)
@@ -1,9 +1,10 @@
 # flake8: noqa: WPS300
 
 __all__ = (
+    'AccessLogTimingMiddleware',
     'logger',
     'setup_uvicorn_logger',
 )
 
 from .logger_config import logger
-from .uvicorn_logger import setup_uvicorn_logger
+from .uvicorn_logger import AccessLogTimingMiddleware, setup_uvicorn_logger
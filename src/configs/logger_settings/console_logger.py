@@ -1,5 +1,12 @@
+import atexit
+import os
+import queue
 import sys
-from typing import Final
+import threading
+import traceback
+from typing import Any, Final, Mapping, Optional
+
+import orjson
 
 _LOGGER_FORMAT: Final = (
     '{time:YYYY-MM-DD HH:mm:ss.SSS}' +
@@ -7,13 +14,162 @@ _LOGGER_FORMAT: Final = (
     ' <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan>' +
     ' - <level>{message}</level>'
 )
+_CONSOLE_MAX_QUEUE_SIZE: Final = int(
+    os.getenv('CONSOLE_LOG_MAX_QUEUE_SIZE', '10000'),
+)
+_CONSOLE_WRITE_BATCH_SIZE: Final = 256
+_CLOSE_TIMEOUT_SECONDS: Final = 5
+_STOP: Final = object()
+_LEVEL: Final = 'DEBUG'
+_LEVEL_KEY: Final = 'level'
+
+
+class _JsonConsoleSink:
+    """
+    Sink loguru, пишущий записи в stdout в виде компактного JSON.
+
+    Вызов sink только сериализует запись через orjson и кладет строку
+    в ограниченную очередь. Фоновый поток забирает накопившиеся строки
+    и записывает их в поток вывода одним вызовом. Если очередь
+    заполнена или поток вывода не принимает запись, записи отбрасываются
+    и учитываются в счетчике dropped.
+
+    Attributes:
+        dropped (int): Количество отброшенных записей.
+    """
+
+    def __init__(self, stream, max_queue_size: int = _CONSOLE_MAX_QUEUE_SIZE):
+        """
+        Инициализирует sink.
+
+        Args:
+            stream: Бинарный поток вывода.
+            max_queue_size (int): Максимальное число записей в очереди.
+        """
+        self._stream = stream
+        self._max_queue_size = max_queue_size
+        self._start_lock = threading.Lock()
+        self._pid: Optional[int] = None
+        self.dropped = 0
+
+    def __call__(self, message) -> None:
+        """
+        Ставит запись лога в очередь на вывод.
+
+        Args:
+            message: Сообщение loguru с записью в атрибуте record.
+        """
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(_serialize(message.record))
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self) -> None:
+        """Останавливает фоновый поток, выведя накопленные записи."""
+        if self._pid != os.getpid():
+            return
+        self._queue.put(_STOP)
+        self._thread.join(_CLOSE_TIMEOUT_SECONDS)
+
+    def _ensure_started(self) -> None:
+        # После fork поток родителя в дочернем процессе не существует,
+        # поэтому очередь и поток создаются заново.
+        if self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            self._queue: queue.Queue = queue.Queue(self._max_queue_size)
+            self._thread = threading.Thread(
+                target=self._run,
+                name='console-log-writer',
+                daemon=True,
+            )
+            self._thread.start()
+            self._pid = os.getpid()
+            atexit.register(self.close)
+
+    def _run(self) -> None:
+        stopped = False
+        while not stopped:
+            lines = [self._queue.get()]
+            while len(lines) < _CONSOLE_WRITE_BATCH_SIZE:
+                try:
+                    lines.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if _STOP in lines:
+                stopped = True
+                lines.remove(_STOP)
+            self._write(lines)
+
+    def _write(self, lines: list[bytes]) -> None:
+        # Закрытый или переполненный поток вывода не должен останавливать
+        # поток записи: записи пакета отбрасываются.
+        try:  # noqa: WPS229
+            self._stream.write(b''.join(lines))
+            self._stream.flush()
+        except (OSError, ValueError):
+            self.dropped += len(lines)
+
+
+def _serialize(record) -> bytes:
+    serialized = {
+        'time': record['time'].isoformat(),
+        _LEVEL_KEY: record[_LEVEL_KEY].name,
+        'message': record['message'],
+        'name': record['name'],
+        'function': record['function'],
+        'line': record['line'],
+    }
+    if record['extra']:
+        serialized['extra'] = record['extra']
+    if record['exception']:
+        serialized['exception'] = ''.join(
+            traceback.format_exception(*record['exception']),
+        )
+    return orjson.dumps(
+        serialized,
+        default=_to_json,
+        option=orjson.OPT_APPEND_NEWLINE,
+    )
+
+
+def _to_json(unknown: Any) -> Any:
+    # Метки передаются как MappingProxyType, который orjson не сериализует.
+    if isinstance(unknown, Mapping):
+        return dict(unknown)
+    return str(unknown)
+
 
 CONSOLE_HANDLERS: Final = (
     {
         'sink': sys.stdout,
         'format': _LOGGER_FORMAT,
-        'level': 'DEBUG',
+        'level': _LEVEL,
         'backtrace': False,
         'diagnose': False,
     },
 )
+
+
+def get_release_console_handlers() -> tuple:
+    """
+    Возвращает обработчики консольного лога для режима Release.
+
+    Sink создается при вызове, чтобы в остальных режимах не обращаться
+    к бинарному потоку stdout.
+
+    Returns:
+        tuple: Настройки обработчиков loguru.
+    """
+    return (
+        {
+            'sink': _JsonConsoleSink(sys.stdout.buffer),
+            'level': _LEVEL,
+            'colorize': False,
+            'backtrace': False,
+            'diagnose': False,
+        },
+    )
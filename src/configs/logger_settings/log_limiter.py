@@ -0,0 +1,234 @@
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Final, Mapping, NamedTuple, Optional
+
+# Сводка о подавленных записях не ограничивается и не подавляется.
+SUPPRESSED_CALLSITE_KEY: Final = 'suppressed_callsite'
+_SUPPRESSED_FLAG: Final = 'log_suppressed'
+_SUPPRESSED_COUNT_KEY: Final = 'suppressed'
+_LABELS_KEY: Final = 'labels'
+_EXTRA_KEY: Final = 'extra'
+_MESSAGE_KEY: Final = 'message'
+
+
+@dataclass(frozen=True)
+class LogLimit:
+    """
+    Ограничение частоты записей одного места вызова.
+
+    Attributes:
+        rate (float): Скорость пополнения корзины токенов в записях
+        в секунду.
+        burst (int): Емкость корзины токенов.
+        sample_rate (float): Доля записей, проходящих выборку,
+        от 0 до 1.
+    """
+
+    rate: float
+    burst: int
+    sample_rate: float = 1
+
+
+class SuppressedLogs(NamedTuple):
+    """
+    Записи места вызова, подавленные и еще не упомянутые в логе.
+
+    Attributes:
+        name (str): Модуль места вызова.
+        function (str): Функция места вызова.
+        line (int): Строка места вызова.
+        count (int): Количество подавленных записей.
+    """
+
+    name: str
+    function: str
+    line: int
+    count: int
+
+
+class _TokenBucket:
+    def __init__(self, limit: LogLimit):
+        self.limit = limit
+        self.tokens = float(limit.burst)
+        self.updated_at = time.monotonic()
+        self.suppressed = 0
+        self.suppressed_at = self.updated_at
+
+    def take(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(
+            self.limit.burst,
+            self.tokens + (now - self.updated_at) * self.limit.rate,
+        )
+        self.updated_at = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class LogLimiter:  # noqa: WPS214
+    """
+    Выборка, ограничение частоты и усечение записей loguru.
+
+    Каждое место вызова логгера (модуль, функция и строка) получает
+    свою корзину токенов. Параметры корзины берутся из ограничения
+    для функции ('модуль:функция'), затем из ограничения для метки
+    ('метка=значение'), иначе из ограничения по умолчанию. Подавленные
+    записи помечаются в patch и отбрасываются в filter всех
+    обработчиков. Следующая пропущенная запись того же места вызова
+    сообщает, сколько записей было подавлено перед ней. Если такой записи
+    нет дольше flush_interval, фоновый поток передает количество
+    подавленных записей в report.
+
+    Methods:
+        patch: Принимает решение по записи и усекает сообщение.
+        filter: Отбрасывает подавленные записи.
+        flush_suppressed: Забирает давно не упомянутые подавленные записи.
+    """
+
+    def __init__(  # noqa: WPS211
+        self,
+        default_limit: LogLimit,
+        limits: Mapping[str, LogLimit],
+        max_message_length: int,
+        flush_interval: float = 10,
+        report: Optional[Callable[[SuppressedLogs], None]] = None,
+    ):
+        """
+        Инициализирует ограничитель.
+
+        Args:
+            default_limit (LogLimit): Ограничение по умолчанию.
+            limits (Mapping[str, LogLimit]): Ограничения по ключам
+            'модуль:функция' и 'метка=значение'.
+            max_message_length (int): Максимальная длина сообщения.
+            flush_interval (float): Через сколько секунд подавленные
+            записи передаются в report, если место вызова молчит.
+            report (Optional[Callable[[SuppressedLogs], None]]): Получает
+            количество подавленных записей места вызова. None - фоновый
+            поток не запускается.
+        """
+        self._default_limit = default_limit
+        self._limits = limits
+        self._max_message_length = max_message_length
+        self._flush_interval = flush_interval
+        self._report = report
+        self._buckets: dict[tuple, _TokenBucket] = {}
+        self._lock = threading.Lock()
+        self._flusher_pid: Optional[int] = None
+
+    def patch(self, record) -> None:
+        """
+        Принимает решение по записи и усекает сообщение.
+
+        Args:
+            record: Запись loguru.
+        """
+        self._ensure_flusher()
+        if SUPPRESSED_CALLSITE_KEY in record[_EXTRA_KEY]:
+            return
+        callsite = (record['name'], record['function'], record['line'])
+        with self._lock:
+            bucket = self._buckets.get(callsite)
+            if bucket is None:
+                bucket = _TokenBucket(self._limit_for(record))
+                self._buckets[callsite] = bucket
+            sampled = random.random() < bucket.limit.sample_rate  # noqa: S311
+            if not sampled or not bucket.take():
+                if not bucket.suppressed:
+                    bucket.suppressed_at = time.monotonic()
+                bucket.suppressed += 1
+                record[_EXTRA_KEY][_SUPPRESSED_FLAG] = True
+                return
+            suppressed = bucket.suppressed
+            bucket.suppressed = 0
+
+        self._truncate(record)
+        if suppressed:
+            record[_EXTRA_KEY][_SUPPRESSED_COUNT_KEY] = suppressed
+            record[_MESSAGE_KEY] = '{0} (подавлено записей: {1})'.format(
+                record[_MESSAGE_KEY],
+                suppressed,
+            )
+
+    def filter(self, record) -> bool:
+        """
+        Отбрасывает подавленные записи.
+
+        Args:
+            record: Запись loguru.
+
+        Returns:
+            bool: True, если запись нужно вывести.
+        """
+        return not record[_EXTRA_KEY].get(_SUPPRESSED_FLAG, False)
+
+    def flush_suppressed(self) -> list[SuppressedLogs]:
+        """
+        Забирает подавленные записи мест вызова, молчащих flush_interval.
+
+        Забранные записи больше не упоминаются следующей пропущенной
+        записью того же места вызова.
+
+        Returns:
+            list[SuppressedLogs]: Подавленные записи по местам вызова.
+        """
+        now = time.monotonic()
+        flushed = []
+        with self._lock:
+            for callsite, bucket in self._buckets.items():
+                if not bucket.suppressed:
+                    continue
+                if now - bucket.suppressed_at < self._flush_interval:
+                    continue
+                flushed.append(SuppressedLogs(*callsite, bucket.suppressed))
+                bucket.suppressed = 0
+        return flushed
+
+    def _ensure_flusher(self) -> None:
+        # После fork поток родителя в дочернем процессе не существует,
+        # поэтому поток создается заново.
+        if self._report is None or self._flusher_pid == os.getpid():
+            return
+        with self._lock:
+            if self._flusher_pid == os.getpid():
+                return
+            threading.Thread(
+                target=self._run_flusher,
+                name='log-limiter-flush',
+                daemon=True,
+            ).start()
+            self._flusher_pid = os.getpid()
+
+    def _run_flusher(self) -> None:
+        while True:  # noqa: WPS457
+            time.sleep(self._flush_interval)
+            for suppressed_logs in self.flush_suppressed():
+                self._report(suppressed_logs)
+
+    def _limit_for(self, record) -> LogLimit:  # noqa: WPS210
+        function_key = '{0}:{1}'.format(record['name'], record['function'])
+        keys = [function_key]
+        labels = record[_EXTRA_KEY].get(_LABELS_KEY) or {}
+        keys.extend(
+            '{0}={1}'.format(label, label_value)
+            for label, label_value in labels.items()
+        )
+        for limit_key in keys:
+            limit = self._limits.get(limit_key)
+            if limit is not None:
+                return limit
+        return self._default_limit
+
+    def _truncate(self, record) -> None:
+        message = record[_MESSAGE_KEY]
+        if len(message) <= self._max_message_length:
+            return
+        record[_MESSAGE_KEY] = '{0}... (усечено символов: {1})'.format(
+            message[:self._max_message_length],
+            len(message) - self._max_message_length,
+        )
@@ -1,29 +1,113 @@
 import os
+from types import MappingProxyType
 from typing import Final
 
 from loguru import logger
 
-from src.configs.logger_settings.console_logger import CONSOLE_HANDLERS
-from src.configs.logger_settings.loki_logger import LOKI_LOGGER_HANDLER
+from src.configs.logger_settings.console_logger import (
+    CONSOLE_HANDLERS,
+    get_release_console_handlers,
+)
+from src.configs.logger_settings.log_limiter import (
+    SUPPRESSED_CALLSITE_KEY,
+    LogLimit,
+    LogLimiter,
+    SuppressedLogs,
+)
+from src.utils.tracing import current_trace_id
+
+_LOG_RATE_LIMIT: Final = LogLimit(
+    rate=float(os.getenv('LOG_RATE_LIMIT_PER_SECOND', '20')),
+    burst=int(os.getenv('LOG_RATE_LIMIT_BURST', '100')),
+    sample_rate=float(os.getenv('LOG_SAMPLE_RATE', '1')),
+)
+_TOKEN_ERRORS_LIMIT: Final = LogLimit(rate=1, burst=10)
+_DAO_ERRORS_LIMIT: Final = LogLimit(rate=5, burst=20)  # noqa: WPS432
+# Журнал доступа прореживается выборкой по маршрутам в uvicorn_logger.
+_ACCESS_LOG_LIMIT: Final = LogLimit(
+    rate=float(os.getenv('ACCESS_LOG_RATE_LIMIT_PER_SECOND', '1000')),
+    burst=int(os.getenv('ACCESS_LOG_RATE_LIMIT_BURST', '2000')),
+)
+_LOG_CALLSITE_LIMITS: Final = MappingProxyType(
+    {
+        'src.auth.utils.tokens.access_token_decoder:decode_token': (
+            _TOKEN_ERRORS_LIMIT
+        ),
+        'src.utils.base_dao:_log_error': _DAO_ERRORS_LIMIT,
+        'logger_name=uvicorn.access': _ACCESS_LOG_LIMIT,
+    },
+)
+_LOG_MAX_MESSAGE_LENGTH: Final = int(
+    os.getenv('LOG_MAX_MESSAGE_LENGTH', '4096'),
+)
+_LOG_SUPPRESSED_FLUSH_SECONDS: Final = float(
+    os.getenv('LOG_SUPPRESSED_FLUSH_SECONDS', '10'),
+)
 
 
+def _report_suppressed(suppressed_logs: SuppressedLogs) -> None:
+    callsite = '{0}:{1}:{2}'.format(
+        suppressed_logs.name,
+        suppressed_logs.function,
+        suppressed_logs.line,
+    )
+    logger.bind(
+        **{SUPPRESSED_CALLSITE_KEY: callsite},
+        suppressed=suppressed_logs.count,
+    ).warning(
+        'Подавлено записей {0}: {1}',
+        callsite,
+        suppressed_logs.count,
+    )
+
+
+_LOG_LIMITER: Final = LogLimiter(
+    default_limit=_LOG_RATE_LIMIT,
+    limits=_LOG_CALLSITE_LIMITS,
+    max_message_length=_LOG_MAX_MESSAGE_LENGTH,
+    flush_interval=_LOG_SUPPRESSED_FLUSH_SECONDS,
+    report=_report_suppressed,
+)
+
+
+def _patch_record(record) -> None:
+    _LOG_LIMITER.patch(record)
+    trace_id = current_trace_id()
+    if trace_id is not None:
+        record['extra']['trace_id'] = trace_id
+
+
+# depth=1 сохраняет в записи место вызова, а не эту обертку:
+# по нему работает ограничение частоты.
 def _error_with_exception(message: str, *args, **kwargs):
-    logger.opt(exception=True).error(message, *args, **kwargs)
+    caller_logger = logger.opt(exception=True, depth=1)
+    caller_logger.error(message, *args, **kwargs)
 
 
 def _critical_with_exception(message: str, *args, **kwargs):
-    logger.opt(exception=True).critical(message, *args, **kwargs)
+    caller_logger = logger.opt(exception=True, depth=1)
+    caller_logger.critical(message, *args, **kwargs)
+
 
+def _get_handlers(mode: str) -> tuple:
+    if mode != 'Release':
+        return CONSOLE_HANDLERS
+    # Отправитель Loki импортируется только в Release: он запускает поток
+    # и открывает спул, что не нужно при отладке и в скриптах.
+    from src.configs.logger_settings.loki_logger import (  # noqa: WPS433
+        LOKI_LOGGER_HANDLER,
+    )
+    return get_release_console_handlers() + LOKI_LOGGER_HANDLER
 
-_handlers: Final = {
-    'Debug': CONSOLE_HANDLERS,
-    'Release': CONSOLE_HANDLERS + LOKI_LOGGER_HANDLER,
-}
 
 _MODE: Final = os.getenv('MODE', 'Debug')
 
 logger.configure(
-    handlers=_handlers.get(_MODE, CONSOLE_HANDLERS),
+    handlers=[
+        {**handler_config, 'filter': _LOG_LIMITER.filter}
+        for handler_config in _get_handlers(_MODE)
+    ],
+    patcher=_patch_record,
 )
 
 logger.error = _error_with_exception
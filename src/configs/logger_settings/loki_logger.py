@@ -1,10 +1,41 @@
+import atexit
+import json
 import os
+import queue
+import tempfile
+import threading
+import time
 import traceback
-from typing import Final
+from collections import defaultdict
+from typing import Final, Optional
 
-from loki_logger_handler.loki_logger_handler import LokiLoggerHandler
+import requests
+
+from src.configs.logger_settings.loki_spool import LokiSpool
 
 _LOKI_URL: Final = os.getenv('LOKI_URL')
+_LOKI_BATCH_SIZE: Final = int(os.getenv('LOKI_BATCH_SIZE', '500'))
+_LOKI_FLUSH_INTERVAL_SECONDS: Final = float(
+    os.getenv('LOKI_FLUSH_INTERVAL_SECONDS', '1.0'),
+)
+_LOKI_MAX_QUEUE_SIZE: Final = int(os.getenv('LOKI_MAX_QUEUE_SIZE', '10000'))
+_LOKI_TIMEOUT_SECONDS: Final = float(os.getenv('LOKI_TIMEOUT_SECONDS', '10'))
+_LOKI_RETRY_INTERVAL_SECONDS: Final = float(
+    os.getenv('LOKI_RETRY_INTERVAL_SECONDS', '5'),
+)
+_LOKI_SPOOL_DIR: Final = os.getenv(
+    'LOKI_SPOOL_DIR',
+    os.path.join(tempfile.gettempdir(), 'inventory-control-loki-spool'),
+)
+_LOKI_SPOOL_SEGMENT_BYTES: Final = int(
+    os.getenv('LOKI_SPOOL_SEGMENT_BYTES', str(8 * 1024 * 1024)),
+)
+_LOKI_SPOOL_MAX_SEGMENTS: Final = int(
+    os.getenv('LOKI_SPOOL_MAX_SEGMENTS', '64'),
+)
+_LOKI_SPOOL_REPLAY_BATCHES: Final = int(
+    os.getenv('LOKI_SPOOL_REPLAY_BATCHES', '10'),
+)
 _APP_LABEL: Final = 'inventory-control'
 _MESSAGE_KEY: Final = 'message'
 _TIMESTAMP_KEY: Final = 'timestamp'
@@ -20,39 +51,268 @@ _LABELS_KEY: Final = 'labels'
 _TIME_KEY: Final = 'time'
 _EXCEPTION_KEY: Final = 'exception'
 _STACKTRACE_ENABLED_LEVELS: Final = ('ERROR', 'CRITICAL')
+_NS_IN_SECOND: Final = 10 ** 9
 
 
-class _CustomLokiLoggerHandler(LokiLoggerHandler):
+class _LokiBatchShipper:  # noqa: WPS214
     """
-    Кастомный обработчик логов для Loki, расширяющий базовый LokiLoggerHandler.
+    Sink loguru, отправляющий логи в Loki пакетами из фонового потока.
+
+    Вызов sink только форматирует запись и кладет ее в ограниченную
+    очередь, поэтому логирование не ждет сеть. Фоновый поток собирает
+    записи в пакет до batch_size штук или до истечения flush_interval,
+    группирует их в потоки Loki по набору меток и отправляет одним
+    запросом через общую HTTP-сессию.
+
+    Если отправка не удалась, пакет пишется в спул на диске, а новые
+    пакеты до истечения retry_interval сразу уходят в спул, не дожидаясь
+    таймаута. Спул воспроизводится тем же фоновым потоком, когда Loki
+    снова принимает запросы. Без спула неотправленные записи
+    учитываются в счетчике failed. Если очередь заполнена, запись
+    отбрасывается и учитывается в счетчике dropped: вызывающий поток
+    не пишет на диск. Непредвиденные ошибки фонового потока
+    учитываются в счетчике errors, и поток продолжает работу.
 
-    Переопределяет метод `emit` для настройки меток в сообщениях логов.
-    Объединяет предопределенные метки с метками из записи лога
-    и дополнительными метками.
+    Attributes:
+        stats (dict[str, int]): Счетчики отправленных, отброшенных,
+        неотправленных и записанных в спул записей и ошибок потока.
     """
 
-    def emit(self, record):
-        labels_from_record = {
-            _FUNCTION_KEY: record.get(_FUNCTION_KEY),
-            _NAME_KEY: record.get(_NAME_KEY),
+    def __init__(  # noqa: WPS211
+        self,
+        url: str,
+        labels: dict[str, str],
+        formatter: '_CustomLoguruFormatter',
+        batch_size: int = _LOKI_BATCH_SIZE,
+        flush_interval: float = _LOKI_FLUSH_INTERVAL_SECONDS,
+        max_queue_size: int = _LOKI_MAX_QUEUE_SIZE,
+        timeout: float = _LOKI_TIMEOUT_SECONDS,
+        spool: Optional[LokiSpool] = None,
+        retry_interval: float = _LOKI_RETRY_INTERVAL_SECONDS,
+    ):
+        """
+        Инициализирует отправщик логов.
+
+        Args:
+            url (str): Адрес push API Loki.
+            labels (dict[str, str]): Метки, добавляемые ко всем записям.
+            formatter (_CustomLoguruFormatter): Форматтер записей.
+            batch_size (int): Максимальное число записей в одном запросе.
+            flush_interval (float): Максимальное время ожидания пакета
+            в секундах.
+            max_queue_size (int): Максимальное число записей в очереди.
+            timeout (float): Таймаут HTTP-запроса в секундах.
+            spool (Optional[LokiSpool]): Спул для пакетов, которые
+            не удалось отправить.
+            retry_interval (float): Пауза после неудачной отправки
+            в секундах, в течение которой пакеты пишутся в спул.
+        """
+        self._url = url
+        self._labels = labels
+        self._formatter = formatter
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._max_queue_size = max_queue_size
+        self._timeout = timeout
+        self._spool = spool
+        self._retry_interval = retry_interval
+        self._retry_at = time.monotonic()
+        self._start_lock = threading.Lock()
+        self._pid: Optional[int] = None
+        # Счетчики меняют и вызывающие потоки, и фоновый поток.
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            'sent': 0,
+            'dropped': 0,
+            'failed': 0,
+            'spooled': 0,
+            'errors': 0,
         }
-        additional_labels = record.get(_EXTRA_KEY).pop(_LABELS_KEY, {})
 
+    def __call__(self, message) -> None:
+        """
+        Ставит запись лога в очередь на отправку.
+
+        Args:
+            message: Сообщение loguru с записью в атрибуте record.
+        """
+        self._ensure_started()
+        record = message.record
+        entry = (
+            self._labels_for(record),
+            int(record.get(_TIME_KEY).timestamp() * _NS_IN_SECOND),
+            self._formatter.format(record),
+        )
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self._count('dropped', 1)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Возвращает счетчики отправки логов.
+
+        Returns:
+            dict[str, int]: Отправленные, отброшенные, неотправленные
+            и записанные в спул записи, ошибки потока, а также текущий
+            размер очереди.
+        """
+        pending = self._queue.qsize() if self._pid is not None else 0
+        with self._stats_lock:
+            return {**self._stats, 'queued': pending}
+
+    def close(self) -> None:
+        """Останавливает фоновый поток, отправив накопленные записи."""
+        if self._pid != os.getpid():
+            return
+        self._stop_event.set()
+        self._thread.join(self._timeout)
+
+    def _ensure_started(self) -> None:
+        # После fork поток родителя в дочернем процессе не существует,
+        # поэтому очередь и поток создаются заново.
+        if self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            self._queue: queue.Queue = queue.Queue(self._max_queue_size)
+            self._stop_event = threading.Event()
+            self._session = requests.Session()
+            self._thread = threading.Thread(
+                target=self._run,
+                name='loki-shipper',
+                daemon=True,
+            )
+            self._thread.start()
+            self._pid = os.getpid()
+            atexit.register(self.close)
+
+    def _labels_for(self, record) -> tuple:
+        additional_labels = record.get(_EXTRA_KEY).get(_LABELS_KEY, {})
         all_labels = {
-            **self.labels,
+            **self._labels,
             **additional_labels,
-            **labels_from_record,
+            _FUNCTION_KEY: record.get(_FUNCTION_KEY),
+            _NAME_KEY: record.get(_NAME_KEY),
         }
+        return tuple(
+            sorted(
+                (label, str(label_value))
+                for label, label_value in all_labels.items()
+            ),
+        )
+
+    def _run(self) -> None:
+        # Непредвиденная ошибка не должна останавливать поток: иначе
+        # очередь заполнится и все следующие записи будут отброшены.
+        while not self._stop_event.is_set() or not self._queue.empty():
+            try:
+                self._ship(self._collect_batch())
+            except Exception:
+                self._count('errors', 1)
 
-        custom_handler = LokiLoggerHandler(
-            url=self.request.url,
-            labels=all_labels,
-            labelKeys=self.labelKeys,
-            timeout=self.timeout,
-            defaultFormatter=self.logger_formatter,
+    def _ship(self, batch: list) -> None:
+        if batch:
+            self._push(batch)
+        self._replay_spool()
+
+    def _collect_batch(self) -> list:
+        batch: list = []
+        deadline = time.monotonic() + self._flush_interval
+        while len(batch) < self._batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _push(self, batch: list) -> None:
+        payload = _build_push_payload(batch)
+        if not self._in_outage():
+            try:
+                self._send(payload)
+            except (requests.RequestException, ValueError):
+                self._retry_at = time.monotonic() + self._retry_interval
+            else:
+                self._count('sent', len(batch))
+                return
+        self._spill(payload, len(batch))
+
+    def _spill(self, payload: dict, entries_count: int) -> None:
+        if self._spool is None:
+            self._count('failed', entries_count)
+            return
+        try:
+            self._spool.append(payload)
+        except OSError:
+            self._count('failed', entries_count)
+            return
+        self._count('spooled', entries_count)
+
+    def _replay_spool(self) -> None:
+        if self._spool is None or self._in_outage():
+            return
+        if not self._spool.has_pending():
+            return
+        try:
+            self._spool.replay(self._send, _LOKI_SPOOL_REPLAY_BATCHES)
+        except (requests.RequestException, ValueError):
+            self._retry_at = time.monotonic() + self._retry_interval
+
+    def _count(self, counter: str, entries_count: int) -> None:
+        with self._stats_lock:
+            self._stats[counter] += entries_count
+
+    def _in_outage(self) -> bool:
+        return time.monotonic() < self._retry_at
+
+    def _send(self, payload: dict) -> None:
+        response = self._session.post(
+            self._url,
+            json=payload,
+            timeout=self._timeout,
         )
+        response.raise_for_status()
+
 
-        custom_handler.emit(record)
+def _build_push_payload(batch: list) -> dict:  # noqa: WPS210
+    """
+    Группирует записи в потоки Loki по набору меток.
+
+    Args:
+        batch (list): Записи в виде (метки, время в нс, словарь записи).
+
+    Returns:
+        dict: Тело запроса push API Loki.
+    """
+    streams = defaultdict(list)
+    for labels, timestamp_ns, formatted in batch:
+        streams[labels].append(
+            [
+                str(timestamp_ns),
+                json.dumps(formatted, ensure_ascii=False, default=str),
+            ],
+        )
+    return {
+        'streams': [
+            {'stream': dict(stream_labels), 'values': stream_values}
+            for stream_labels, stream_values in streams.items()
+        ],
+    }
+
+
+def _extra_without_labels(record) -> dict:
+    # Метки уходят в набор меток потока Loki, а не в текст записи.
+    return {
+        extra_key: extra_value
+        for extra_key, extra_value in record.get(_EXTRA_KEY).items()
+        if extra_key != _LABELS_KEY
+    }
 
 
 class _CustomLoguruFormatter:
@@ -65,18 +325,19 @@ class _CustomLoguruFormatter:
     путь, номер строки и трассировку стека для определенных уровней логирования.
     """
 
-    def format(self, record):
+    def format(self, record):  # noqa: WPS210
         formatted = {
             _MESSAGE_KEY: record.get(_MESSAGE_KEY),
             _TIMESTAMP_KEY: record.get(_TIME_KEY).timestamp(),
             _LEVEL_KEY: record.get(_LEVEL_KEY).name,
         }
 
-        if record.get(_EXTRA_KEY):
-            if record.get(_EXTRA_KEY).get(_EXTRA_KEY):
-                formatted.update(record.get(_EXTRA_KEY).get(_EXTRA_KEY))
+        extra = _extra_without_labels(record)
+        if extra:
+            if extra.get(_EXTRA_KEY):
+                formatted.update(extra.get(_EXTRA_KEY))
             else:
-                formatted.update(record.get(_EXTRA_KEY))
+                formatted.update(extra)
 
         if record.get(_LEVEL_KEY).name in _STACKTRACE_ENABLED_LEVELS:
             formatted[_FILE_KEY] = record.get(_FILE_KEY).name
@@ -95,14 +356,30 @@ class _CustomLoguruFormatter:
         return formatted
 
 
-LOKI_LOGGER_HANDLER: Final = (
-    {
-        'sink': _CustomLokiLoggerHandler(
-            url=_LOKI_URL,
-            labels={'app': _APP_LABEL},
-            labelKeys={},
-            timeout=10,
-            defaultFormatter=_CustomLoguruFormatter(),
+def _loki_handlers(url: Optional[str]) -> tuple:
+    """
+    Создает обработчик loguru, отправляющий логи в Loki.
+
+    Args:
+        url (Optional[str]): Адрес push API Loki.
+
+    Returns:
+        tuple: Обработчик с отправщиком или пустой кортеж, если адрес
+        не задан: иначе каждый пакет уходил бы в спул.
+    """
+    if not url:
+        return ()
+    loki_shipper = _LokiBatchShipper(
+        url=url,
+        labels={'app': _APP_LABEL},
+        formatter=_CustomLoguruFormatter(),
+        spool=LokiSpool(
+            directory=_LOKI_SPOOL_DIR,
+            segment_max_bytes=_LOKI_SPOOL_SEGMENT_BYTES,
+            max_segments=_LOKI_SPOOL_MAX_SEGMENTS,
         ),
-    },
-)
+    )
+    return ({'sink': loki_shipper},)
+
+
+LOKI_LOGGER_HANDLER: Final = _loki_handlers(_LOKI_URL)
@@ -0,0 +1,265 @@
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Callable, Final, Optional
+
+_SEGMENT_PATTERN: Final = re.compile(r'^(\d+)-(\d+)\.jsonl$')
+_CLAIMED_SEGMENT_PATTERN: Final = re.compile(r'^claimed-(\d+)-')
+_SEGMENT_NAME: Final = '{pid}-{sequence:012d}.jsonl'
+
+
+def _is_process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _segment_owner(segment_path: Path) -> Optional[int]:
+    # Захваченный сегмент принадлежит захватившему его процессу.
+    match = (
+        _CLAIMED_SEGMENT_PATTERN.match(segment_path.name) or
+        _SEGMENT_PATTERN.match(segment_path.name)
+    )
+    return int(match.group(1)) if match else None
+
+
+def _is_droppable(segment_path: Path) -> bool:
+    owner = _segment_owner(segment_path)
+    if owner is None:
+        return False
+    return owner == os.getpid() or not _is_process_alive(owner)
+
+
+def _segment_sequence(segment_path: Path) -> str:
+    # Номер сегмента дополнен нулями, поэтому строки сравниваются
+    # так же, как числа.
+    return segment_path.stem.split('-')[-1]
+
+
+class LokiSpool:  # noqa: WPS214
+    """
+    Локальная очередь пакетов Loki в сегментированных файлах на диске.
+
+    Пакеты дописываются в конец активного сегмента, по одному JSON
+    на строку. При превышении размера сегмент закрывается и начинается
+    новый; при превышении числа сегментов удаляется самый старый.
+    Лимит числа сегментов учитывает только сегменты текущего
+    и завершившихся процессов: сегменты других живых воркеров
+    остаются им.
+    Воспроизведение читает закрытые сегменты от старых к новым и удаляет
+    сегмент после успешной отправки всех его пакетов.
+
+    Сегменты именуются по PID процесса, поэтому несколько воркеров могут
+    использовать один каталог. Сегменты завершившихся процессов
+    подхватываются и воспроизводятся живыми процессами.
+
+    Attributes:
+        stats (dict[str, int]): Счетчики записанных, воспроизведенных
+        и удаленных при переполнении пакетов.
+
+    Methods:
+        append: Дописывает пакет в активный сегмент.
+        has_pending: Проверяет, есть ли пакеты для воспроизведения.
+        replay: Отправляет пакеты из самого старого сегмента.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_max_bytes: int,
+        max_segments: int,
+    ):
+        """
+        Инициализирует спул.
+
+        Args:
+            directory (str): Каталог для файлов сегментов.
+            segment_max_bytes (int): Размер сегмента, после которого
+            начинается новый сегмент.
+            max_segments (int): Максимальное число сегментов на диске.
+        """
+        self._directory = Path(directory)
+        self._segment_max_bytes = segment_max_bytes
+        self._max_segments = max_segments
+        self._lock = threading.Lock()
+        self._sequence = 0
+        self._active_path: Optional[Path] = None
+        self._active_size = 0
+        self._replay_path: Optional[Path] = None
+        self._replay_lines: list[str] = []
+        self._replay_offset = 0
+        self._stats = {'spooled': 0, 'replayed': 0, 'dropped': 0}
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Возвращает счетчики спула.
+
+        Returns:
+            dict[str, int]: Записанные, воспроизведенные и удаленные
+            при переполнении пакеты.
+        """
+        return dict(self._stats)
+
+    def append(self, payload: dict) -> None:
+        """
+        Дописывает пакет в активный сегмент.
+
+        Args:
+            payload (dict): Тело запроса push API Loki.
+        """
+        line = '{0}\n'.format(json.dumps(payload, ensure_ascii=False))
+        encoded_size = len(line.encode())
+        with self._lock:
+            new_size = self._active_size + encoded_size
+            if self._active_path is None or new_size > self._segment_max_bytes:
+                self._start_segment()
+            with open(self._active_path, 'a', encoding='utf-8') as segment:
+                segment.write(line)
+            self._active_size += encoded_size
+            self._stats['spooled'] += 1
+
+    def has_pending(self) -> bool:
+        """
+        Проверяет, есть ли пакеты для воспроизведения.
+
+        Returns:
+            bool: True, если на диске есть неотправленные пакеты.
+        """
+        return (
+            self._replay_path is not None or
+            self._active_size > 0 or
+            bool(self._segments())
+        )
+
+    def replay(
+        self,
+        send: Callable[[dict], None],
+        max_payloads: int,
+    ) -> int:
+        """
+        Отправляет пакеты из самого старого сегмента.
+
+        Ошибка отправки прерывает воспроизведение; неотправленные пакеты
+        останутся в спуле до следующей попытки.
+
+        Args:
+            send (Callable[[dict], None]): Функция отправки пакета.
+            max_payloads (int): Максимальное число пакетов за вызов.
+
+        Returns:
+            int: Число отправленных пакетов.
+        """
+        if not self._load_next_segment():
+            return 0
+
+        pending_lines = self._replay_lines[
+            self._replay_offset:self._replay_offset + max_payloads
+        ]
+        for line in pending_lines:
+            send(json.loads(line))
+            self._replay_offset += 1
+            self._stats['replayed'] += 1
+
+        if self._replay_offset >= len(self._replay_lines):
+            self._replay_path.unlink(missing_ok=True)
+            self._replay_path = None
+            self._replay_lines = []
+            self._replay_offset = 0
+        return len(pending_lines)
+
+    def _load_next_segment(self) -> bool:
+        if self._replay_path is not None:
+            return True
+
+        with self._lock:
+            segments = self._segments()
+            if not segments and self._active_size:
+                # Активный сегмент закрывается, чтобы его можно было
+                # воспроизвести, пока новые записи идут в следующий.
+                self._active_path = None
+                self._active_size = 0
+                segments = self._segments()
+
+        for segment_path in segments:
+            claimed_path = self._claim(segment_path)
+            if claimed_path is not None:
+                self._replay_path = claimed_path
+                self._replay_lines = claimed_path.read_text(
+                    encoding='utf-8',
+                ).splitlines()
+                return True
+        return False
+
+    def _claim(self, segment_path: Path) -> Optional[Path]:
+        match = _SEGMENT_PATTERN.match(segment_path.name)
+        if int(match.group(1)) == os.getpid():
+            return segment_path
+        claimed_path = segment_path.with_name(
+            'claimed-{0}-{1}'.format(os.getpid(), segment_path.name),
+        )
+        try:
+            segment_path.rename(claimed_path)
+        except FileNotFoundError:
+            return None
+        return claimed_path
+
+    def _segments(self) -> list[Path]:
+        if not self._directory.exists():
+            return []
+        segments = []
+        for segment_path in self._directory.iterdir():
+            match = _SEGMENT_PATTERN.match(segment_path.name)
+            if match is None or segment_path == self._active_path:
+                continue
+            pid = int(match.group(1))
+            if pid == os.getpid() or not _is_process_alive(pid):
+                segments.append(segment_path)
+        segments.extend(self._directory.glob('claimed-{0}-*'.format(
+            os.getpid(),
+        )))
+        return sorted(segments, key=_segment_sequence)
+
+    def _start_segment(self) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._sequence = max(self._sequence + 1, self._last_sequence() + 1)
+        self._active_path = self._directory / _SEGMENT_NAME.format(
+            pid=os.getpid(),
+            sequence=self._sequence,
+        )
+        self._active_size = 0
+        self._drop_overflow()
+
+    def _last_sequence(self) -> int:
+        segments = self._directory.glob('*.jsonl')
+        return int(max(map(_segment_sequence, segments), default='0'))
+
+    def _drop_overflow(self) -> None:
+        segments = sorted(
+            (
+                segment_path
+                for segment_path in self._directory.glob('*.jsonl')
+                if _is_droppable(segment_path)
+            ),
+            key=_segment_sequence,
+        )
+        # Новый активный сегмент еще не создан на диске, но уже занимает
+        # одно место из max_segments.
+        overflow = len(segments) - self._max_segments + 1
+        for segment_path in segments[:max(overflow, 0)]:
+            if segment_path in {self._replay_path, self._active_path}:
+                continue
+            # Сегмент завершившегося процесса мог захватить другой воркер.
+            try:
+                with open(segment_path, encoding='utf-8') as segment:
+                    dropped_count = sum(1 for _ in segment)
+            except FileNotFoundError:
+                continue
+            segment_path.unlink(missing_ok=True)
+            self._stats['dropped'] += dropped_count
@@ -1,38 +1,170 @@
-import re
+import copy
+import logging
+import os
+import random
+import time
+from contextvars import ContextVar
+from types import MappingProxyType
+from typing import Final, Mapping, Optional
 
 import uvicorn
 
 from src.configs.logger_settings.logger_config import logger
 
+_ACCESS_LOGGER_NAME: Final = 'uvicorn.access'
+_ACCESS_RECORD_ARGS_COUNT: Final = 5
+_MS_IN_SECOND: Final = 1000
+_SERVER_ERROR_STATUS: Final = 500
+_ACCESS_LOG_FORMAT: Final = '{0} - "{1} {2} HTTP/{3}" {4}'
 
-def _determine_log_level(message):
-    match = re.search('CRITICAL|ERROR|WARNING|INFO', message, re.IGNORECASE)
-    return match.group(0).upper() if match else 'DEBUG'
+_request_started_at: ContextVar[Optional[float]] = ContextVar(
+    'request_started_at',
+    default=None,
+)
+_request_scope: ContextVar[Optional[dict]] = ContextVar(
+    'request_scope',
+    default=None,
+)
 
 
-class _InterceptHandler:
+def _parse_sample_rates(raw_sample_rates: str) -> Mapping[str, float]:
     """
-    Обработчик для перехвата и логирования сообщений с определенным уровнем.
+    Разбирает доли выборки журнала доступа по маршрутам.
 
-    Methods:
-        write(message: str) -> None: Обрабатывает и логирует сообщение.
+    Args:
+        raw_sample_rates (str): Строка вида '/path=0.1,/users/{user_id}=0'
+            с шаблонами путей маршрутов.
+
+    Returns:
+        Mapping[str, float]: Доля выборки для каждого шаблона пути.
+    """
+    sample_rates = {}
+    for route_rate in filter(None, raw_sample_rates.split(',')):
+        path, sample_rate = route_rate.rsplit('=', 1)
+        sample_rates[path.strip()] = float(sample_rate)
+    return MappingProxyType(sample_rates)
+
+
+_ACCESS_LOG_SAMPLE_RATE: Final = float(
+    os.getenv('ACCESS_LOG_SAMPLE_RATE', '1'),
+)
+_ACCESS_LOG_ROUTE_SAMPLE_RATES: Final = _parse_sample_rates(
+    os.getenv('ACCESS_LOG_SAMPLE_RATES', ''),
+)
+
+
+class AccessLogTimingMiddleware:
+    """
+    ASGI middleware, запоминающий время начала обработки запроса и его scope.
+
+    uvicorn пишет журнал доступа при отправке начала ответа в том же
+    контексте, что и обработка запроса, поэтому обработчик журнала
+    вычисляет длительность по сохраненному времени, а шаблон пути берет
+    из маршрута, который маршрутизатор записывает в тот же scope.
+    """
+
+    def __init__(self, app):
+        """
+        Инициализирует middleware.
+
+        Args:
+            app: Оборачиваемое ASGI-приложение.
+        """
+        self._app = app
+
+    async def __call__(self, scope, receive, send):
+        """
+        Обрабатывает ASGI-вызов.
+
+        Args:
+            scope: ASGI scope.
+            receive: ASGI receive.
+            send: ASGI send.
+        """
+        if scope['type'] == 'http':
+            _request_started_at.set(time.perf_counter())
+            _request_scope.set(scope)
+        await self._app(scope, receive, send)
+
+
+class _InterceptHandler(logging.Handler):
     """
+    Обработчик logging, передающий записи uvicorn в loguru.
 
-    def write(self, message):
+    Уровень и текст берутся из LogRecord. Для журнала доступа метод,
+    путь и статус берутся из аргументов записи, а длительность из времени,
+    сохраненного AccessLogTimingMiddleware. Записи журнала доступа
+    проходят выборку по шаблону пути маршрута, как в MetricsMiddleware;
+    ответы с ошибкой сервера пишутся всегда.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
         """
-        Обрабатывает и логирует сообщение с определенным уровнем.
+        Передает запись в loguru.
 
         Args:
-            message (str): Сообщение для логирования.
+            record (logging.LogRecord): Запись logging.
         """
-        level = _determine_log_level(message)
-        cleaned_message = re.sub(r'^\w+:\s*', '', message)
-        logger.opt(depth=6).log(
-            level,
-            cleaned_message.strip(),
+        is_access_record = record.name == _ACCESS_LOGGER_NAME
+        if is_access_record and len(record.args) == _ACCESS_RECORD_ARGS_COUNT:
+            self._emit_access(record)
+            return
+        logger.opt(exception=record.exc_info).log(
+            _loguru_level(record),
+            '{0}',
+            record.getMessage(),
             labels={'logger_name': 'uvicorn'},
         )
 
+    def _emit_access(self, record: logging.LogRecord) -> None:
+        method, full_path, status_code = (
+            record.args[1],
+            record.args[2],
+            record.args[4],
+        )
+        path = full_path.partition('?')[0]
+        if not _is_sampled(path, status_code):
+            return
+
+        logger.log(
+            _loguru_level(record),
+            _ACCESS_LOG_FORMAT,
+            *record.args,
+            method=method,
+            path=path,
+            status=status_code,
+            duration_ms=_duration_ms(),
+            labels={'logger_name': _ACCESS_LOGGER_NAME},
+        )
+
+
+def _loguru_level(record: logging.LogRecord):
+    try:
+        return logger.level(record.levelname).name
+    except ValueError:
+        return record.levelno
+
+
+def _is_sampled(path: str, status_code: int) -> bool:
+    if status_code >= _SERVER_ERROR_STATUS:
+        return True
+    # Доли заданы для шаблонов маршрутов: конкретный путь используется,
+    # только если запрос не дошел до маршрутизатора.
+    scope = _request_scope.get() or {}
+    route_path = getattr(scope.get('route'), 'path', path)
+    sample_rate = _ACCESS_LOG_ROUTE_SAMPLE_RATES.get(
+        route_path,
+        _ACCESS_LOG_SAMPLE_RATE,
+    )
+    return random.random() < sample_rate  # noqa: S311
+
+
+def _duration_ms() -> Optional[float]:
+    started_at = _request_started_at.get()
+    if started_at is None:
+        return None
+    return round((time.perf_counter() - started_at) * _MS_IN_SECOND, 3)
+
 
 def setup_uvicorn_logger():
     """
@@ -41,7 +173,10 @@ def setup_uvicorn_logger():
     Returns:
         dict: Конфигурация логирования uvicorn.
     """
-    uvicorn_logger = uvicorn.config.LOGGING_CONFIG
-    uvicorn_logger['handlers']['default']['stream'] = _InterceptHandler()
-    uvicorn_logger['handlers']['access']['stream'] = _InterceptHandler()
+    uvicorn_logger = copy.deepcopy(uvicorn.config.LOGGING_CONFIG)
+    handler_class = '{0}.{1}'.format(__name__, _InterceptHandler.__name__)
+    uvicorn_logger['handlers'] = {
+        'default': {'class': handler_class},
+        'access': {'class': handler_class},
+    }
     return uvicorn_logger
@@ -0,0 +1,21 @@
+import os
+from typing import Final
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+_MS_IN_SECOND: Final = 1000
+
+LOOP_MONITOR_ENABLED: Final = os.environ.get(
+    'LOOP_MONITOR_ENABLED',
+    'true',
+).lower() == 'true'
+# Период проверки задержки цикла событий.
+LOOP_MONITOR_INTERVAL_SECONDS: Final = float(
+    os.environ.get('LOOP_MONITOR_INTERVAL_MS', '100'),
+) / _MS_IN_SECOND
+# Блокировка цикла дольше этого значения записывается в лог со стеком.
+LOOP_MONITOR_BLOCK_THRESHOLD_SECONDS: Final = float(
+    os.environ.get('LOOP_MONITOR_BLOCK_THRESHOLD_MS', '250'),
+) / _MS_IN_SECOND
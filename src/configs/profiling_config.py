@@ -0,0 +1,33 @@
+import os
+import tempfile
+from typing import Final
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Заголовок и параметр запроса, включающие профилирование одного запроса.
+PROFILING_TRIGGER_HEADER: Final = os.environ.get(
+    'PROFILING_TRIGGER_HEADER',
+    'X-Profile',
+).lower()
+PROFILING_TRIGGER_QUERY: Final = os.environ.get(
+    'PROFILING_TRIGGER_QUERY',
+    'profile',
+)
+PROFILING_INTERVAL_SECONDS: Final = float(
+    os.environ.get('PROFILING_INTERVAL_MS', '1'),
+) / 1000
+# Доля обычных запросов, профилируемых с сохранением отчета в файл.
+PROFILING_SAMPLE_RATE: Final = float(
+    os.environ.get('PROFILING_SAMPLE_RATE', '0'),
+)
+PROFILING_OUTPUT_DIR: Final = os.environ.get(
+    'PROFILING_OUTPUT_DIR',
+    os.path.join(tempfile.gettempdir(), 'inventory-control-profiles'),
+)
+# Сколько последних отчетов выборочного профилирования хранится
+# в PROFILING_OUTPUT_DIR; более старые удаляются.
+PROFILING_MAX_FILES: Final = int(
+    os.environ.get('PROFILING_MAX_FILES', '100'),
+)
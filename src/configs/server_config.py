@@ -7,3 +7,16 @@ load_dotenv()
 
 SERVER_HOST: Final = os.environ.get('SERVER_HOST')
 SERVER_PORT: Final = int(os.environ.get('SERVER_PORT'))
+
+SERVER_MODE: Final = os.environ.get('MODE', 'Debug')
+SERVER_WORKERS: Final = int(
+    os.environ.get('SERVER_WORKERS', str(os.cpu_count() or 1)),
+)
+SERVER_KEEP_ALIVE_SECONDS: Final = int(
+    os.environ.get('SERVER_KEEP_ALIVE_SECONDS', '5'),
+)
+SERVER_BACKLOG: Final = int(os.environ.get('SERVER_BACKLOG', '2048'))
+SERVER_MAX_REQUESTS: Final = int(os.environ.get('SERVER_MAX_REQUESTS', '0'))
+SERVER_GRACEFUL_SHUTDOWN_SECONDS: Final = int(
+    os.environ.get('SERVER_GRACEFUL_SHUTDOWN_SECONDS', '30'),
+)
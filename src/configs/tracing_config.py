@@ -0,0 +1,23 @@
+import os
+import tempfile
+from typing import Final
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+TRACE_SAMPLE_RATE: Final = float(os.environ.get('TRACE_SAMPLE_RATE', '0'))
+TRACE_EXPORT_PATH: Final = os.environ.get(
+    'TRACE_EXPORT_PATH',
+    os.path.join(tempfile.gettempdir(), 'inventory-control-traces.jsonl'),
+)
+# Сколько завершенных трассировок ждет записи, прежде чем новые
+# начнут отбрасываться.
+TRACE_EXPORT_MAX_QUEUE_SIZE: Final = int(
+    os.environ.get('TRACE_EXPORT_MAX_QUEUE_SIZE', '1000'),
+)
+# Файл трассировок больше этого размера переименовывается
+# в TRACE_EXPORT_PATH.1, прежняя копия удаляется.
+TRACE_EXPORT_MAX_BYTES: Final = int(
+    os.environ.get('TRACE_EXPORT_MAX_BYTES', '67108864'),
+)
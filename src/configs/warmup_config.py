@@ -0,0 +1,20 @@
+import os
+from typing import Final, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def _parse_steps(raw_steps: Optional[str]) -> Optional[frozenset[str]]:
+    if raw_steps is None:
+        return None
+    return frozenset(
+        step.strip() for step in raw_steps.split(',') if step.strip()
+    )
+
+
+WARMUP_STEPS: Final = _parse_steps(os.environ.get('WARMUP_STEPS'))
+WARMUP_RETRY_INTERVAL_SECONDS: Final = float(
+    os.environ.get('WARMUP_RETRY_INTERVAL_SECONDS', '5'),
+)
@@ -0,0 +1,113 @@
+import os
+import tracemalloc
+from typing import Annotated, Final
+
+from fastapi import APIRouter, Depends, Query
+
+from src.auth.dependencies import require_admin
+from src.diagnostics.schemas import (
+    AllocationDiff,
+    MemoryReport,
+    MemoryTracingStatus,
+)
+from src.utils.memory_diagnostics import MEMORY_DIAGNOSTICS, GroupBy
+
+router = APIRouter(
+    prefix='/diagnostics/memory',
+    dependencies=[Depends(require_admin)],
+    include_in_schema=False,
+)
+
+_MAX_FRAMES: Final = 64
+_MAX_LIMIT: Final = 500
+
+
+def _tracing_status() -> dict:
+    traced_current, traced_peak = tracemalloc.get_traced_memory()
+    return {
+        'pid': os.getpid(),
+        'tracing': MEMORY_DIAGNOSTICS.tracing,
+        'traced_current': traced_current,
+        'traced_peak': traced_peak,
+    }
+
+
+def _allocation_diff(
+    statistic: tracemalloc.StatisticDiff,
+    group_by: GroupBy,
+) -> AllocationDiff:
+    frame = statistic.traceback[0]
+    location = frame.filename
+    if group_by == 'lineno':
+        location = '{0}:{1}'.format(frame.filename, frame.lineno)
+    return AllocationDiff(
+        location=location,
+        size_diff=statistic.size_diff,
+        size=statistic.size,
+        count_diff=statistic.count_diff,
+        count=statistic.count,
+    )
+
+
+@router.post('/tracing', response_model=MemoryTracingStatus)
+def start_tracing(
+    frames: Annotated[int, Query(ge=1, le=_MAX_FRAMES)] = 1,
+) -> MemoryTracingStatus:
+    """
+    Включает tracemalloc в воркере и делает исходный снимок.
+
+    Отслеживание замедляет выделение памяти, поэтому его следует
+    выключать после диагностики.
+
+    Args:
+        frames (int): Глубина стека, сохраняемая для выделения.
+
+    Returns:
+        MemoryTracingStatus: Состояние отслеживания памяти.
+    """
+    MEMORY_DIAGNOSTICS.start(frames)
+    return MemoryTracingStatus(**_tracing_status())
+
+
+@router.delete('/tracing', response_model=MemoryTracingStatus)
+def stop_tracing() -> MemoryTracingStatus:
+    """
+    Выключает tracemalloc в воркере.
+
+    Returns:
+        MemoryTracingStatus: Состояние отслеживания памяти.
+    """
+    MEMORY_DIAGNOSTICS.stop()
+    return MemoryTracingStatus(**_tracing_status())
+
+
+@router.get('/snapshot', response_model=MemoryReport)
+def memory_snapshot(
+    group_by: GroupBy = 'lineno',
+    limit: Annotated[int, Query(ge=1, le=_MAX_LIMIT)] = 20,
+) -> MemoryReport:
+    """
+    Возвращает отчет о памяти воркера, обработавшего запрос.
+
+    Рост памяти считается от предыдущего снимка, поэтому повторные
+    запросы показывают, что выросло между ними. Обработчик синхронный:
+    снимок и обход объектов выполняются в пуле потоков.
+
+    Args:
+        group_by (GroupBy): Группировка выделений по строке или по файлу.
+        limit (int): Количество мест выделения и типов объектов в отчете.
+
+    Returns:
+        MemoryReport: Рост памяти, статистика сборщика мусора
+        и количество объектов по типам.
+    """
+    top_allocations = [
+        _allocation_diff(statistic, group_by)
+        for statistic in MEMORY_DIAGNOSTICS.top_allocations(group_by, limit)
+    ]
+    return MemoryReport(
+        **_tracing_status(),
+        top_allocations=top_allocations,
+        gc_generations=MEMORY_DIAGNOSTICS.gc_generations(),
+        object_counts=MEMORY_DIAGNOSTICS.object_counts(limit),
+    )
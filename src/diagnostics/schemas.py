@@ -0,0 +1,53 @@
+from pydantic import BaseModel
+
+
+class AllocationDiff(BaseModel):
+    """
+    Класс для представления изменения памяти в месте выделения.
+
+    Attributes:
+        location (str): Файл или файл и строка, где выделена память.
+        size_diff (int): Рост объема с прошлого снимка в байтах.
+        size (int): Текущий объем в байтах.
+        count_diff (int): Рост числа блоков с прошлого снимка.
+        count (int): Текущее число блоков.
+    """
+
+    location: str
+    size_diff: int
+    size: int
+    count_diff: int
+    count: int
+
+
+class MemoryTracingStatus(BaseModel):
+    """
+    Класс для представления состояния отслеживания памяти воркера.
+
+    Attributes:
+        pid (int): Идентификатор процесса воркера.
+        tracing (bool): Включен ли tracemalloc.
+        traced_current (int): Объем отслеживаемой памяти в байтах.
+        traced_peak (int): Пиковый объем отслеживаемой памяти в байтах.
+    """
+
+    pid: int
+    tracing: bool
+    traced_current: int
+    traced_peak: int
+
+
+class MemoryReport(MemoryTracingStatus):
+    """
+    Класс для представления отчета о памяти воркера.
+
+    Attributes:
+        top_allocations (list[AllocationDiff]): Наибольший рост памяти
+        с прошлого снимка по местам выделения.
+        gc_generations (list[dict]): Статистика поколений сборщика мусора.
+        object_counts (dict[str, int]): Количество объектов по типам.
+    """
+
+    top_allocations: list[AllocationDiff]
+    gc_generations: list[dict]
+    object_counts: dict[str, int]
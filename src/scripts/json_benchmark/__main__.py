@@ -0,0 +1,87 @@
+import os
+import timeit
+import uuid
+from types import MappingProxyType
+from typing import Callable, Final
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from src.auth.models import UserRoles
+from src.auth.schemas.user import User
+from src.configs.logger_settings import logger
+from src.utils.json_response import SERIALIZERS
+
+_LABELS: Final = MappingProxyType(
+    {
+        'script': 'json_benchmark',
+    },
+)
+_US_IN_SECOND: Final = 1000000  # noqa: WPS432
+_DEFAULT_SIZES: Final = '1,10,100,1000,10000'
+_REPORT_TEMPLATE: Final = ' '.join((
+    '{0} пользователей, {1} байт:',
+    'jsonable_encoder + json {2:.1f} мкс,',
+    'TypeAdapter {3:.1f} мкс, ускорение {4:.1f}x',
+))
+
+
+def _users(count: int) -> list[User]:
+    return [
+        User(
+            user_id=uuid.uuid4(),
+            login='user{0}'.format(index),
+            name='Пользователь {0}'.format(index),
+            role=UserRoles.reader,
+        )
+        for index in range(count)
+    ]
+
+
+def _stdlib_render(users: list[User]) -> bytes:
+    return JSONResponse(jsonable_encoder(users)).body
+
+
+def _fast_render(users: list[User]) -> bytes:
+    return SERIALIZERS.dump(users)
+
+
+def _measure_us(render: Callable[[list[User]], bytes], users: list) -> float:
+    timer = timeit.Timer(lambda: render(users))
+    loops, _ = timer.autorange()
+    return min(timer.repeat(repeat=3, number=loops)) / loops * _US_IN_SECOND
+
+
+def _benchmark(sizes: list[int]) -> None:
+    SERIALIZERS.register(User)
+    for size in sizes:
+        users = _users(size)
+        stdlib_us = _measure_us(_stdlib_render, users)
+        fast_us = _measure_us(_fast_render, users)
+        logger.info(
+            _REPORT_TEMPLATE,
+            size,
+            len(_fast_render(users)),
+            stdlib_us,
+            fast_us,
+            stdlib_us / fast_us,
+            labels=_LABELS,
+        )
+
+
+def _main():
+    sizes = os.environ.get('JSON_BENCHMARK_SIZES', default=_DEFAULT_SIZES)
+    try:
+        _benchmark([int(size) for size in sizes.split(',')])
+    except Exception as ex:
+        logger.critical(
+            'You have done something wrong! {0}'.format(str(ex)),
+            labels=_LABELS,
+        )
+
+
+if __name__ == '__main__':
+    try:
+        _main()
+    except KeyboardInterrupt:
+        logger.critical('Shutting down, bye!')
@@ -0,0 +1,123 @@
+import cProfile
+import importlib
+import operator
+import os
+import pstats
+import subprocess  # noqa: S404
+import sys
+from types import MappingProxyType
+from typing import Final
+
+from src.configs.logger_settings import logger
+
+from .import_time import ImportTiming, parse_import_time
+
+_LABELS: Final = MappingProxyType(
+    {
+        'script': 'startup_profile',
+    },
+)
+_US_IN_MS: Final = 1000
+_MS_IN_SECOND: Final = 1000
+_FROZEN_FILE_PREFIX: Final = '<frozen'
+
+
+def _measure_import_time(target: str) -> list[ImportTiming]:
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, '-X', 'importtime', '-c', 'import {0}'.format(target)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_import_time(completed.stderr.splitlines())
+
+
+def _report_import_time(timings: list[ImportTiming], top: int) -> None:
+    logger.info(
+        'Импорт: {0} модулей за {1:.1f} мс',
+        len(timings),
+        sum(timing.self_us for timing in timings) / _US_IN_MS,
+        labels=_LABELS,
+    )
+    by_cumulative = sorted(
+        timings,
+        key=operator.attrgetter('cumulative_us'),
+        reverse=True,
+    )
+    for cumulative in by_cumulative[:top]:
+        logger.info(
+            'С вложенными импортами: {0:8.1f} мс  {1}',
+            cumulative.cumulative_us / _US_IN_MS,
+            cumulative.module,
+            labels=_LABELS,
+        )
+    by_self = sorted(
+        timings,
+        key=operator.attrgetter('self_us'),
+        reverse=True,
+    )
+    for own in by_self[:top]:
+        logger.info(
+            'Собственное время: {0:8.1f} мс  {1}',
+            own.self_us / _US_IN_MS,
+            own.module,
+            labels=_LABELS,
+        )
+
+
+def _top_functions(profile: cProfile.Profile, top: int) -> list[tuple]:
+    # Кадры механизма импорта включают все остальное и ничего не
+    # объясняют, поэтому функции сортируются по собственному времени.
+    stats = pstats.Stats(profile).stats  # type: ignore[attr-defined]
+    rows = [
+        (function_key, function_stats)
+        for function_key, function_stats in stats.items()
+        if not function_key[0].startswith(_FROZEN_FILE_PREFIX)
+    ]
+    rows.sort(key=lambda row: row[1][2], reverse=True)
+    return rows[:top]
+
+
+def _report_startup_functions(  # noqa: WPS210
+    target: str,
+    top: int,
+) -> None:
+    # Модули, уже загруженные этим скриптом (настройки логирования),
+    # в профиль функций не попадают; их видно в замерах импорта.
+    profile = cProfile.Profile()
+    profile.runcall(importlib.import_module, target)
+    top_functions = _top_functions(profile, top)
+    for (file_name, line, function), function_stats in top_functions:
+        logger.info(
+            'Функция: {0:8.1f} мс  {1} вызовов  {2}:{3}({4})',
+            function_stats[2] * _MS_IN_SECOND,
+            function_stats[1],
+            file_name,
+            line,
+            function,
+            labels=_LABELS,
+        )
+
+
+def _profile_startup(target: str, top: int) -> None:
+    _report_import_time(_measure_import_time(target), top)
+    _report_startup_functions(target, top)
+
+
+def _main():
+    target = os.environ.get('STARTUP_PROFILE_TARGET', default='src.api')
+    top = int(os.environ.get('STARTUP_PROFILE_TOP', default='15'))
+    try:
+        _profile_startup(target, top)
+    except Exception as ex:
+        logger.critical(
+            'You have done something wrong! {0}'.format(str(ex)),
+            labels=_LABELS,
+        )
+
+
+if __name__ == '__main__':
+    try:
+        _main()
+    except KeyboardInterrupt:
+        logger.critical('Shutting down, bye!')
@@ -0,0 +1,55 @@
+import re
+from dataclasses import dataclass
+from typing import Final, Iterable, Optional
+
+_IMPORT_TIME_LINE: Final = re.compile(
+    r'^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)$',
+)
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    """
+    Время импорта одного модуля.
+
+    Attributes:
+        module (str): Полное имя модуля.
+        self_us (int): Время выполнения самого модуля в микросекундах.
+        cumulative_us (int): Время вместе с вложенными импортами
+        в микросекундах.
+        depth (int): Глубина вложенности импорта.
+    """
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_import_time(lines: Iterable[str]) -> list[ImportTiming]:
+    """
+    Разбирает вывод интерпретатора, запущенного с флагом -X importtime.
+
+    Строки, не относящиеся к замерам, пропускаются.
+
+    Args:
+        lines (Iterable[str]): Строки stderr интерпретатора.
+
+    Returns:
+        list[ImportTiming]: Замеры в порядке завершения импорта.
+    """
+    timings = (_parse_line(line) for line in lines)
+    return [timing for timing in timings if timing is not None]
+
+
+def _parse_line(line: str) -> Optional[ImportTiming]:
+    match = _IMPORT_TIME_LINE.match(line)
+    if match is None:
+        return None
+    self_us, cumulative_us, indent, module = match.groups()
+    return ImportTiming(
+        module=module,
+        self_us=int(self_us),
+        cumulative_us=int(cumulative_us),
+        depth=(len(indent) - 1) // 2,
+    )
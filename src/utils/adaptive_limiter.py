@@ -0,0 +1,164 @@
+import asyncio
+import contextlib
+import time
+from dataclasses import dataclass
+from typing import Final
+
+_BACKOFF_RATIO: Final = 0.9
+# Лимит растет, только если он действительно используется,
+# иначе простаивающий сервис раздул бы его до максимума.
+_GROWTH_UTILIZATION: Final = 0.5
+
+
+@dataclass(frozen=True)
+class RouteClassPolicy:
+    """
+    Правила допуска для класса маршрутов.
+
+    Attributes:
+        share (float): Доля лимита, которую может занять класс.
+        Класс с большей долей получает освободившиеся места первым
+        и отклоняется последним.
+        queue_timeout (float): Сколько секунд запрос ждет места,
+        прежде чем получить отказ. 0 - отказ без ожидания.
+    """
+
+    share: float
+    queue_timeout: float
+
+
+class AdaptiveLimiter:  # noqa: WPS214
+    """
+    Адаптивный лимит одновременно обрабатываемых запросов (AIMD).
+
+    Пока запросы укладываются в целевую задержку, лимит растет
+    на 1 / limit за каждый завершенный запрос, то есть примерно на единицу
+    за цикл. Если задержка превышена, лимит умножается на 0.9, но не чаще
+    раза за целевую задержку, чтобы одна медленная волна не обнуляла его.
+
+    Ожидающие запросы получают освободившееся место по убыванию доли
+    их класса, внутри класса - в порядке очереди.
+
+    Attributes:
+        limit (int): Текущий лимит.
+        in_flight (int): Количество занятых мест.
+
+    Methods:
+        acquire: Занимает место, при необходимости ожидая его.
+        release: Освобождает место и корректирует лимит.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        target_latency: float,
+    ):
+        """
+        Инициализирует лимит.
+
+        Args:
+            initial_limit (int): Начальный лимит.
+            min_limit (int): Минимальный лимит.
+            max_limit (int): Максимальный лимит.
+            target_latency (float): Целевая длительность обработки в секундах.
+        """
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._target_latency = target_latency
+        self._last_backoff: float = 0
+        self._waiters: list[tuple[float, asyncio.Future]] = []
+        self.in_flight = 0
+
+    @property
+    def limit(self) -> int:
+        """
+        Возвращает текущий лимит.
+
+        Returns:
+            int: Текущий лимит.
+        """
+        return int(self._limit)
+
+    async def acquire(self, policy: RouteClassPolicy) -> bool:
+        """
+        Занимает место, при необходимости ожидая его.
+
+        Args:
+            policy (RouteClassPolicy): Правила класса маршрута.
+
+        Returns:
+            bool: True, если место занято, False, если запрос нужно отклонить.
+
+        Raises:
+            CancelledError: Если ожидание отменено.
+        """
+        if self._try_acquire(policy.share):
+            return True
+        if policy.queue_timeout <= 0:
+            return False
+        return await self._wait(policy)
+
+    def release(self, latency: float) -> None:
+        """
+        Освобождает место и корректирует лимит.
+
+        Args:
+            latency (float): Длительность обработки запроса в секундах.
+        """
+        self._adjust(latency)
+        self._free_slot()
+
+    async def _wait(self, policy: RouteClassPolicy) -> bool:
+        waiter = asyncio.get_running_loop().create_future()
+        waiter_entry = (policy.share, waiter)
+        self._waiters.append(waiter_entry)
+        try:
+            await asyncio.wait_for(waiter, policy.queue_timeout)
+        except asyncio.TimeoutError:
+            # Место могло быть передано одновременно с истечением ожидания:
+            # тогда оно уже занято этим запросом.
+            return waiter.done() and not waiter.cancelled()
+        except asyncio.CancelledError:
+            # Место могло быть передано одновременно с отменой.
+            if waiter.done() and not waiter.cancelled():
+                self._free_slot()
+            raise
+        finally:
+            with contextlib.suppress(ValueError):
+                self._waiters.remove(waiter_entry)
+        return True
+
+    def _try_acquire(self, share: float) -> bool:
+        if self.in_flight >= max(1, int(self._limit * share)):
+            return False
+        self.in_flight += 1
+        return True
+
+    def _free_slot(self) -> None:
+        self.in_flight -= 1
+        waiters = sorted(
+            self._waiters,
+            key=lambda waiter_entry: waiter_entry[0],
+            reverse=True,
+        )
+        for share, waiter in waiters:
+            if waiter.done():
+                continue
+            if not self._try_acquire(share):
+                return
+            waiter.set_result(None)
+
+    def _adjust(self, latency: float) -> None:
+        if latency > self._target_latency:
+            now = time.monotonic()
+            if now - self._last_backoff >= self._target_latency:
+                self._last_backoff = now
+                self._limit = max(
+                    self._min_limit,
+                    self._limit * _BACKOFF_RATIO,
+                )
+        elif self.in_flight >= self._limit * _GROWTH_UTILIZATION:
+            self._limit = min(self._max_limit, self._limit + 1 / self._limit)
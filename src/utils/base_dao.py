@@ -1,5 +1,6 @@
 from typing import Any, Dict, Generic, List, Optional, Sequence, TypeVar, Union
 
+import sqlalchemy as sa
 from pydantic import BaseModel
 from sqlalchemy import delete, func, insert, select, update
 from sqlalchemy.exc import SQLAlchemyError
@@ -25,6 +26,8 @@ class BaseDAO(   # noqa: WPS214
 
     Attributes:
         model: Класс модели данных SQLAlchemy.
+        version_column: Столбец версии строки, например updated_at.
+        Если не задан, версия строится по системному столбцу xmin.
 
     Methods:
         find_one_or_none: Асинхронно находит одну запись
@@ -33,6 +36,8 @@ class BaseDAO(   # noqa: WPS214
         или None, если возникла ошибка.
         count: Асинхронно подсчитывает количество записей по заданным фильтрам
         или None, если возникла ошибка.
+        version: Асинхронно вычисляет версию набора записей по заданным
+        фильтрам или None, если возникла ошибка.
         add: Асинхронно добавляет новую запись в базу данных.
         delete: Асинхронно удаляет записи из базы данных по заданным фильтрам.
         update: Асинхронно обновляет запись в базе данных.
@@ -44,6 +49,7 @@ class BaseDAO(   # noqa: WPS214
     """
 
     model = None
+    version_column = None
 
     @classmethod
     async def find_one_or_none(
@@ -158,6 +164,41 @@ class BaseDAO(   # noqa: WPS214
             )
         return query_result.scalar()
 
+    @classmethod
+    async def version(
+        cls,
+        session: AsyncSession,
+        *filters,
+        **filters_by,
+    ) -> Optional[str]:
+        """
+        Вычисляет версию набора записей по заданным фильтрам.
+
+        Версия состоит из числа записей и агрегата версий строк,
+        поэтому меняется при добавлении, изменении и удалении записей.
+        Выполняется один агрегатный запрос, записи не загружаются.
+
+        Args:
+            session (AsyncSession): Асинхронная сессия базы данных.
+            filters: Фильтры для метода filter.
+            filters_by: Фильтры для метода filter_by.
+
+        Returns:
+            Optional[str]: Версия набора записей или None в случае ошибки.
+        """
+        query = cls._version_query(*filters, **filters_by)
+        try:
+            query_result = await execute_query(session, query)
+        except Exception as ex:
+            return cls._log_error(
+                'version',
+                ex,
+                filters=filters,
+                filters_by=filters_by,
+            )
+        row_count, row_version = query_result.one()
+        return '{0}:{1}'.format(row_count, row_version)
+
     @classmethod
     async def add(
         cls,
@@ -323,6 +364,31 @@ class BaseDAO(   # noqa: WPS214
             )
         return query_result.scalars().all()
 
+    @classmethod
+    def _version_query(cls, *filters, **filters_by) -> Select:
+        return (
+            select(func.count(), cls._row_version_aggregate()).
+            select_from(cls.model).
+            filter(*filters).
+            filter_by(**filters_by)
+        )
+
+    @classmethod
+    def _row_version_aggregate(cls):
+        if cls.version_column is not None:
+            return func.max(cls.version_column)
+        # xmin - номер транзакции, последней изменившей строку. Для xid
+        # нет агрегата max, поэтому номер приводится к bigint через text.
+        # Изменение или добавление строки увеличивает максимум, удаление
+        # меняет число записей; сортировка строк не нужна. После
+        # переполнения счетчика транзакций версия может один раз
+        # не измениться, для частых запросов лучше задать version_column.
+        xmin = sa.literal_column(
+            '{0}.xmin'.format(cls.model.__tablename__),
+        )
+        xmin_text = sa.cast(xmin, sa.Text)
+        return func.max(sa.cast(xmin_text, sa.BigInteger))
+
     @classmethod
     def _log_error(
         cls,
@@ -354,7 +420,10 @@ class BaseDAO(   # noqa: WPS214
 
         log_message = ' '.join(message_parts)
 
+        # Сообщение передается аргументом: фильтры могут содержать
+        # фигурные скобки, которые loguru принял бы за поля формата.
         logger.error(
+            '{0}',
             log_message,
             exc_info=True,
             labels=labels,
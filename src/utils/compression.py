@@ -0,0 +1,214 @@
+from typing import Final, Mapping, Optional, Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from src.configs.compression_config import (
+    COMPRESSION_CONTENT_TYPES,
+    COMPRESSION_ENCODINGS,
+)
+from src.utils.compressors import COMPRESSORS, Compressor
+
+_BODY_MESSAGE: Final = 'http.response.body'
+_START_MESSAGE: Final = 'http.response.start'
+_ANY_ENCODING: Final = '*'
+_TYPE: Final = 'type'
+_BODY: Final = 'body'
+_MORE_BODY: Final = 'more_body'
+_NO_BODY_STATUSES: Final = frozenset((204, 304))
+_PARTIAL_CONTENT_STATUS: Final = 206
+_MIN_SUCCESS_STATUS: Final = 200
+
+
+def negotiate_encoding(
+    accept_encoding: str,
+    encodings: Sequence[str],
+) -> Optional[str]:
+    """
+    Выбирает кодировку сжатия по заголовку Accept-Encoding.
+
+    Побеждает кодировка с наибольшим весом q, при равных весах -
+    первая в порядке предпочтения сервера.
+
+    Args:
+        accept_encoding (str): Значение заголовка Accept-Encoding.
+        encodings (Sequence[str]): Кодировки сервера в порядке предпочтения.
+
+    Returns:
+        Optional[str]: Выбранная кодировка или None, если сжимать нельзя.
+    """
+    weights = _parse_accept_encoding(accept_encoding)
+    default_weight = weights.get(_ANY_ENCODING, 0)
+    acceptable = [
+        encoding
+        for encoding in encodings
+        if weights.get(encoding, default_weight) > 0
+    ]
+    if not acceptable:
+        return None
+    # max возвращает первый из равных, то есть предпочтение сервера.
+    return max(
+        acceptable,
+        key=lambda encoding: weights.get(encoding, default_weight),
+    )
+
+
+def _parse_accept_encoding(accept_encoding: str) -> dict[str, float]:
+    weights = {}
+    for accepted in accept_encoding.lower().split(','):
+        name, _, directives = accepted.partition(';')
+        weights[name.strip()] = _parse_weight(directives)
+    return weights
+
+
+def _parse_weight(directives: str) -> float:
+    for directive in directives.split(';'):
+        key, _, weight = directive.strip().partition('=')
+        if key == 'q':
+            try:
+                return float(weight)
+            except ValueError:
+                return 0
+    return 1
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware, сжимающий тела ответов.
+
+    Кодировка выбирается по Accept-Encoding среди gzip, br и zstd.
+    Сжимаются только ответы с типами содержимого из правил и не меньше
+    минимального размера. Потоковые ответы сжимаются по частям без
+    накопления тела, каждая часть сразу выталкивается клиенту.
+
+    Vary: Accept-Encoding добавляется ко всем ответам с подходящим типом
+    содержимого, в том числе к несжатым, чтобы общий кэш не отдавал
+    несжатую копию клиентам, поддерживающим сжатие. Ответы на запросы
+    диапазонов (206, Content-Range) не сжимаются: диапазон задан в байтах
+    исходного тела.
+    """
+
+    def __init__(
+        self,
+        app,
+        encodings: Sequence[str] = COMPRESSION_ENCODINGS,
+        content_types: Mapping[str, int] = COMPRESSION_CONTENT_TYPES,
+    ):
+        """
+        Инициализирует middleware.
+
+        Args:
+            app: Оборачиваемое ASGI-приложение.
+            encodings (Sequence[str]): Кодировки в порядке предпочтения.
+            Недоступные в окружении кодировки пропускаются.
+            content_types (Mapping[str, int]): Минимальный размер тела
+            для префиксов типов содержимого.
+        """
+        self._app = app
+        self._encodings = tuple(
+            encoding for encoding in encodings if encoding in COMPRESSORS
+        )
+        self._content_types = content_types
+
+    async def __call__(self, scope, receive, send):
+        """
+        Обрабатывает ASGI-вызов.
+
+        Args:
+            scope: ASGI scope.
+            receive: ASGI receive.
+            send: ASGI send.
+        """
+        if scope['type'] != 'http':
+            await self._app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(
+            Headers(scope=scope).get('accept-encoding', ''),
+            self._encodings,
+        )
+        responder = _CompressionResponder(send, encoding, self._content_types)
+        await self._app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(
+        self,
+        send,
+        encoding: Optional[str],
+        content_types: Mapping[str, int],
+    ):
+        self._send = send
+        self._encoding = encoding
+        self._content_types = content_types
+        self._start_message: Optional[dict] = None
+        self._compressor: Optional[Compressor] = None
+
+    async def send(self, message) -> None:
+        if message[_TYPE] == _START_MESSAGE:
+            self._start_message = message
+        elif self._start_message is not None:
+            await self._send_first_body(message)
+        elif self._compressor is not None:
+            await self._send_compressed(message)
+        else:
+            await self._send(message)
+
+    async def _send_first_body(self, message) -> None:
+        start_message = self._start_message
+        self._start_message = None
+        headers = MutableHeaders(scope=start_message)
+        min_size = self._min_size(start_message['status'], headers)
+        if min_size is not None:
+            headers.add_vary_header('Accept-Encoding')
+        if not self._should_compress(min_size, headers, message):
+            await self._send(start_message)
+            await self._send(message)
+            return
+        self._compressor = COMPRESSORS[self._encoding]()
+        del headers['content-length']  # noqa: WPS420
+        headers['content-encoding'] = self._encoding
+        compressed_message = self._compress(message)
+        if not message.get(_MORE_BODY, False):
+            headers['content-length'] = str(len(compressed_message[_BODY]))
+        await self._send(start_message)
+        await self._send(compressed_message)
+
+    async def _send_compressed(self, message) -> None:
+        await self._send(self._compress(message))
+
+    def _compress(self, message) -> dict:
+        body = message.get(_BODY, b'')
+        more_body = message.get(_MORE_BODY, False)
+        compressed = self._compressor.compress(body) if body else b''
+        if not more_body:
+            compressed += self._compressor.finish()
+        elif body:
+            compressed += self._compressor.flush()
+        return {_TYPE: _BODY_MESSAGE, _BODY: compressed, _MORE_BODY: more_body}
+
+    def _should_compress(
+        self,
+        min_size: Optional[int],
+        headers: Headers,
+        message,
+    ) -> bool:
+        if self._encoding is None or min_size is None:
+            return False
+        if message[_TYPE] != _BODY_MESSAGE:
+            return False
+        if not message.get(_MORE_BODY, False):
+            return len(message.get(_BODY, b'')) >= min_size
+        content_length = headers.get('content-length')
+        return content_length is None or int(content_length) >= min_size
+
+    def _min_size(self, status: int, headers: Headers) -> Optional[int]:
+        if status < _MIN_SUCCESS_STATUS or status in _NO_BODY_STATUSES:
+            return None
+        if status == _PARTIAL_CONTENT_STATUS:
+            return None
+        if 'content-encoding' in headers or 'content-range' in headers:
+            return None
+        content_type = headers.get('content-type', '').partition(';')[0]
+        for prefix, min_size in self._content_types.items():
+            if content_type.startswith(prefix):
+                return min_size
+        return None
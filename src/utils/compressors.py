@@ -0,0 +1,113 @@
+import zlib
+from types import MappingProxyType
+from typing import Callable, Final, Protocol
+
+from src.configs.compression_config import (
+    COMPRESSION_BROTLI_QUALITY,
+    COMPRESSION_GZIP_LEVEL,
+    COMPRESSION_ZSTD_LEVEL,
+)
+
+try:
+    import brotli  # noqa: WPS433
+except ImportError:  # pragma: no cover
+    brotli = None  # noqa: WPS440
+
+try:
+    import zstandard  # noqa: WPS433
+except ImportError:  # pragma: no cover
+    zstandard = None  # noqa: WPS440
+
+# Смещение окна zlib, при котором поток оформляется как gzip.
+_GZIP_WBITS: Final = 16 + zlib.MAX_WBITS  # noqa: WPS432
+
+
+class Compressor(Protocol):
+    """
+    Потоковый компрессор тела ответа.
+
+    Methods:
+        compress: Сжимает очередную часть тела.
+        flush: Выталкивает накопленные данные, не завершая поток.
+        finish: Завершает поток.
+    """
+
+    def compress(self, chunk: bytes) -> bytes:
+        """
+        Сжимает очередную часть тела.
+
+        Args:
+            chunk (bytes): Часть тела ответа.
+        """
+
+    def flush(self) -> bytes:
+        """Выталкивает накопленные данные, не завершая поток."""
+
+    def finish(self) -> bytes:
+        """Завершает поток."""
+
+
+class _GzipCompressor:
+    def __init__(self):
+        self._compressor = zlib.compressobj(
+            COMPRESSION_GZIP_LEVEL,
+            zlib.DEFLATED,
+            _GZIP_WBITS,
+        )
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compressor.compress(chunk)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliCompressor:
+    def __init__(self):
+        self._compressor = brotli.Compressor(
+            quality=COMPRESSION_BROTLI_QUALITY,
+        )
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compressor.process(chunk)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _ZstdCompressor:
+    def __init__(self):
+        self._compressor = zstandard.ZstdCompressor(
+            level=COMPRESSION_ZSTD_LEVEL,
+        ).compressobj()
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compressor.compress(chunk)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+def _available_compressors() -> dict[str, Callable[[], Compressor]]:
+    compressors: dict[str, Callable[[], Compressor]] = {
+        'gzip': _GzipCompressor,
+    }
+    if brotli is not None:
+        compressors['br'] = _BrotliCompressor
+    if zstandard is not None:
+        compressors['zstd'] = _ZstdCompressor
+    return compressors
+
+
+# brotli и zstandard - необязательные зависимости (extra compression).
+# Без них сервер предлагает только gzip.
+COMPRESSORS: Final = MappingProxyType(_available_compressors())
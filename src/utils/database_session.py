@@ -1,7 +1,11 @@
+import asyncio
 import contextlib
+import functools
 from typing import AsyncGenerator, Callable, Final
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
@@ -9,18 +13,58 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.pool import NullPool
 
-from src.configs.db_config import ASYNC_POSTGRES_URL
+from src.configs.db_config import (
+    ASYNC_POSTGRES_URL,
+    DB_MAX_OVERFLOW,
+    DB_POOL_SIZE,
+    DB_STATEMENT_TIMEOUT_MS,
+)
 from src.configs.logger_settings.logger_config import logger
+from src.utils.deadline import SESSION_DEADLINE_KEY, current_deadline
+from src.utils.metrics import instrument_engine
+from src.utils.warmup import WARM_UP
 
 BASE: Final = declarative_base()
 
-ENGINE: Final = create_async_engine(ASYNC_POSTGRES_URL, poolclass=NullPool)
 
-ASYNC_SESSION_MAKER: Final = async_sessionmaker(
-    ENGINE,
-    class_=AsyncSession,
-    expire_on_commit=False,
-)
+def _pool_options() -> dict:
+    # DB_POOL_SIZE=0 отключает пул: каждое обращение открывает
+    # новое соединение.
+    if not DB_POOL_SIZE:
+        return {'poolclass': NullPool}
+    return {'pool_size': DB_POOL_SIZE, 'max_overflow': DB_MAX_OVERFLOW}
+
+
+@functools.cache
+def get_engine() -> AsyncEngine:
+    """
+    Возвращает общий асинхронный движок базы данных.
+
+    Движок и драйвер создаются при первом обращении, а не при импорте.
+
+    Returns:
+        AsyncEngine: Асинхронный движок SQLAlchemy.
+    """
+    engine = create_async_engine(
+        ASYNC_POSTGRES_URL,
+        connect_args={
+            'server_settings': {
+                'statement_timeout': str(DB_STATEMENT_TIMEOUT_MS),
+            },
+        },
+        **_pool_options(),
+    )
+    instrument_engine(engine)
+    return engine
+
+
+@functools.cache
+def _get_session_maker() -> async_sessionmaker:
+    return async_sessionmaker(
+        get_engine(),
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
 
 
 async def session_connect(func: Callable, *args, **kwargs) -> Callable:
@@ -46,11 +90,15 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     """
     Asynchronously yield an SQLAlchemy AsyncSession.
 
+    The session carries the deadline of the current request, which
+    execute_query applies as statement_timeout.
+
     Yields:
         AsyncSession: An asynchronous SQLAlchemy session.
     """
+    session_info = {SESSION_DEADLINE_KEY: current_deadline()}
     try:
-        async with ASYNC_SESSION_MAKER() as session:
+        async with _get_session_maker()(info=session_info) as session:
             yield session
     except Exception as ex:
         logger.exception(
@@ -59,3 +107,25 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
             ),
         )
         raise
+
+
+async def open_database_pool() -> None:
+    """
+    Открывает все постоянные соединения пула.
+
+    Соединения открываются одновременно и удерживаются до открытия
+    последнего, поэтому пул заполняется целиком. На каждом соединении
+    выполняется запрос, завершающий настройку соединения драйвером.
+    """
+    async with contextlib.AsyncExitStack() as stack:
+        connections = await asyncio.gather(
+            *(
+                stack.enter_async_context(get_engine().connect())
+                for _ in range(max(DB_POOL_SIZE, 1))
+            ),
+        )
+        for connection in connections:
+            await connection.execute(text('SELECT 1'))
+
+
+WARM_UP.register('db_pool', open_database_pool, required=True)
@@ -1,9 +1,28 @@
-from typing import Any, Dict, List, Optional, Union
+import asyncio
+import contextlib
+import time
+from typing import Any, Dict, Final, Iterator, List, Optional, Union
 
-from sqlalchemy import CursorResult, Result
+from sqlalchemy import CursorResult, Result, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import Delete, Insert, Select, Update
 
+from src.configs.db_config import DB_STATEMENT_TIMEOUT_MS
+from src.utils.deadline import SESSION_DEADLINE_KEY, remaining_ms
+from src.utils.metrics import DB_QUERY_DURATION
+from src.utils.tracing import start_span
+
+# Таймаут действует до конца транзакции запроса. Запас нужен, чтобы
+# по сроку сначала срабатывала отмена задачи, а таймаут сервера
+# оставался страховкой на случай, если команда отмены не дошла.
+# Если остаток срока не меньше statement_timeout соединения
+# (DB_STATEMENT_TIMEOUT_MS), страховкой служит он и лишний запрос
+# к базе данных не выполняется.
+_SET_STATEMENT_TIMEOUT: Final = text(
+    "SELECT set_config('statement_timeout', :timeout, true)",
+)
+_STATEMENT_TIMEOUT_GRACE_MS: Final = 250
+
 
 async def execute_query(
     session: AsyncSession,
@@ -21,6 +40,56 @@ async def execute_query(
     Returns:
         Optional[Result | CursorResult]: Результат выполнения запроса.
     """
-    async with session.begin():
-        query_result = await session.execute(query, data_in)
+    deadline_ms = remaining_ms(session.info.get(SESSION_DEADLINE_KEY))
+    table_name = _table_name(query)
+    statement = query.__visit_name__
+    with _observe_query(table_name, statement):
+        with start_span('db.{0}'.format(statement), table=table_name):
+            async with session.begin():
+                if _needs_statement_timeout(deadline_ms):
+                    await _set_statement_timeout(session, deadline_ms)
+                query_result = await session.execute(query, data_in)
     return query_result
+
+
+@contextlib.contextmanager
+def _observe_query(table_name: str, statement: str) -> Iterator[None]:
+    # Длительность записывается и для неудачных и отмененных запросов:
+    # иначе медленные запросы, упавшие по таймауту, не видны в метрике.
+    started_at = time.perf_counter()
+    outcome = 'ok'
+    try:
+        yield
+    except asyncio.CancelledError:
+        outcome = 'cancelled'
+        raise
+    except Exception:
+        outcome = 'error'
+        raise
+    finally:
+        DB_QUERY_DURATION.labels(table_name, statement, outcome).observe(
+            time.perf_counter() - started_at,
+        )
+
+
+def _needs_statement_timeout(deadline_ms: Optional[int]) -> bool:
+    if deadline_ms is None:
+        return False
+    return deadline_ms + _STATEMENT_TIMEOUT_GRACE_MS < DB_STATEMENT_TIMEOUT_MS
+
+
+async def _set_statement_timeout(
+    session: AsyncSession,
+    deadline_ms: int,
+) -> None:
+    await session.execute(
+        _SET_STATEMENT_TIMEOUT,
+        {'timeout': '{0}ms'.format(deadline_ms + _STATEMENT_TIMEOUT_GRACE_MS)},
+    )
+
+
+def _table_name(query: Union[Select, Insert, Delete, Update]) -> str:
+    if isinstance(query, Select):
+        froms = query.get_final_froms()
+        return getattr(froms[0], 'name', 'unknown') if froms else 'unknown'
+    return query.table.name
@@ -0,0 +1,225 @@
+import asyncio
+import contextlib
+import math
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Final, Mapping, Optional
+
+from fastapi import status
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+
+from src.configs.deadline_config import (
+    REQUEST_DEFAULT_TIMEOUT_SECONDS,
+    REQUEST_MAX_TIMEOUT_SECONDS,
+    REQUEST_ROUTE_TIMEOUTS,
+    REQUEST_TIMEOUT_HEADER,
+)
+from src.utils.metrics import HTTP_REQUESTS_ABANDONED
+
+_MS_IN_SECOND: Final = 1000
+# Ключ session.info, под которым сессия хранит срок запроса.
+SESSION_DEADLINE_KEY: Final = 'deadline'
+_TYPE: Final = 'type'
+_MORE_BODY: Final = 'more_body'
+
+_deadline: ContextVar[Optional[float]] = ContextVar(
+    'request_deadline',
+    default=None,
+)
+
+
+def current_deadline() -> Optional[float]:
+    """
+    Возвращает срок обработки текущего запроса.
+
+    Returns:
+        Optional[float]: Момент по часам time.monotonic, к которому запрос
+        должен быть обработан, или None вне HTTP-запроса.
+    """
+    return _deadline.get()
+
+
+def remaining_ms(deadline: Optional[float]) -> Optional[int]:
+    """
+    Возвращает остаток срока в миллисекундах.
+
+    Args:
+        deadline (Optional[float]): Срок по часам time.monotonic.
+
+    Returns:
+        Optional[int]: Остаток срока не меньше 1 мс или None без срока.
+    """
+    if deadline is None:
+        return None
+    remaining = (deadline - time.monotonic()) * _MS_IN_SECOND
+    return max(1, math.ceil(remaining))
+
+
+class DeadlineMiddleware:
+    """
+    ASGI middleware, ограничивающий время обработки запроса.
+
+    Срок берется из заголовка REQUEST_TIMEOUT_HEADER (не больше
+    REQUEST_MAX_TIMEOUT_SECONDS) или из срока маршрута по умолчанию
+    и доступен через current_deadline. Обработка отменяется, если клиент
+    отключился или срок истек до начала ответа; во втором случае клиент
+    получает 504. Начатый ответ, например потоковый, по сроку
+    не прерывается. Отмена задачи прерывает и запрос asyncpg, который
+    отправляет PostgreSQL команду отмены.
+
+    Отключение клиента замечается только после того, как приложение
+    прочитало тело запроса: middleware не читает тело за приложение,
+    чтобы не держать загрузки в памяти. Запрос с телом, обработчик
+    которого тело не читает, при отключении клиента не отменяется
+    и ограничен только сроком.
+    """
+
+    def __init__(
+        self,
+        app,
+        default_timeout: float = REQUEST_DEFAULT_TIMEOUT_SECONDS,
+        route_timeouts: Mapping[str, float] = REQUEST_ROUTE_TIMEOUTS,
+    ):
+        """
+        Инициализирует middleware.
+
+        Args:
+            app: Оборачиваемое ASGI-приложение.
+            default_timeout (float): Срок обработки по умолчанию в секундах.
+            route_timeouts (Mapping[str, float]): Сроки по префиксам путей.
+        """
+        self._app = app
+        self._default_timeout = default_timeout
+        self._route_timeouts = sorted(
+            route_timeouts.items(),
+            key=lambda route_rule: len(route_rule[0]),
+            reverse=True,
+        )
+        self._timeout_response = JSONResponse(
+            {'detail': 'Истек срок обработки запроса'},
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        )
+
+    async def __call__(self, scope, receive, send):
+        """
+        Обрабатывает ASGI-вызов.
+
+        Args:
+            scope: ASGI scope.
+            receive: ASGI receive.
+            send: ASGI send.
+        """
+        if scope[_TYPE] != 'http':
+            await self._app(scope, receive, send)
+            return
+        timeout = self._timeout(scope)
+        token = _deadline.set(time.monotonic() + timeout)
+        try:  # noqa: WPS501
+            await self._run(scope, receive, send, timeout)
+        finally:
+            _deadline.reset(token)
+
+    async def _run(self, scope, receive, send, timeout: float) -> None:
+        client = _ClientConnection(scope, receive, send)
+        app_task = asyncio.create_task(
+            self._app(scope, client.receive, client.send),
+        )
+        watch_task = asyncio.create_task(client.watch(app_task))
+        try:  # noqa: WPS501
+            done = await _wait_for_app(app_task, client, timeout)
+        finally:
+            watch_task.cancel()
+            app_task.cancel()
+        if done:
+            if app_task.cancelled():
+                HTTP_REQUESTS_ABANDONED.labels('disconnect').inc()
+                return
+            app_task.result()
+            return
+        HTTP_REQUESTS_ABANDONED.labels('deadline').inc()
+        with contextlib.suppress(asyncio.CancelledError):
+            await app_task
+        if not client.response_started:
+            await self._timeout_response(scope, receive, send)
+
+    def _timeout(self, scope) -> float:
+        header_timeout = Headers(scope=scope).get(REQUEST_TIMEOUT_HEADER)
+        if header_timeout is not None:
+            with contextlib.suppress(ValueError):
+                return min(
+                    max(float(header_timeout), 1) / _MS_IN_SECOND,
+                    REQUEST_MAX_TIMEOUT_SECONDS,
+                )
+        path = scope['path']
+        for prefix, route_timeout in self._route_timeouts:
+            if path.startswith(prefix):
+                return route_timeout
+        return self._default_timeout
+
+
+class _ClientConnection:
+    """
+    Следит за отключением клиента, не отнимая сообщения у приложения.
+
+    Ожидание отключения начинается после того, как тело запроса прочитано.
+    Сообщения, полученные наблюдателем раньше приложения, отдаются
+    приложению при следующем вызове receive.
+    """
+
+    def __init__(self, scope, receive, send):
+        self._receive = receive
+        self._send = send
+        self._pending: deque = deque()
+        self._body_received = asyncio.Event()
+        self._response_complete = False
+        self.response_started = False
+        if not _has_body(scope):
+            self._body_received.set()
+
+    async def receive(self):
+        if self._pending:
+            return self._pending.popleft()
+        message = await self._receive()
+        if message[_TYPE] == 'http.request' and not message.get(_MORE_BODY):
+            self._body_received.set()
+        return message
+
+    async def send(self, message) -> None:
+        if message[_TYPE] == 'http.response.start':
+            self.response_started = True
+        elif not message.get(_MORE_BODY):
+            self._response_complete = True
+        await self._send(message)
+
+    async def watch(self, app_task: asyncio.Task) -> None:
+        await self._body_received.wait()
+        message = await self._receive()
+        while message[_TYPE] != 'http.disconnect':
+            self._pending.append(message)
+            message = await self._receive()
+        # После полного ответа отключение штатное, а приложение
+        # может еще выполнять фоновые задачи.
+        if not self._response_complete:
+            app_task.cancel()
+
+
+async def _wait_for_app(
+    app_task: asyncio.Task,
+    client: _ClientConnection,
+    timeout: float,
+) -> bool:
+    done, _ = await asyncio.wait({app_task}, timeout=timeout)
+    if not done and client.response_started:
+        # Клиент уже получает ответ: обрыв на середине хуже медленного
+        # ответа, прервать его может только отключение.
+        done, _ = await asyncio.wait({app_task})
+    return bool(done)
+
+
+def _has_body(scope) -> bool:
+    headers = Headers(scope=scope)
+    if 'transfer-encoding' in headers:
+        return True
+    return headers.get('content-length', '0') != '0'
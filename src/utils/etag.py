@@ -0,0 +1,102 @@
+import hashlib
+from typing import Final, Optional
+
+from fastapi import HTTPException, Request, Response, status
+
+_WEAK_PREFIX: Final = 'W/'
+_ANY_ETAG: Final = '*'
+_DIGEST_SIZE: Final = 12
+
+
+class NotModifiedError(HTTPException):
+    """
+    Исключение, прерывающее обработку, если у клиента актуальная версия.
+
+    FastAPI отвечает на него статусом 304 без тела.
+
+    Attributes:
+        status_code (int): HTTP-статус код (304).
+        headers (dict): Заголовок ETag текущей версии.
+    """
+
+    def __init__(self, etag: str):
+        """
+        Инициализирует экземпляр исключения NotModifiedError.
+
+        Args:
+            etag (str): ETag текущей версии ресурса.
+        """
+        super().__init__(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={'ETag': etag},
+        )
+
+
+def make_weak_etag(*parts: object) -> str:
+    """
+    Строит слабый ETag из частей версии ресурса.
+
+    Args:
+        parts (object): Части версии, например путь, параметры запроса
+        и версия набора записей.
+
+    Returns:
+        str: Слабый ETag вида W/"...".
+    """
+    digest = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+    for part in parts:
+        digest.update(str(part).encode())
+        digest.update(b'\0')
+    return '{0}"{1}"'.format(_WEAK_PREFIX, digest.hexdigest())
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Проверяет заголовок If-None-Match слабым сравнением.
+
+    Args:
+        if_none_match (str): Значение заголовка If-None-Match.
+        etag (str): ETag текущей версии.
+
+    Returns:
+        bool: True, если клиент уже получил текущую версию.
+    """
+    opaque_tag = etag.removeprefix(_WEAK_PREFIX)
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate == _ANY_ETAG:
+            return True
+        if candidate.removeprefix(_WEAK_PREFIX) == opaque_tag:
+            return True
+    return False
+
+
+def check_not_modified(
+    request: Request,
+    response: Response,
+    version: Optional[str],
+) -> None:
+    """
+    Отвечает 304, если у клиента актуальная версия ресурса.
+
+    Вызывается в обработчике GET до загрузки и сериализации данных.
+    Версию дает дешевый агрегатный запрос, например BaseDAO.version.
+    ETag учитывает путь и параметры запроса, поэтому разные страницы
+    и фильтры одного списка получают разные ETag.
+
+    Args:
+        request (Request): Текущий запрос.
+        response (Response): Ответ, в который записывается заголовок ETag.
+        version (Optional[str]): Версия данных ресурса. None означает,
+        что версия неизвестна, и ответ отдается без ETag.
+
+    Raises:
+        NotModifiedError: Если If-None-Match совпадает с текущим ETag.
+    """
+    if version is None:
+        return
+    etag = make_weak_etag(request.url.path, request.url.query, version)
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match is not None and etag_matches(if_none_match, etag):
+        raise NotModifiedError(etag)
+    response.headers['ETag'] = etag
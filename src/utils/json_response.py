@@ -0,0 +1,112 @@
+from decimal import Decimal
+from typing import Any, Final, Optional
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+
+class JsonSerializers:
+    """
+    Заранее построенные сериализаторы схем ответов.
+
+    Для каждой зарегистрированной схемы хранятся TypeAdapter самой схемы
+    и списка ее экземпляров, чтобы ответ сериализовался сразу в байты
+    без промежуточного словаря. Остальное содержимое сериализуется
+    через orjson так же, как его сериализовал бы jsonable_encoder:
+    Decimal становится числом, нестроковые ключи словарей - строками.
+
+    Methods:
+        register: Строит сериализаторы для схем.
+        dump: Сериализует содержимое ответа в JSON.
+    """
+
+    def __init__(self):
+        """Инициализирует пустой реестр сериализаторов."""
+        self._adapters: dict[type, TypeAdapter] = {}
+        self._list_adapters: dict[type, TypeAdapter] = {}
+
+    def register(self, *model_types: type) -> None:
+        """
+        Строит сериализаторы для схем.
+
+        Args:
+            model_types (type): Схемы ответов.
+        """
+        for model_type in model_types:
+            self._adapters[model_type] = TypeAdapter(model_type)
+            self._list_adapters[model_type] = TypeAdapter(list[model_type])
+
+    def dump(self, payload: Any) -> bytes:
+        """
+        Сериализует содержимое ответа в JSON.
+
+        Args:
+            payload (Any): Содержимое ответа.
+
+        Returns:
+            bytes: JSON в кодировке UTF-8.
+        """
+        adapter = self._adapter_for(payload)
+        if adapter is not None:
+            return adapter.dump_json(payload)
+        if isinstance(payload, BaseModel):
+            return payload.__pydantic_serializer__.to_json(payload)
+        return orjson.dumps(
+            payload,
+            default=_dump_unknown,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
+
+    def _adapter_for(self, payload: Any) -> Optional[TypeAdapter]:
+        if not isinstance(payload, list):
+            return self._adapters.get(payload.__class__)
+        if not payload:
+            return None
+        # Список из разных схем не подходит под TypeAdapter одной схемы.
+        item_type = payload[0].__class__
+        adapter = self._list_adapters.get(item_type)
+        if adapter is None:
+            return None
+        if any(entry.__class__ is not item_type for entry in payload):
+            return None
+        return adapter
+
+
+def _dump_unknown(unknown: Any) -> Any:
+    if isinstance(unknown, BaseModel):
+        return unknown.model_dump(mode='json')
+    if isinstance(unknown, Decimal):
+        # Как в jsonable_encoder: целые значения остаются целыми.
+        if unknown.as_tuple().exponent >= 0:
+            return int(unknown)
+        return float(unknown)
+    raise TypeError(unknown.__class__.__name__)
+
+
+SERIALIZERS: Final = JsonSerializers()
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON-ответ, сериализуемый через pydantic-core и orjson.
+
+    Используется как класс ответа по умолчанию. В отличие от
+    JSONResponse не проходит через стандартный модуль json.
+    Ответ по умолчанию FastAPI сначала превращает в словари
+    через jsonable_encoder. Горячие маршруты возвращают FastJSONResponse
+    явно, и схемы, зарегистрированные в SERIALIZERS, сериализуются
+    сразу в байты.
+    """
+
+    def render(self, content: Any) -> bytes:  # noqa: WPS110
+        """
+        Сериализует содержимое ответа.
+
+        Args:
+            content (Any): Содержимое ответа.
+
+        Returns:
+            bytes: Тело ответа.
+        """
+        return SERIALIZERS.dump(content)
@@ -0,0 +1,157 @@
+import time
+from types import MappingProxyType
+from typing import Final, Mapping, Optional, Sequence
+
+from fastapi import status
+from fastapi.responses import JSONResponse
+
+from src.configs.load_shedding_config import (
+    LOAD_SHEDDING_EXCLUDED_PATHS,
+    LOAD_SHEDDING_INITIAL_LIMIT,
+    LOAD_SHEDDING_MAX_LIMIT,
+    LOAD_SHEDDING_MIN_LIMIT,
+    LOAD_SHEDDING_RETRY_AFTER_SECONDS,
+    LOAD_SHEDDING_ROUTE_CLASSES,
+    LOAD_SHEDDING_TARGET_LATENCY_SECONDS,
+)
+from src.utils.adaptive_limiter import AdaptiveLimiter, RouteClassPolicy
+from src.utils.metrics import (
+    HTTP_ADMISSION_WAIT,
+    HTTP_CONCURRENCY_LIMIT,
+    HTTP_REQUESTS_IN_FLIGHT_BY_CLASS,
+    HTTP_REQUESTS_SHED,
+)
+
+_DEFAULT_CLASS: Final = 'default'
+_BULK_CLASS: Final = 'bulk'
+_ROUTE_CLASS_POLICIES: Final = MappingProxyType(
+    {
+        'critical': RouteClassPolicy(share=1, queue_timeout=1),
+        _DEFAULT_CLASS: RouteClassPolicy(
+            share=0.8,  # noqa: WPS432
+            queue_timeout=0.1,
+        ),
+        _BULK_CLASS: RouteClassPolicy(
+            share=0.5,
+            queue_timeout=0.05,  # noqa: WPS432
+        ),
+    },
+)
+
+
+def _default_limiter() -> AdaptiveLimiter:
+    return AdaptiveLimiter(
+        initial_limit=LOAD_SHEDDING_INITIAL_LIMIT,
+        min_limit=LOAD_SHEDDING_MIN_LIMIT,
+        max_limit=LOAD_SHEDDING_MAX_LIMIT,
+        target_latency=LOAD_SHEDDING_TARGET_LATENCY_SECONDS,
+    )
+
+
+class LoadSheddingMiddleware:
+    """
+    ASGI middleware, ограничивающий число одновременных запросов.
+
+    Лимит подстраивается под задержку до начала ответа (AdaptiveLimiter):
+    время передачи тела зависит от скорости клиента и не считается
+    перегрузкой сервиса. Запросы сверх лимита после короткого ожидания
+    получают 503 с Retry-After, а не копятся в процессе. Классы маршрутов
+    critical, default и bulk различаются долей лимита и временем ожидания
+    места: проверка токенов шлюзами допускается раньше массовых чтений
+    и отклоняется последней.
+    """
+
+    def __init__(
+        self,
+        app,
+        limiter: Optional[AdaptiveLimiter] = None,
+        route_classes: Mapping[str, str] = LOAD_SHEDDING_ROUTE_CLASSES,
+        excluded_paths: Sequence[str] = LOAD_SHEDDING_EXCLUDED_PATHS,
+    ):
+        """
+        Инициализирует middleware.
+
+        Args:
+            app: Оборачиваемое ASGI-приложение.
+            limiter (Optional[AdaptiveLimiter]): Лимит запросов.
+            По умолчанию создается по настройкам load_shedding_config.
+            route_classes (Mapping[str, str]): Классы маршрутов
+            по префиксам путей.
+            excluded_paths (Sequence[str]): Префиксы путей, которые
+            не ограничиваются, например метрики и проверки готовности.
+        """
+        self._app = app
+        self._limiter = limiter or _default_limiter()
+        self._route_classes = sorted(
+            route_classes.items(),
+            key=lambda route_rule: len(route_rule[0]),
+            reverse=True,
+        )
+        self._excluded_paths = tuple(excluded_paths)
+        self._overloaded_response = JSONResponse(
+            {'detail': 'Сервис перегружен, повторите запрос позже'},
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            headers={'Retry-After': str(LOAD_SHEDDING_RETRY_AFTER_SECONDS)},
+        )
+
+    async def __call__(self, scope, receive, send):
+        """
+        Обрабатывает ASGI-вызов.
+
+        Args:
+            scope: ASGI scope.
+            receive: ASGI receive.
+            send: ASGI send.
+        """
+        if scope['type'] != 'http' or self._is_excluded(scope):
+            await self._app(scope, receive, send)
+            return
+
+        route_class = self._route_class(scope)
+        queued_at = time.perf_counter()
+        admitted = await self._limiter.acquire(
+            _ROUTE_CLASS_POLICIES.get(
+                route_class,
+                _ROUTE_CLASS_POLICIES[_DEFAULT_CLASS],
+            ),
+        )
+        HTTP_ADMISSION_WAIT.labels(route_class).observe(
+            time.perf_counter() - queued_at,
+        )
+        if not admitted:
+            HTTP_REQUESTS_SHED.labels(route_class).inc()
+            await self._overloaded_response(scope, receive, send)
+            return
+        await self._process(route_class, scope, receive, send)
+
+    async def _process(self, route_class: str, scope, receive, send) -> None:
+        in_flight = HTTP_REQUESTS_IN_FLIGHT_BY_CLASS.labels(route_class)
+        in_flight.inc()
+        started_at = time.perf_counter()
+        response_latency = [None]
+
+        async def send_with_latency(message):  # noqa: WPS430
+            if message['type'] == 'http.response.start':
+                response_latency[0] = time.perf_counter() - started_at
+            await send(message)
+
+        try:  # noqa: WPS501
+            await self._app(scope, receive, send_with_latency)
+        finally:
+            if response_latency[0] is None:
+                response_latency[0] = time.perf_counter() - started_at
+            self._limiter.release(response_latency[0])
+            in_flight.dec()
+            HTTP_CONCURRENCY_LIMIT.set(self._limiter.limit)
+
+    def _is_excluded(self, scope) -> bool:
+        return scope['path'].startswith(self._excluded_paths)
+
+    def _route_class(self, scope) -> str:
+        path = scope['path']
+        for prefix, route_class in self._route_classes:
+            if path.startswith(prefix):
+                return route_class
+        if scope['method'] == 'GET':
+            return _BULK_CLASS
+        return _DEFAULT_CLASS
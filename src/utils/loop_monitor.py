@@ -0,0 +1,106 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from types import MappingProxyType
+from typing import Final, Optional
+
+from src.configs.logger_settings.logger_config import logger
+from src.configs.loop_monitor_config import (
+    LOOP_MONITOR_BLOCK_THRESHOLD_SECONDS,
+    LOOP_MONITOR_INTERVAL_SECONDS,
+)
+from src.utils.metrics import EVENT_LOOP_BLOCKS, EVENT_LOOP_LAG
+
+_LABELS: Final = MappingProxyType({'module': 'loop_monitor'})
+_MS_IN_SECOND: Final = 1000
+# Сторожевой поток просыпается чаще порога, чтобы застать блокировку.
+_WATCHDOG_CHECKS_PER_THRESHOLD: Final = 2
+# Внешние кадры стека (сервер, middleware) одинаковы для всех блокировок,
+# поэтому записываются только ближайшие к блокирующему вызову.
+_STACK_LIMIT: Final = 12
+
+
+class LoopLagMonitor:
+    """
+    Измеряет задержку цикла событий и находит блокирующие вызовы.
+
+    Корутина run периодически засыпает на interval и записывает
+    в EVENT_LOOP_LAG, на сколько позже срока она проснулась. Сторожевой
+    поток проверяет, когда корутина просыпалась последний раз. Если цикл
+    не отвечает дольше block_threshold, поток записывает в лог стек потока
+    цикла событий, начиная с вызова, который его блокирует. Одна
+    блокировка записывается в лог один раз.
+
+    Methods:
+        run: Измеряет задержку, пока задача не будет отменена.
+    """
+
+    def __init__(
+        self,
+        interval: float = LOOP_MONITOR_INTERVAL_SECONDS,
+        block_threshold: float = LOOP_MONITOR_BLOCK_THRESHOLD_SECONDS,
+    ):
+        """
+        Инициализирует монитор.
+
+        Args:
+            interval (float): Период измерения задержки в секундах.
+            block_threshold (float): Длительность блокировки в секундах,
+            после которой стек записывается в лог.
+        """
+        self._interval = interval
+        self._block_threshold = block_threshold
+        self._last_tick = time.monotonic()
+        self._reported_tick: Optional[float] = None
+        self._loop_thread_id = threading.get_ident()
+
+    async def run(self) -> None:
+        """Измеряет задержку цикла событий, пока задача не будет отменена."""
+        self._loop_thread_id = threading.get_ident()
+        self._last_tick = time.monotonic()
+        stopped = threading.Event()
+        watchdog = threading.Thread(
+            target=self._watch,
+            args=(stopped,),
+            name='loop-monitor',
+            daemon=True,
+        )
+        watchdog.start()
+        try:  # noqa: WPS501
+            while True:  # noqa: WPS457
+                await asyncio.sleep(self._interval)
+                now = time.monotonic()
+                EVENT_LOOP_LAG.observe(
+                    max(0, now - self._last_tick - self._interval),
+                )
+                self._last_tick = now
+        finally:
+            stopped.set()
+
+    def _watch(self, stopped: threading.Event) -> None:
+        check_interval = self._block_threshold / _WATCHDOG_CHECKS_PER_THRESHOLD
+        while not stopped.wait(check_interval):
+            last_tick = self._last_tick
+            blocked_for = time.monotonic() - last_tick - self._interval
+            if blocked_for > self._block_threshold:
+                if self._reported_tick != last_tick:
+                    self._reported_tick = last_tick
+                    self._report(blocked_for)
+
+    def _report(self, blocked_for: float) -> None:
+        EVENT_LOOP_BLOCKS.inc()
+        frame = sys._current_frames().get(  # noqa: WPS437
+            self._loop_thread_id,
+        )
+        stack = ''
+        if frame is not None:
+            stack_lines = traceback.format_stack(frame, limit=_STACK_LIMIT)
+            stack = ''.join(reversed(stack_lines))
+        logger.warning(
+            'Цикл событий заблокирован дольше {0:.0f} мс:\n{1}',
+            blocked_for * _MS_IN_SECOND,
+            stack,
+            labels=_LABELS,
+        )
@@ -0,0 +1,134 @@
+import gc
+import threading
+import tracemalloc
+from collections import Counter
+from typing import Final, Literal, Optional
+
+# Выделения самого tracemalloc и импорта модулей не относятся к утечкам.
+_IGNORED_FILES: Final = (
+    tracemalloc.__file__,
+    '<frozen importlib._bootstrap>',
+    '<frozen importlib._bootstrap_external>',
+    '<unknown>',
+)
+
+GroupBy = Literal['lineno', 'filename']
+
+
+class MemoryDiagnostics:  # noqa: WPS214
+    """
+    Снимки памяти процесса для поиска утечек.
+
+    Снимок tracemalloc сравнивается с предыдущим снимком, поэтому
+    повторные вызовы top_allocations показывают рост между ними. Все данные
+    относятся к текущему процессу воркера.
+
+    Methods:
+        start: Включает отслеживание выделений памяти.
+        stop: Выключает отслеживание и забывает снимки.
+        top_allocations: Делает снимок и возвращает наибольший рост.
+        gc_generations: Возвращает статистику поколений сборщика мусора.
+        object_counts: Возвращает количество объектов по типам.
+    """
+
+    def __init__(self):
+        """Инициализирует диагностику без снимков."""
+        self._lock = threading.Lock()
+        self._previous: Optional[tracemalloc.Snapshot] = None
+
+    @property
+    def tracing(self) -> bool:
+        """
+        Возвращает, отслеживаются ли выделения памяти.
+
+        Returns:
+            bool: True, если tracemalloc включен.
+        """
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: int) -> None:
+        """
+        Включает отслеживание и делает исходный снимок.
+
+        Args:
+            frames (int): Глубина стека, сохраняемая для выделения.
+        """
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(frames)
+            self._previous = self._take_snapshot()
+
+    def stop(self) -> None:
+        """Выключает отслеживание и забывает снимки."""
+        with self._lock:
+            tracemalloc.stop()
+            self._previous = None
+
+    def top_allocations(
+        self,
+        group_by: GroupBy,
+        limit: int,
+    ) -> list[tracemalloc.StatisticDiff]:
+        """
+        Делает снимок и возвращает наибольший рост с прошлого снимка.
+
+        Args:
+            group_by (GroupBy): Группировка по строке или по файлу.
+            limit (int): Количество возвращаемых мест выделения.
+
+        Returns:
+            list[tracemalloc.StatisticDiff]: Изменения по местам выделения,
+            по убыванию роста. Пустой список, если отслеживание выключено.
+        """
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                return []
+            snapshot = self._take_snapshot()
+            previous = self._previous or snapshot
+            self._previous = snapshot
+        return snapshot.compare_to(previous, group_by)[:limit]
+
+    def gc_generations(self) -> list[dict]:
+        """
+        Возвращает статистику поколений сборщика мусора.
+
+        Returns:
+            list[dict]: Для каждого поколения число сборок, собранных
+            и неудаляемых объектов, а также текущий счетчик и порог.
+        """
+        return [
+            {**stats, 'count': count, 'threshold': threshold}
+            for stats, count, threshold in zip(
+                gc.get_stats(),
+                gc.get_count(),
+                gc.get_threshold(),
+            )
+        ]
+
+    def object_counts(self, limit: int) -> dict[str, int]:
+        """
+        Возвращает количество отслеживаемых сборщиком объектов по типам.
+
+        Args:
+            limit (int): Количество самых многочисленных типов.
+
+        Returns:
+            dict[str, int]: Количество объектов по полному имени типа.
+        """
+        type_counts = Counter(
+            _type_name(type(tracked)) for tracked in gc.get_objects()
+        )
+        return dict(type_counts.most_common(limit))
+
+    def _take_snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(inclusive=False, filename_pattern=filename)
+            for filename in _IGNORED_FILES
+        ])
+
+
+def _type_name(object_type: type) -> str:
+    return '{0}.{1}'.format(object_type.__module__, object_type.__qualname__)
+
+
+MEMORY_DIAGNOSTICS: Final = MemoryDiagnostics()
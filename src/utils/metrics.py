@@ -0,0 +1,247 @@
+import os
+import time
+from typing import Final
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Если переменная задана, каждый воркер пишет значения в файлы
+# в этом каталоге, а /metrics суммирует их по всем воркерам.
+_MULTIPROCESS_DIR: Final = os.getenv('PROMETHEUS_MULTIPROC_DIR')
+_UNMATCHED_ROUTE: Final = '<unmatched>'
+_SERVER_ERROR_STATUS: Final = 500
+# Значения живых воркеров складываются, завершенных - отбрасываются.
+_LIVE_SUM: Final = 'livesum'
+_OUTCOME: Final = 'outcome'
+_LATENCY_BUCKETS: Final = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+)
+# Команды Redis выполняются за доли миллисекунды.
+_REDIS_LATENCY_BUCKETS: Final = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    1,
+)
+
+HTTP_REQUEST_DURATION: Final = Histogram(
+    'http_request_duration_seconds',
+    'Длительность обработки HTTP-запросов.',
+    labelnames=('method', 'route', 'status'),
+    buckets=_LATENCY_BUCKETS,
+)
+HTTP_REQUESTS_IN_FLIGHT: Final = Gauge(
+    'http_requests_in_flight',
+    'Количество HTTP-запросов в обработке.',
+    multiprocess_mode=_LIVE_SUM,
+)
+DB_QUERY_DURATION: Final = Histogram(
+    'db_query_duration_seconds',
+    'Длительность запросов к базе данных.',
+    labelnames=('table', 'statement', _OUTCOME),
+    buckets=_LATENCY_BUCKETS,
+)
+DB_CONNECTIONS_IN_USE: Final = Gauge(
+    'db_connections_in_use',
+    'Количество выданных соединений с базой данных.',
+    multiprocess_mode=_LIVE_SUM,
+)
+DB_CONNECTIONS_OPENED: Final = Counter(
+    'db_connections_opened',
+    'Количество открытых соединений с базой данных.',
+)
+AUTH_LOGINS: Final = Counter(
+    'auth_logins',
+    'Попытки входа по результату.',
+    labelnames=(_OUTCOME,),
+)
+AUTH_LOGIN_THROTTLE: Final = Counter(
+    'auth_login_throttle',
+    'Проверки ограничителя попыток входа по результату.',
+    labelnames=(_OUTCOME,),
+)
+AUTH_REFRESHES: Final = Counter(
+    'auth_refreshes',
+    'Обновления токенов по результату.',
+    labelnames=(_OUTCOME,),
+)
+AUTH_TOKEN_FAILURES: Final = Counter(
+    'auth_token_failures',
+    'Отклоненные токены доступа по причине.',
+    labelnames=('reason',),
+)
+HTTP_REQUESTS_IN_FLIGHT_BY_CLASS: Final = Gauge(
+    'http_requests_in_flight_by_class',
+    'Количество допущенных HTTP-запросов по классу маршрута.',
+    labelnames=('route_class',),
+    multiprocess_mode=_LIVE_SUM,
+)
+HTTP_ADMISSION_WAIT: Final = Histogram(
+    'http_admission_wait_seconds',
+    'Время ожидания места в лимите одновременных запросов.',
+    labelnames=('route_class',),
+    buckets=_LATENCY_BUCKETS,
+)
+HTTP_REQUESTS_SHED: Final = Counter(
+    'http_requests_shed',
+    'Запросы, отклоненные из-за перегрузки, по классу маршрута.',
+    labelnames=('route_class',),
+)
+HTTP_REQUESTS_ABANDONED: Final = Counter(
+    'http_requests_abandoned',
+    'Запросы, обработка которых прервана, по причине.',
+    labelnames=('reason',),
+)
+HTTP_CONCURRENCY_LIMIT: Final = Gauge(
+    'http_concurrency_limit',
+    'Текущий адаптивный лимит одновременных запросов.',
+    multiprocess_mode=_LIVE_SUM,
+)
+EVENT_LOOP_LAG: Final = Histogram(
+    'event_loop_lag_seconds',
+    'Задержка срабатывания таймера цикла событий.',
+    buckets=_LATENCY_BUCKETS,
+)
+EVENT_LOOP_BLOCKS: Final = Counter(
+    'event_loop_blocks',
+    'Блокировки цикла событий дольше порога.',
+)
+REDIS_COMMAND_DURATION: Final = Histogram(
+    'redis_command_duration_seconds',
+    'Длительность команд и конвейеров Redis.',
+    labelnames=('command',),
+    buckets=_REDIS_LATENCY_BUCKETS,
+)
+CACHE_LOOKUPS: Final = Counter(
+    'cache_lookups',
+    'Обращения к кешу по результату.',
+    labelnames=('cache', _OUTCOME),
+)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware, измеряющий длительность и число HTTP-запросов.
+
+    Маршрут в метках берется из шаблона пути FastAPI, а не из самого
+    пути, поэтому число рядов не зависит от параметров запроса.
+    """
+
+    def __init__(self, app):
+        """
+        Инициализирует middleware.
+
+        Args:
+            app: Оборачиваемое ASGI-приложение.
+        """
+        self._app = app
+
+    async def __call__(self, scope, receive, send):
+        """
+        Обрабатывает ASGI-вызов.
+
+        Args:
+            scope: ASGI scope.
+            receive: ASGI receive.
+            send: ASGI send.
+        """
+        if scope['type'] != 'http':
+            await self._app(scope, receive, send)
+            return
+
+        response_status = [_SERVER_ERROR_STATUS]
+
+        async def send_with_status(message):  # noqa: WPS430
+            if message['type'] == 'http.response.start':
+                response_status[0] = message['status']
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        started_at = time.perf_counter()
+        try:  # noqa: WPS501
+            await self._app(scope, receive, send_with_status)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            route = scope.get('route')
+            HTTP_REQUEST_DURATION.labels(
+                scope['method'],
+                getattr(route, 'path', _UNMATCHED_ROUTE),
+                response_status[0],
+            ).observe(time.perf_counter() - started_at)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """
+    Подписывает счетчики соединений на события пула движка.
+
+    Args:
+        engine (AsyncEngine): Асинхронный движок SQLAlchemy.
+    """
+    pool = engine.sync_engine.pool
+    event.listen(pool, 'connect', _on_connect)
+    event.listen(pool, 'checkout', _on_checkout)
+    event.listen(pool, 'checkin', _on_checkin)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """
+    Формирует ответ для Prometheus.
+
+    Returns:
+        tuple[bytes, str]: Тело ответа и его тип содержимого.
+    """
+    registry = REGISTRY
+    if _MULTIPROCESS_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    """
+    Удаляет значения метрик livesum завершающегося воркера.
+
+    Вызывается при остановке воркера, чтобы /metrics других воркеров
+    не учитывал его текущие значения. Без PROMETHEUS_MULTIPROC_DIR
+    ничего не делает.
+    """
+    if _MULTIPROCESS_DIR:
+        multiprocess.mark_process_dead(os.getpid(), _MULTIPROCESS_DIR)
+
+
+def _on_connect(*args) -> None:
+    DB_CONNECTIONS_OPENED.inc()
+
+
+def _on_checkout(*args) -> None:
+    DB_CONNECTIONS_IN_USE.inc()
+
+
+def _on_checkin(*args) -> None:
+    DB_CONNECTIONS_IN_USE.dec()
@@ -0,0 +1,256 @@
+import functools
+import hashlib
+import time
+from typing import Any, Final, Mapping, Optional, Sequence
+
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.asyncio.client import Pipeline
+from redis.exceptions import NoScriptError
+
+from src.configs.db_config import (
+    REDIS_BATCH_SIZE,
+    REDIS_DB,
+    REDIS_HOST,
+    REDIS_MAX_CONNECTIONS,
+    REDIS_POOL_TIMEOUT_SECONDS,
+    REDIS_PORT,
+    REDIS_SOCKET_TIMEOUT_SECONDS,
+)
+from src.utils.metrics import REDIS_COMMAND_DURATION
+from src.utils.warmup import WARM_UP
+
+_DEFAULT_REDIS_PORT: Final = 6379
+
+
+class InstrumentedRedis(Redis):
+    """Клиент Redis, записывающий длительность команд в метрики."""
+
+    async def execute_command(self, *args, **options) -> Any:
+        """
+        Выполняет команду и записывает ее длительность.
+
+        Args:
+            args: Имя и аргументы команды.
+            options: Параметры разбора ответа.
+
+        Returns:
+            Any: Ответ Redis.
+        """
+        started_at = time.perf_counter()
+        try:  # noqa: WPS501
+            return await super().execute_command(*args, **options)
+        finally:
+            REDIS_COMMAND_DURATION.labels(str(args[0]).lower()).observe(
+                time.perf_counter() - started_at,
+            )
+
+
+@functools.cache
+def get_redis_client() -> Redis:
+    """
+    Возвращает общий асинхронный клиент Redis.
+
+    Клиент создается при первом обращении и использует пул не более
+    чем из REDIS_MAX_CONNECTIONS соединений. Когда пул исчерпан, команда
+    ждет освобождения соединения до REDIS_POOL_TIMEOUT_SECONDS, а не
+    открывает новое. Закрывается при остановке приложения
+    (close_redis_client).
+
+    Returns:
+        Redis: Асинхронный клиент Redis.
+    """
+    connection_pool = BlockingConnectionPool(
+        host=REDIS_HOST or 'localhost',
+        port=int(REDIS_PORT or _DEFAULT_REDIS_PORT),
+        db=REDIS_DB,
+        max_connections=REDIS_MAX_CONNECTIONS,
+        timeout=REDIS_POOL_TIMEOUT_SECONDS,
+        socket_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+        socket_connect_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+        decode_responses=True,
+    )
+    return InstrumentedRedis(connection_pool=connection_pool)
+
+
+async def close_redis_client() -> None:
+    """Закрывает общий клиент Redis и его пул соединений, если он создан."""
+    if get_redis_client.cache_info().currsize:
+        await get_redis_client().aclose(close_connection_pool=True)
+        get_redis_client.cache_clear()
+
+
+async def execute_pipeline(pipeline: Pipeline) -> list:
+    """
+    Выполняет конвейер и записывает его длительность.
+
+    Args:
+        pipeline (Pipeline): Конвейер с накопленными командами.
+
+    Returns:
+        list: Ответы на команды конвейера по порядку.
+    """
+    started_at = time.perf_counter()
+    try:  # noqa: WPS501
+        return await pipeline.execute()
+    finally:
+        REDIS_COMMAND_DURATION.labels('pipeline').observe(
+            time.perf_counter() - started_at,
+        )
+
+
+async def get_many(
+    redis: Redis,
+    keys: Sequence[str],
+    batch_size: int = REDIS_BATCH_SIZE,
+) -> list[Optional[str]]:
+    """
+    Читает значения ключей за один обмен с Redis.
+
+    Ключи делятся на команды MGET не более чем по batch_size ключей,
+    которые отправляются одним конвейером.
+
+    Args:
+        redis (Redis): Клиент Redis.
+        keys (Sequence[str]): Ключи.
+        batch_size (int): Количество ключей в одной команде.
+
+    Returns:
+        list[Optional[str]]: Значения в порядке ключей, None для
+        отсутствующих.
+    """
+    if not keys:
+        return []
+    async with redis.pipeline(transaction=False) as pipe:
+        for batch_start in range(0, len(keys), batch_size):
+            pipe.mget(keys[batch_start:batch_start + batch_size])
+        batches = await execute_pipeline(pipe)
+    return [batch_value for batch in batches for batch_value in batch]
+
+
+async def set_many(
+    redis: Redis,
+    key_values: Mapping[str, Any],
+    ttl_seconds: Optional[int] = None,
+    batch_size: int = REDIS_BATCH_SIZE,
+) -> None:
+    """
+    Записывает значения ключей конвейером.
+
+    MSET не задает срок жизни, поэтому каждый ключ записывается
+    командой SET, а команды отправляются пакетами по batch_size.
+
+    Args:
+        redis (Redis): Клиент Redis.
+        key_values (Mapping[str, Any]): Значения по ключам.
+        ttl_seconds (Optional[int]): Срок жизни ключей. None - бессрочно.
+        batch_size (int): Количество команд в одном пакете.
+    """
+    pairs = list(key_values.items())
+    async with redis.pipeline(transaction=False) as pipe:
+        for batch_start in range(0, len(pairs), batch_size):
+            for key, key_value in pairs[batch_start:batch_start + batch_size]:
+                pipe.set(key, key_value, ex=ttl_seconds)
+            await execute_pipeline(pipe)
+
+
+class LuaScript:
+    """
+    Скрипт Lua, вызываемый по SHA1.
+
+    SHA1 вычисляется один раз при создании, поэтому вызов отправляет
+    EVALSHA без текста скрипта. Если Redis не знает скрипт (после
+    перезапуска или SCRIPT FLUSH), скрипт загружается и вызов повторяется.
+
+    Attributes:
+        source (str): Текст скрипта.
+        sha (str): SHA1 текста скрипта.
+    """
+
+    def __init__(self, source: str):
+        """
+        Инициализирует скрипт.
+
+        Args:
+            source (str): Текст скрипта.
+        """
+        self.source = source
+        self.sha = hashlib.sha1(  # noqa: S324
+            source.encode(),
+            usedforsecurity=False,
+        ).hexdigest()
+
+    async def __call__(
+        self,
+        redis: Redis,
+        keys: Sequence = (),
+        args: Sequence = (),
+    ) -> Any:
+        """
+        Выполняет скрипт.
+
+        Args:
+            redis (Redis): Клиент Redis.
+            keys (Sequence): Ключи скрипта (KEYS).
+            args (Sequence): Аргументы скрипта (ARGV).
+
+        Returns:
+            Any: Результат скрипта.
+        """
+        try:
+            return await redis.evalsha(self.sha, len(keys), *keys, *args)
+        except NoScriptError:
+            await redis.script_load(self.source)
+            return await redis.evalsha(self.sha, len(keys), *keys, *args)
+
+
+class LuaScripts:
+    """
+    Реестр скриптов Lua приложения.
+
+    Модули регистрируют скрипты при импорте, а при прогреве все скрипты
+    загружаются в Redis одним конвейером, чтобы первые вызовы
+    не тратили обмен на повторную загрузку.
+
+    Methods:
+        register: Регистрирует скрипт.
+        load: Загружает зарегистрированные скрипты в Redis.
+    """
+
+    def __init__(self):
+        """Инициализирует пустой реестр."""
+        self._scripts: dict[str, LuaScript] = {}
+
+    def register(self, source: str) -> LuaScript:
+        """
+        Регистрирует скрипт.
+
+        Args:
+            source (str): Текст скрипта.
+
+        Returns:
+            LuaScript: Скрипт, вызываемый по SHA1.
+        """
+        script = LuaScript(source)
+        return self._scripts.setdefault(script.sha, script)
+
+    async def load(self, redis: Redis) -> None:
+        """
+        Загружает зарегистрированные скрипты в Redis.
+
+        Args:
+            redis (Redis): Клиент Redis.
+        """
+        async with redis.pipeline(transaction=False) as pipe:
+            for script in self._scripts.values():
+                pipe.script_load(script.source)
+            await execute_pipeline(pipe)
+
+
+REDIS_SCRIPTS: Final = LuaScripts()
+
+
+async def _warm_up_redis() -> None:
+    await REDIS_SCRIPTS.load(get_redis_client())
+
+
+WARM_UP.register('redis', _warm_up_redis)
@@ -0,0 +1,116 @@
+import contextlib
+import uuid
+from types import MappingProxyType
+from typing import AsyncIterator, Final, Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.configs.logger_settings.logger_config import logger
+from src.utils.redis_client import REDIS_SCRIPTS
+
+_LABELS: Final = MappingProxyType({'module': 'redis_lock'})
+_MS_IN_SECOND: Final = 1000
+
+# Снимает блокировку, только если ее все еще держит этот владелец.
+_RELEASE_SCRIPT: Final = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+_RELEASE: Final = REDIS_SCRIPTS.register(_RELEASE_SCRIPT)
+
+
+class RedisLock:
+    """
+    Блокировка по имени, общая для всех воркеров.
+
+    Блокировка ставится командой SET NX PX со случайным токеном владельца
+    и снимается скриптом, который проверяет токен, поэтому чужая
+    блокировка, поставленная после истечения своей, не снимается.
+    Блокировка не продлевается: работа под ней должна укладываться
+    в timeout_seconds.
+
+    Methods:
+        acquire: Пытается поставить блокировку без ожидания.
+        release: Снимает блокировку.
+        hold: Держит блокировку на время блока async with.
+    """
+
+    def __init__(self, redis: Redis, timeout_seconds: float):
+        """
+        Инициализирует блокировку.
+
+        Args:
+            redis (Redis): Клиент Redis.
+            timeout_seconds (float): Срок, после которого блокировка
+            снимается сама.
+        """
+        self._redis = redis
+        self._timeout_ms = int(timeout_seconds * _MS_IN_SECOND)
+
+    async def acquire(self, name: str) -> Optional[str]:
+        """
+        Пытается поставить блокировку без ожидания.
+
+        Args:
+            name (str): Имя блокировки.
+
+        Returns:
+            Optional[str]: Токен владельца или None, если блокировка занята.
+        """
+        owner_token = uuid.uuid4().hex
+        locked = await self._redis.set(
+            _lock_key(name),
+            owner_token,
+            nx=True,
+            px=self._timeout_ms,
+        )
+        return owner_token if locked else None
+
+    async def release(self, name: str, owner_token: str) -> None:
+        """
+        Снимает блокировку, если ее держит владелец токена.
+
+        Ошибка Redis записывается в лог: блокировка истечет сама.
+
+        Args:
+            name (str): Имя блокировки.
+            owner_token (str): Токен, полученный от acquire.
+        """
+        try:
+            await _RELEASE(
+                self._redis,
+                keys=[_lock_key(name)],
+                args=[owner_token],
+            )
+        except RedisError as ex:
+            logger.warning(
+                'Не удалось снять блокировку {0}: {1}',
+                name,
+                ex,
+                labels=_LABELS,
+            )
+
+    @contextlib.asynccontextmanager
+    async def hold(self, name: str) -> AsyncIterator[bool]:
+        """
+        Держит блокировку на время блока async with.
+
+        Args:
+            name (str): Имя блокировки.
+
+        Yields:
+            bool: True, если блокировка поставлена, False, если занята.
+        """
+        owner_token = await self.acquire(name)
+        try:
+            yield owner_token is not None
+        finally:
+            if owner_token is not None:
+                await self.release(name, owner_token)
+
+
+def _lock_key(name: str) -> str:
+    return '{0}:lock'.format(name)
@@ -0,0 +1,162 @@
+import asyncio
+import os
+import random
+import time
+from contextlib import suppress
+from types import MappingProxyType
+from typing import Callable, Final
+
+from fastapi.responses import HTMLResponse
+from starlette.datastructures import Headers, QueryParams
+
+from src.configs.logger_settings.logger_config import logger
+from src.configs.profiling_config import (
+    PROFILING_INTERVAL_SECONDS,
+    PROFILING_MAX_FILES,
+    PROFILING_OUTPUT_DIR,
+    PROFILING_SAMPLE_RATE,
+    PROFILING_TRIGGER_HEADER,
+    PROFILING_TRIGGER_QUERY,
+)
+
+try:
+    from pyinstrument import Profiler  # noqa: WPS433
+except ImportError:  # pragma: no cover
+    Profiler = None  # noqa: N816, WPS440
+
+_LABELS: Final = MappingProxyType({'module': 'request_profiler'})
+_PROFILED_STATUS_HEADER: Final = 'X-Profiled-Status'
+_REPORT_SUFFIX: Final = '.html'
+
+RequestAuthorizer = Callable[[Headers], bool]
+
+
+class RequestProfilerMiddleware:
+    """
+    ASGI middleware, профилирующий отдельные запросы.
+
+    Запрос с заголовком PROFILING_TRIGGER_HEADER или параметром
+    PROFILING_TRIGGER_QUERY профилируется, если authorize разрешает его
+    заголовки. Вместо ответа обработчика клиент получает HTML-отчет
+    pyinstrument, а исходный статус ответа передается в заголовке
+    X-Profiled-Status. Кроме того, доля sample_rate обычных запросов
+    профилируется с сохранением отчета в output_dir; по умолчанию
+    выборка отключена. В output_dir хранятся только max_files последних
+    отчетов. Без пакета pyinstrument запросы не профилируются.
+    """
+
+    def __init__(  # noqa: WPS211
+        self,
+        app,
+        authorize: RequestAuthorizer,
+        sample_rate: float = PROFILING_SAMPLE_RATE,
+        output_dir: str = PROFILING_OUTPUT_DIR,
+        max_files: int = PROFILING_MAX_FILES,
+    ):
+        """
+        Инициализирует middleware.
+
+        Args:
+            app: Оборачиваемое ASGI-приложение.
+            authorize (RequestAuthorizer): Проверяет, может ли автор
+            запроса запросить профилирование, по заголовкам запроса.
+            sample_rate (float): Доля запросов, профилируемых в файл.
+            output_dir (str): Каталог для отчетов выборочного профилирования.
+            max_files (int): Сколько последних отчетов хранить в output_dir.
+        """
+        self._app = app
+        self._authorize = authorize
+        self._sample_rate = sample_rate
+        self._output_dir = output_dir
+        self._max_files = max_files
+
+    async def __call__(self, scope, receive, send):
+        """
+        Обрабатывает ASGI-вызов.
+
+        Args:
+            scope: ASGI scope.
+            receive: ASGI receive.
+            send: ASGI send.
+        """
+        if scope['type'] != 'http' or Profiler is None:
+            await self._app(scope, receive, send)
+            return
+        if self._is_requested(scope):
+            if self._authorize(Headers(scope=scope)):
+                await self._profile_to_response(scope, receive, send)
+                return
+            logger.info(
+                'Профилирование {0} не разрешено автору запроса',
+                scope['path'],
+                labels=_LABELS,
+            )
+        elif random.random() < self._sample_rate:  # noqa: S311
+            await self._profile_to_file(scope, receive, send)
+            return
+        await self._app(scope, receive, send)
+
+    async def _profile_to_response(self, scope, receive, send) -> None:
+        response_start = {}
+
+        async def discard(message) -> None:  # noqa: WPS430
+            if message['type'] == 'http.response.start':
+                response_start.update(message)
+
+        profiler = Profiler(interval=PROFILING_INTERVAL_SECONDS)
+        profiler.start()
+        try:  # noqa: WPS501
+            await self._app(scope, receive, discard)
+        finally:
+            profiler.stop()
+        report = HTMLResponse(
+            await asyncio.to_thread(profiler.output_html),
+            headers={
+                _PROFILED_STATUS_HEADER: str(response_start.get('status')),
+            },
+        )
+        await report(scope, receive, send)
+
+    async def _profile_to_file(self, scope, receive, send) -> None:
+        profiler = Profiler(interval=PROFILING_INTERVAL_SECONDS)
+        profiler.start()
+        try:  # noqa: WPS501
+            await self._app(scope, receive, send)
+        finally:
+            profiler.stop()
+            await asyncio.to_thread(self._store, profiler, scope)
+
+    def _store(self, profiler, scope) -> None:
+        os.makedirs(self._output_dir, exist_ok=True)
+        report_path = os.path.join(
+            self._output_dir,
+            '{0}-{1}-{2}{3}{4}'.format(
+                time.time_ns(),
+                os.getpid(),
+                scope['method'],
+                scope['path'].replace('/', '_'),
+                _REPORT_SUFFIX,
+            ),
+        )
+        profiler.write_html(report_path)
+        self._remove_old_reports()
+
+    def _remove_old_reports(self) -> None:
+        # Имена начинаются со времени в наносекундах, поэтому
+        # сортировка по имени упорядочивает отчеты по времени.
+        reports = sorted(
+            file_name
+            for file_name in os.listdir(self._output_dir)
+            if file_name.endswith(_REPORT_SUFFIX)
+        )
+        excess = max(len(reports) - self._max_files, 0)
+        for file_name in reports[:excess]:
+            # Соседний воркер мог удалить тот же отчет.
+            with suppress(FileNotFoundError):
+                os.remove(os.path.join(self._output_dir, file_name))
+
+    def _is_requested(self, scope) -> bool:
+        if PROFILING_TRIGGER_HEADER in Headers(scope=scope):
+            return True
+        query_params = QueryParams(scope['query_string'])
+        return PROFILING_TRIGGER_QUERY in query_params
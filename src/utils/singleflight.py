@@ -0,0 +1,116 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    """
+    Объединяет одновременные асинхронные вызовы с одинаковым ключом.
+
+    Пока операция для ключа выполняется, остальные вызовы с тем же ключом
+    не запускают ее повторно, а ожидают и получают тот же результат
+    или то же исключение. Успешный результат дополнительно хранится
+    в течение окна ожидания, чтобы запоздавшие повторы тоже получили его.
+
+    Объединение работает в пределах одного процесса.
+
+    Methods:
+        run: Выполняет операцию или присоединяется к уже выполняемой.
+        forget: Удаляет сохраненный результат для ключа.
+        forget_where: Удаляет сохраненные результаты по условию.
+        clear: Удаляет все сохраненные результаты.
+    """
+
+    def __init__(self, grace_seconds: float = 0):
+        """
+        Инициализирует экземпляр SingleFlight.
+
+        Args:
+            grace_seconds (float): Сколько секунд хранить успешный результат
+            для повторных вызовов с тем же ключом. По умолчанию: 0.
+        """
+        self._grace_seconds = grace_seconds
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+        self._completed: OrderedDict[Hashable, tuple[float, Any]]
+        self._completed = OrderedDict()
+
+    async def run(
+        self,
+        key: Hashable,
+        func: Callable[..., Awaitable],
+        *args,
+        **kwargs,
+    ) -> Any:
+        """
+        Выполняет операцию или присоединяется к уже выполняемой.
+
+        Операция запускается в отдельной задаче, поэтому отмена одного
+        из ожидающих вызовов не прерывает ее для остальных.
+
+        Args:
+            key (Hashable): Ключ, по которому объединяются вызовы.
+            func (Callable[..., Awaitable]): Асинхронная операция.
+            args: Аргументы операции.
+            kwargs: Ключевые аргументы операции.
+
+        Returns:
+            Any: Результат операции.
+        """
+        self._evict_expired()
+        completed = self._completed.get(key)
+        if completed is not None:
+            return completed[1]
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            self._in_flight[key] = task
+            task.add_done_callback(
+                lambda done_task: self._on_done(key, done_task),
+            )
+        return await asyncio.shield(task)
+
+    def forget(self, key: Hashable) -> None:
+        """
+        Удаляет сохраненный результат для ключа.
+
+        Args:
+            key (Hashable): Ключ операции.
+        """
+        self._completed.pop(key, None)
+
+    def forget_where(self, predicate: Callable[[Any], bool]) -> None:
+        """
+        Удаляет сохраненные результаты, для которых выполняется условие.
+
+        Args:
+            predicate (Callable[[Any], bool]): Условие для результата.
+        """
+        stale_keys = [
+            key
+            for key, (_, completed_result) in self._completed.items()
+            if predicate(completed_result)
+        ]
+        for key in stale_keys:
+            self._completed.pop(key)
+
+    def clear(self) -> None:
+        """Удаляет все сохраненные результаты."""
+        self._completed.clear()
+
+    def _on_done(self, key: Hashable, task: asyncio.Task) -> None:
+        self._in_flight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        if self._grace_seconds > 0:
+            expires_at = time.monotonic() + self._grace_seconds
+            self._completed[key] = (expires_at, task.result())
+
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        while self._completed:
+            key, (expires_at, _) = next(iter(self._completed.items()))
+            if expires_at > now:
+                break
+            self._completed.pop(key)
@@ -0,0 +1,303 @@
+import asyncio
+import contextvars
+import math
+import random
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import (
+    Any,
+    AsyncContextManager,
+    Awaitable,
+    Callable,
+    Final,
+    NamedTuple,
+    Optional,
+)
+
+import orjson
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.configs.cache_config import (
+    CACHE_LOCK_POLL_SECONDS,
+    CACHE_LOCK_TIMEOUT_SECONDS,
+    CACHE_STALE_SECONDS,
+    CACHE_XFETCH_BETA,
+)
+from src.configs.logger_settings.logger_config import logger
+from src.utils.database_session import get_async_session
+from src.utils.json_response import SERIALIZERS
+from src.utils.metrics import CACHE_LOOKUPS
+from src.utils.redis_lock import RedisLock
+from src.utils.singleflight import SingleFlight
+
+_LABELS: Final = MappingProxyType({'module': 'cache'})
+_MS_IN_SECOND: Final = 1000
+
+Compute = Callable[[Any], Awaitable[Any]]
+SessionFactory = Callable[[], AsyncContextManager[Any]]
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    Сроки хранения значений кеша.
+
+    Attributes:
+        ttl_seconds (float): Срок свежести значения.
+        stale_seconds (float): Сколько секунд после истечения значение
+        еще отдается, пока оно обновляется в фоне.
+        beta (float): Коэффициент досрочного обновления XFetch.
+        Чем он больше, тем раньше истечения начинается обновление.
+    """
+
+    ttl_seconds: float
+    stale_seconds: float = CACHE_STALE_SECONDS
+    beta: float = CACHE_XFETCH_BETA
+
+
+class _CacheEntry(NamedTuple):
+    cached: Any
+    delta: float
+    expires_at: float
+
+
+def _as_is(cached: Any) -> Any:
+    return cached
+
+
+class StampedeCache:  # noqa: WPS214
+    """
+    Кеш в Redis, защищенный от лавины пересчетов.
+
+    Значение хранится вместе со временем истечения и длительностью
+    пересчета (delta). Защита от одновременных промахов:
+
+    - досрочное обновление XFetch: каждый запрос с вероятностью,
+      растущей к истечению и с delta, обновляет значение заранее,
+      так что горячий ключ обычно не успевает истечь;
+    - устаревшее значение отдается еще stale_seconds после истечения,
+      пока оно обновляется в фоне;
+    - пересчет ключа выполняет один вызов в процессе (SingleFlight)
+      и один процесс среди воркеров (RedisLock). При холодном промахе
+      остальные воркеры ждут записанного значения.
+
+    Если Redis недоступен, значение вычисляется без кеша.
+
+    compute получает сессию аргументом и не должен замыкать сессию
+    запроса: фоновое обновление выполняется после ответа, когда сессия
+    запроса уже закрыта. При промахе compute получает сессию вызывающего,
+    а для фонового обновления кеш открывает свою сессию из session_factory
+    вне контекста запроса, без его крайнего срока.
+
+    Methods:
+        get_or_compute: Возвращает значение из кеша или вычисляет его.
+        invalidate: Удаляет значение из кеша.
+    """
+
+    def __init__(  # noqa: WPS211
+        self,
+        name: str,
+        redis: Redis,
+        policy: CachePolicy,
+        load: Callable[[Any], Any] = _as_is,
+        session_factory: SessionFactory = get_async_session,
+    ):
+        """
+        Инициализирует кеш.
+
+        Args:
+            name (str): Имя кеша, префикс ключей и метка метрик.
+            redis (Redis): Клиент Redis.
+            policy (CachePolicy): Сроки хранения значений.
+            load (Callable[[Any], Any]): Восстанавливает значение
+            из JSON-данных кеша, например TypeAdapter.validate_python.
+            По умолчанию значение возвращается как есть.
+            session_factory (SessionFactory): Открывает сессию для
+            вычислений без сессии вызывающего, в том числе фоновых.
+        """
+        self._name = name
+        self._redis = redis
+        self._policy = policy
+        self._load = load
+        self._session_factory = session_factory
+        self._lock = RedisLock(redis, CACHE_LOCK_TIMEOUT_SECONDS)
+        self._flight = SingleFlight()
+        self._refreshes: dict[str, asyncio.Task] = {}
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Compute,
+        session: Any = None,
+    ) -> Any:
+        """
+        Возвращает значение из кеша или вычисляет его.
+
+        Args:
+            key (str): Ключ значения внутри кеша.
+            compute (Compute): Асинхронная функция, вычисляющая значение
+            по переданной ей сессии. Значение должно сериализоваться в JSON.
+            session (Any): Сессия вызывающего для вычисления при промахе.
+            Если не задана, сессия открывается из session_factory.
+
+        Returns:
+            Any: Значение ключа.
+        """
+        cache_key = self._cache_key(key)
+        try:
+            entry = await self._read(cache_key)
+        except RedisError as ex:
+            self._on_redis_error('Кеш недоступен', ex)
+            return await self._compute_uncached(compute, session)
+        if entry is None:
+            CACHE_LOOKUPS.labels(self._name, 'miss').inc()
+            return await self._flight.run(
+                cache_key,
+                self._compute_once,
+                cache_key,
+                compute,
+                session,
+            )
+        now = time.time()
+        if entry.expires_at <= now:
+            CACHE_LOOKUPS.labels(self._name, 'stale').inc()
+            self._refresh_in_background(cache_key, compute)
+        elif self._refresh_early(entry, now):
+            CACHE_LOOKUPS.labels(self._name, 'early_refresh').inc()
+            self._refresh_in_background(cache_key, compute)
+        else:
+            CACHE_LOOKUPS.labels(self._name, 'hit').inc()
+        return self._load(entry.cached)
+
+    async def invalidate(self, key: str) -> None:
+        """
+        Удаляет значение из кеша.
+
+        Args:
+            key (str): Ключ значения внутри кеша.
+        """
+        await self._redis.delete(self._cache_key(key))
+
+    def _cache_key(self, key: str) -> str:
+        return '{0}:{1}'.format(self._name, key)
+
+    def _refresh_early(self, entry: _CacheEntry, now: float) -> bool:
+        # 1 - random() лежит в (0, 1], поэтому логарифм определен
+        # и не положителен.
+        draw = math.log(1 - random.random())  # noqa: S311
+        return now - entry.delta * self._policy.beta * draw >= entry.expires_at
+
+    def _refresh_in_background(self, cache_key: str, compute: Compute) -> None:
+        if cache_key in self._refreshes:
+            return
+        # Пустой контекст: обновление переживает запрос и не должно
+        # наследовать его крайний срок и трассировку.
+        refresh = asyncio.get_running_loop().create_task(
+            self._refresh(cache_key, compute),
+            context=contextvars.Context(),
+        )
+        self._refreshes[cache_key] = refresh
+        refresh.add_done_callback(
+            lambda _: self._refreshes.pop(cache_key, None),
+        )
+
+    async def _refresh(self, cache_key: str, compute: Compute) -> None:
+        # Блокировку держит другой воркер - он и обновит значение.
+        try:
+            async with self._lock.hold(cache_key) as acquired:
+                if acquired:
+                    await self._compute_and_store(cache_key, compute, None)
+        except Exception:
+            logger.opt(exception=True).warning(
+                'Не удалось обновить значение кеша {0}',
+                cache_key,
+                labels=_LABELS,
+            )
+
+    async def _compute_once(
+        self,
+        cache_key: str,
+        compute: Compute,
+        session: Any,
+    ) -> Any:
+        try:
+            async with self._lock.hold(cache_key) as acquired:
+                if acquired:
+                    return await self._compute_and_store(
+                        cache_key,
+                        compute,
+                        session,
+                    )
+        except RedisError as ex:
+            self._on_redis_error('Блокировка кеша недоступна', ex)
+            return await self._compute_uncached(compute, session)
+        entry = await self._wait_for_entry(cache_key)
+        if entry is None:
+            return await self._compute_and_store(cache_key, compute, session)
+        return self._load(entry.cached)
+
+    async def _compute_and_store(
+        self,
+        cache_key: str,
+        compute: Compute,
+        session: Any,
+    ) -> Any:
+        started_at = time.perf_counter()
+        encoded = SERIALIZERS.dump(await self._compute(compute, session))
+        payload = '{0:.3f} {1:.4f} {2}'.format(
+            time.time() + self._policy.ttl_seconds,
+            time.perf_counter() - started_at,
+            encoded.decode(),
+        )
+        lifetime = self._policy.ttl_seconds + self._policy.stale_seconds
+        try:
+            await self._redis.set(
+                cache_key,
+                payload,
+                px=int(lifetime * _MS_IN_SECOND),
+            )
+        except RedisError as ex:
+            self._on_redis_error('Не удалось записать значение в кеш', ex)
+        # Вычисленное значение проходит тот же путь, что и прочитанное
+        # из кеша, поэтому вызывающий всегда получает один тип.
+        return self._load(orjson.loads(encoded))
+
+    async def _compute_uncached(self, compute: Compute, session: Any) -> Any:
+        computed = await self._compute(compute, session)
+        return self._load(orjson.loads(SERIALIZERS.dump(computed)))
+
+    async def _compute(self, compute: Compute, session: Any) -> Any:
+        if session is not None:
+            return await compute(session)
+        async with self._session_factory() as own_session:
+            return await compute(own_session)
+
+    async def _read(self, cache_key: str) -> Optional[_CacheEntry]:
+        payload = await self._redis.get(cache_key)
+        if payload is None:
+            return None
+        expires_at, delta, cached = payload.split(' ', 2)
+        return _CacheEntry(
+            orjson.loads(cached),
+            float(delta),
+            float(expires_at),
+        )
+
+    async def _wait_for_entry(self, cache_key: str) -> Optional[_CacheEntry]:
+        deadline = time.monotonic() + CACHE_LOCK_TIMEOUT_SECONDS
+        while time.monotonic() < deadline:
+            await asyncio.sleep(CACHE_LOCK_POLL_SECONDS)
+            try:
+                entry = await self._read(cache_key)
+            except RedisError as ex:
+                self._on_redis_error('Кеш недоступен', ex)
+                return None
+            if entry is not None:
+                return entry
+        return None
+
+    def _on_redis_error(self, message: str, ex: RedisError) -> None:
+        CACHE_LOOKUPS.labels(self._name, 'error').inc()
+        logger.warning('{0}: {1}', message, ex, labels=_LABELS)
@@ -0,0 +1,145 @@
+import atexit
+import os
+import queue
+import threading
+from typing import Final, Optional
+
+import orjson
+
+_EXPORT_BATCH_SIZE: Final = 256
+_CLOSE_TIMEOUT_SECONDS: Final = 5
+_POLL_INTERVAL_SECONDS: Final = 0.5
+_ROTATED_SUFFIX: Final = '.1'
+
+
+class JsonFileSpanExporter:  # noqa: WPS214
+    """
+    Экспортер, дописывающий завершенные трассировки в файл JSON Lines.
+
+    Запись выполняется фоновым потоком, поэтому завершение трассировки
+    только кладет ее участки в ограниченную очередь. Если очередь
+    заполнена, трассировка отбрасывается и учитывается в счетчике
+    dropped. Трассировки, которые не удалось записать, учитываются
+    в счетчике failed. Файл больше max_bytes переименовывается
+    с суффиксом .1, поэтому на диске хранится не больше двух файлов.
+
+    Attributes:
+        stats (dict[str, int]): Счетчики записанных, отброшенных
+        и не записанных трассировок.
+    """
+
+    def __init__(self, path: str, max_queue_size: int, max_bytes: int):
+        """
+        Инициализирует экспортер.
+
+        Args:
+            path (str): Путь к файлу трассировок.
+            max_queue_size (int): Максимальное число трассировок в очереди.
+            max_bytes (int): Размер файла, после которого он ротируется.
+        """
+        self._path = path
+        self._max_queue_size = max_queue_size
+        self._max_bytes = max_bytes
+        self._start_lock = threading.Lock()
+        self._pid: Optional[int] = None
+        self._stats_lock = threading.Lock()
+        self._stats = {'exported': 0, 'dropped': 0, 'failed': 0}
+
+    def export(self, spans: list[dict]) -> None:
+        """
+        Ставит участки трассировки в очередь на запись.
+
+        Args:
+            spans (list[dict]): Участки завершенной трассировки.
+        """
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(spans)
+        except queue.Full:
+            self._count('dropped', 1)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Возвращает счетчики экспорта трассировок.
+
+        Returns:
+            dict[str, int]: Записанные, отброшенные и не записанные
+            трассировки.
+        """
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def close(self) -> None:
+        """Останавливает фоновый поток, записав накопленные участки."""
+        if self._pid != os.getpid():
+            return
+        self._stop_event.set()
+        self._thread.join(_CLOSE_TIMEOUT_SECONDS)
+
+    def _ensure_started(self) -> None:
+        # После fork поток родителя в дочернем процессе не существует,
+        # поэтому очередь и поток создаются заново.
+        if self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            self._queue: queue.Queue = queue.Queue(self._max_queue_size)
+            self._stop_event = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run,
+                name='trace-exporter',
+                daemon=True,
+            )
+            self._thread.start()
+            self._pid = os.getpid()
+            atexit.register(self.close)
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set() or not self._queue.empty():
+            traces = self._collect_batch()
+            if not traces:
+                continue
+            try:
+                self._write(traces)
+            except OSError:
+                self._count('failed', len(traces))
+            else:
+                self._count('exported', len(traces))
+
+    def _collect_batch(self) -> list:
+        try:
+            traces = [self._queue.get(timeout=_POLL_INTERVAL_SECONDS)]
+        except queue.Empty:
+            return []
+        while len(traces) < _EXPORT_BATCH_SIZE:
+            try:
+                traces.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return traces
+
+    def _write(self, traces: list) -> None:
+        self._rotate_if_full()
+        lines = [
+            orjson.dumps(span, option=orjson.OPT_APPEND_NEWLINE)
+            for spans in traces
+            for span in spans
+        ]
+        with open(self._path, 'ab') as trace_file:
+            trace_file.write(b''.join(lines))
+
+    def _rotate_if_full(self) -> None:
+        try:
+            size = os.path.getsize(self._path)
+        except FileNotFoundError:
+            return
+        if size >= self._max_bytes:
+            # Воркеры открывают файл заново для каждого пакета, поэтому
+            # после переименования все пишут в новый файл.
+            os.replace(self._path, self._path + _ROTATED_SUFFIX)
+
+    def _count(self, counter: str, traces_count: int) -> None:
+        with self._stats_lock:
+            self._stats[counter] += traces_count
@@ -0,0 +1,195 @@
+import contextlib
+import inspect
+import random
+import secrets
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Callable, Final, Iterator, Optional
+
+from src.configs.tracing_config import (
+    TRACE_EXPORT_MAX_BYTES,
+    TRACE_EXPORT_MAX_QUEUE_SIZE,
+    TRACE_EXPORT_PATH,
+    TRACE_SAMPLE_RATE,
+)
+from src.utils.trace_exporter import JsonFileSpanExporter
+
+_TRACE_ID_BYTES: Final = 16
+_SPAN_ID_BYTES: Final = 8
+_NS_IN_MS: Final = 10 ** 6
+
+
+@dataclass
+class _Trace:
+    trace_id: str
+    sampled: bool
+    spans: list = field(default_factory=list)
+
+
+@dataclass
+class Span:
+    """
+    Участок трассировки.
+
+    Attributes:
+        name (str): Имя участка.
+        trace (_Trace): Трассировка, к которой относится участок.
+        span_id (str): Идентификатор участка.
+        parent_id (Optional[str]): Идентификатор родительского участка.
+        attributes (dict): Дополнительные атрибуты участка.
+    """
+
+    name: str
+    trace: _Trace
+    span_id: str
+    parent_id: Optional[str] = None
+    attributes: dict = field(default_factory=dict)
+    started_at_ns: int = 0
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar(
+    'current_span',
+    default=None,
+)
+_exporter: Final = JsonFileSpanExporter(
+    TRACE_EXPORT_PATH,
+    max_queue_size=TRACE_EXPORT_MAX_QUEUE_SIZE,
+    max_bytes=TRACE_EXPORT_MAX_BYTES,
+)
+
+
+def current_trace_id() -> Optional[str]:
+    """
+    Возвращает идентификатор текущей трассировки.
+
+    Returns:
+        Optional[str]: Идентификатор трассировки или None вне участка.
+    """
+    span = _current_span.get()
+    return span.trace.trace_id if span is not None else None
+
+
+@contextlib.contextmanager
+def start_span(name: str, **attributes) -> Iterator[Optional[Span]]:
+    """
+    Открывает участок трассировки на время блока with.
+
+    Решение о записи трассировки принимается при открытии корневого
+    участка с вероятностью TRACE_SAMPLE_RATE и наследуется вложенными
+    участками. Внутри невыбранной трассировки вложенные участки
+    не создаются, но идентификатор трассировки доступен для логов.
+
+    Args:
+        name (str): Имя участка.
+        attributes: Атрибуты участка.
+
+    Yields:
+        Optional[Span]: Открытый участок или текущий участок
+        невыбранной трассировки.
+    """
+    parent = _current_span.get()
+    if parent is not None and not parent.trace.sampled:
+        yield parent
+        return
+
+    if parent is None:
+        trace = _Trace(
+            trace_id=secrets.token_hex(_TRACE_ID_BYTES),
+            sampled=random.random() < TRACE_SAMPLE_RATE,  # noqa: S311
+        )
+    else:
+        trace = parent.trace
+    span = Span(
+        name=name,
+        trace=trace,
+        span_id=secrets.token_hex(_SPAN_ID_BYTES),
+        parent_id=parent.span_id if parent is not None else None,
+        attributes=attributes,
+        started_at_ns=time.time_ns(),
+    )
+    token = _current_span.set(span)
+    try:  # noqa: WPS501
+        yield span
+    finally:
+        _current_span.reset(token)
+        if trace.sampled:
+            _finish(span, is_root=parent is None)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """
+    Декоратор, выполняющий функцию внутри участка трассировки.
+
+    Поддерживает обычные и асинхронные функции.
+
+    Args:
+        name (Optional[str]): Имя участка. По умолчанию
+        квалифицированное имя функции.
+
+    Returns:
+        Callable: Декоратор.
+    """
+    def decorator(func: Callable) -> Callable:  # noqa: WPS430
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):  # noqa: WPS430
+                with start_span(span_name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):  # noqa: WPS430
+            with start_span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class TracingMiddleware:
+    """ASGI middleware, открывающий корневой участок для HTTP-запроса."""
+
+    def __init__(self, app):
+        """
+        Инициализирует middleware.
+
+        Args:
+            app: Оборачиваемое ASGI-приложение.
+        """
+        self._app = app
+
+    async def __call__(self, scope, receive, send):
+        """
+        Обрабатывает ASGI-вызов.
+
+        Args:
+            scope: ASGI scope.
+            receive: ASGI receive.
+            send: ASGI send.
+        """
+        if scope['type'] != 'http':
+            await self._app(scope, receive, send)
+            return
+        span_name = '{0} {1}'.format(scope['method'], scope['path'])
+        with start_span(span_name):
+            await self._app(scope, receive, send)
+
+
+def _finish(span: Span, is_root: bool) -> None:
+    finished_at_ns = time.time_ns()
+    span.trace.spans.append(
+        {
+            'trace_id': span.trace.trace_id,
+            'span_id': span.span_id,
+            'parent_id': span.parent_id,
+            'name': span.name,
+            'start_ns': span.started_at_ns,
+            'duration_ms': (finished_at_ns - span.started_at_ns) / _NS_IN_MS,
+            'attributes': span.attributes,
+        },
+    )
+    if is_root:
+        _exporter.export(span.trace.spans)
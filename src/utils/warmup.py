@@ -0,0 +1,128 @@
+import asyncio
+import time
+from types import MappingProxyType
+from typing import Awaitable, Callable, Final, Optional
+
+from src.configs.logger_settings.logger_config import logger
+from src.configs.warmup_config import (
+    WARMUP_RETRY_INTERVAL_SECONDS,
+    WARMUP_STEPS,
+)
+
+_LABELS: Final = MappingProxyType({'module': 'warmup'})
+_MS_IN_SECOND: Final = 1000
+
+WarmUpStep = Callable[[], Awaitable[None]]
+
+
+class WarmUp:
+    """
+    Реестр шагов прогрева, выполняемых при старте приложения.
+
+    Модули регистрируют шаги по имени. Переменная окружения WARMUP_STEPS
+    ограничивает набор выполняемых шагов; по умолчанию выполняются все.
+    Ошибка шага записывается в лог и не прерывает остальные шаги.
+    Обязательные шаги, завершившиеся ошибкой, повторяются каждые
+    retry_interval секунд, и до их успеха приложение не готово.
+
+    Attributes:
+        ready (bool): Завершен ли прогрев и выполнены ли обязательные шаги.
+        failed_steps (list[str]): Шаги, завершившиеся ошибкой.
+
+    Methods:
+        register: Регистрирует шаг прогрева.
+        run: Выполняет зарегистрированные шаги.
+    """
+
+    def __init__(
+        self,
+        enabled_steps: Optional[frozenset[str]] = None,
+        retry_interval: float = WARMUP_RETRY_INTERVAL_SECONDS,
+    ):
+        """
+        Инициализирует реестр.
+
+        Args:
+            enabled_steps (Optional[frozenset[str]]): Имена выполняемых
+            шагов. None означает все шаги.
+            retry_interval (float): Пауза между повторами обязательных
+            шагов в секундах.
+        """
+        self._enabled_steps = enabled_steps
+        self._retry_interval = retry_interval
+        self._steps: dict[str, WarmUpStep] = {}
+        self._required_steps: set[str] = set()
+        self._completed = False
+        self.failed_steps: list[str] = []
+
+    @property
+    def ready(self) -> bool:
+        """
+        Возвращает, готово ли приложение принимать запросы.
+
+        Returns:
+            bool: True, если все шаги выполнены хотя бы раз
+            и ни один обязательный шаг не завершился ошибкой.
+        """
+        return self._completed and not self._failed_required_steps()
+
+    def register(
+        self,
+        name: str,
+        step: WarmUpStep,
+        required: bool = False,
+    ) -> None:
+        """
+        Регистрирует шаг прогрева.
+
+        Args:
+            name (str): Имя шага.
+            step (WarmUpStep): Асинхронная функция без аргументов.
+            required (bool): Без успешного выполнения шага приложение
+            не готово, а сам шаг повторяется.
+        """
+        self._steps[name] = step
+        if required:
+            self._required_steps.add(name)
+
+    async def run(self) -> None:
+        """Выполняет шаги по порядку регистрации и повторяет обязательные."""
+        for name, step in self._steps.items():
+            if self._enabled_steps is None or name in self._enabled_steps:
+                await self._run_step(name, step)
+        self._completed = True
+        while self._failed_required_steps():
+            await asyncio.sleep(self._retry_interval)
+            for failed_name in self._failed_required_steps():
+                await self._run_step(failed_name, self._steps[failed_name])
+
+    def _failed_required_steps(self) -> list[str]:
+        return [
+            name for name in self.failed_steps
+            if name in self._required_steps
+        ]
+
+    async def _run_step(self, name: str, step: WarmUpStep) -> None:
+        started_at = time.perf_counter()
+        try:
+            await step()
+        except Exception:
+            if name not in self.failed_steps:
+                self.failed_steps.append(name)
+            logger.opt(exception=True).warning(
+                'Шаг прогрева {0} завершился ошибкой',
+                name,
+                labels=_LABELS,
+            )
+            return
+        if name in self.failed_steps:
+            self.failed_steps.remove(name)
+        logger.info(
+            'Шаг прогрева {0} выполнен за {1:.1f} мс',
+            name,
+            (time.perf_counter() - started_at) * _MS_IN_SECOND,
+            labels=_LABELS,
+        )
+
+
+WARM_UP: Final = WarmUp(WARMUP_STEPS)
@@ -0,0 +1,101 @@
+import uuid
+
+import pytest
+
+from src.auth.auth_service_aggregator import AuthServiceAggregator
+from src.auth.schemas.tokens import AccessToken, RefreshToken, Tokens
+from tests.auth.utils.tokens.jwt_config import SECRET_KEY_HS256
+
+_MODULE = 'src.auth.auth_service_aggregator'
+_ISSUED_ACCESS = 'access'
+
+
+async def _without_session(func, *args, **kwargs):
+    return await func(None, *args, **kwargs)
+
+
+class _RefreshService:
+    def __init__(self):
+        self.calls = 0
+
+    async def refresh(self, session, refresh_token: RefreshToken) -> Tokens:
+        self.calls += 1
+        return Tokens(
+            access_token=_ISSUED_ACCESS,
+            refresh_token=uuid.uuid4(),
+        )
+
+
+class _LogoutService:
+    async def logout(self, session, refresh_token: RefreshToken) -> None:
+        """Выход без базы данных."""
+
+    async def logout_from_all_devices(
+        self,
+        session,
+        access_token: AccessToken,
+    ) -> None:
+        """Выход со всех устройств без базы данных."""
+
+
+@pytest.fixture
+def refresh_service():
+    return _RefreshService()
+
+
+@pytest.fixture
+def aggregator(monkeypatch, redis, refresh_service):
+    monkeypatch.setattr(
+        '{0}.get_secret_key'.format(_MODULE),
+        lambda: SECRET_KEY_HS256,
+    )
+    monkeypatch.setattr(
+        '{0}.get_public_key'.format(_MODULE),
+        lambda: SECRET_KEY_HS256,
+    )
+    monkeypatch.setattr('{0}.get_redis_client'.format(_MODULE), lambda: redis)
+    monkeypatch.setattr(
+        '{0}.session_connect'.format(_MODULE),
+        _without_session,
+    )
+    auth_service = AuthServiceAggregator()
+    monkeypatch.setattr(auth_service, '_refresh_service', refresh_service)
+    monkeypatch.setattr(auth_service, '_logout_service', _LogoutService())
+    return auth_service
+
+
+class TestRefreshAfterLogout:
+    @pytest.mark.asyncio
+    async def test_logout_forgets_rotated_pair(
+        self,
+        aggregator,
+        refresh_service,
+    ):
+        old_token = RefreshToken(refresh_token=uuid.uuid4())
+        tokens = await aggregator.refresh(old_token)
+        assert await aggregator.refresh(old_token) == tokens
+        assert refresh_service.calls == 1
+
+        await aggregator.logout(
+            RefreshToken(refresh_token=tokens.refresh_token),
+        )
+        replayed = await aggregator.refresh(old_token)
+
+        assert refresh_service.calls == 2
+        assert replayed != tokens
+
+    @pytest.mark.asyncio
+    async def test_logout_from_all_devices_forgets_pairs(
+        self,
+        aggregator,
+        refresh_service,
+    ):
+        old_token = RefreshToken(refresh_token=uuid.uuid4())
+        await aggregator.refresh(old_token)
+
+        await aggregator.logout_from_all_devices(
+            AccessToken(access_token=_ISSUED_ACCESS),
+        )
+        await aggregator.refresh(old_token)
+
+        assert refresh_service.calls == 2
@@ -0,0 +1,50 @@
+import uuid
+from typing import Optional
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.auth.router import router
+from src.auth.schemas.tokens import Tokens
+from src.auth.schemas.user import UserAuth
+
+_ISSUED_ACCESS = 'issued'
+_LOGIN = 'storekeeper'
+
+
+class _AuthService:
+    def __init__(self):
+        self.client_ips = []
+
+    async def authenticate(
+        self,
+        user_auth: UserAuth,
+        client_ip: Optional[str] = None,
+    ):
+        self.client_ips.append(client_ip)
+        return Tokens(access_token=_ISSUED_ACCESS, refresh_token=uuid.uuid4())
+
+
+@pytest.fixture
+def auth_service(monkeypatch):
+    fake_service = _AuthService()
+    monkeypatch.setattr(
+        'src.auth.router.get_auth_service',
+        lambda: fake_service,
+    )
+    return fake_service
+
+
+class TestLogin:
+    def test_passes_client_ip_to_throttler(self, auth_service):
+        app = FastAPI()
+        app.include_router(router)
+
+        response = TestClient(app).post(
+            '/auth/login',
+            json={'login': _LOGIN, 'password': _LOGIN},
+        )
+
+        assert response.status_code == 200
+        assert auth_service.client_ips == ['testclient']
@@ -0,0 +1,90 @@
+import pytest
+from fakeredis import FakeAsyncRedis, FakeServer
+
+from src.auth.utils.exceptions import TooManyLoginAttemptsError
+from src.auth.utils.login_throttler import LoginThrottler, SlidingWindowLimit
+from src.utils.metrics import AUTH_LOGIN_THROTTLE
+
+_LOGIN = 'storekeeper'
+_CLIENT_IP = '10.0.0.1'
+
+
+def _throttler(redis) -> LoginThrottler:
+    return LoginThrottler(
+        redis,
+        login_limit=SlidingWindowLimit('login', 60, 2),
+        ip_limit=SlidingWindowLimit('ip', 60, 3),
+    )
+
+
+def _published(outcome: str) -> float:
+    for metric in AUTH_LOGIN_THROTTLE.collect():
+        for sample in metric.samples:
+            if sample.name.endswith('_total'):
+                if sample.labels == {'outcome': outcome}:
+                    return sample.value
+    return 0
+
+
+class TestLoginThrottler:
+    @pytest.mark.asyncio
+    async def test_blocks_login_after_limit(self, redis):
+        throttler = _throttler(redis)
+        await throttler.check(_LOGIN, _CLIENT_IP)
+        await throttler.check(_LOGIN, _CLIENT_IP)
+
+        with pytest.raises(TooManyLoginAttemptsError) as blocked:
+            await throttler.check(_LOGIN, _CLIENT_IP)
+
+        retry_after = int(blocked.value.headers['Retry-After'])  # noqa: WPS441
+        assert 0 < retry_after <= 60
+        assert throttler.counters == {'allowed': 2, 'throttled_login': 1}
+
+    @pytest.mark.asyncio
+    async def test_blocks_ip_across_logins(self, redis):
+        throttler = _throttler(redis)
+        for login in ('first', 'second', 'third'):
+            await throttler.check(login, _CLIENT_IP)
+
+        with pytest.raises(TooManyLoginAttemptsError):
+            await throttler.check('fourth', _CLIENT_IP)
+        await throttler.check('fourth', '10.0.0.2')
+
+        assert throttler.counters['throttled_ip'] == 1
+
+    @pytest.mark.asyncio
+    async def test_reset_clears_login_window(self, redis):
+        throttler = _throttler(redis)
+        await throttler.check(_LOGIN)
+        await throttler.check(_LOGIN)
+
+        await throttler.reset(_LOGIN)
+        await throttler.check(_LOGIN)
+
+        assert await throttler.attempts(_LOGIN) == {'login': 1}
+
+    @pytest.mark.asyncio
+    async def test_fails_open_when_redis_is_down(self):
+        server = FakeServer()
+        server.connected = False
+        throttler = _throttler(FakeAsyncRedis(server=server))
+
+        for _ in range(3):
+            await throttler.check(_LOGIN, _CLIENT_IP)
+        await throttler.reset(_LOGIN)
+
+        assert throttler.counters == {'redis_errors': 4}
+
+    @pytest.mark.asyncio
+    async def test_publishes_outcomes_to_metrics(self, redis):
+        throttler = _throttler(redis)
+        allowed_before = _published('allowed')
+        throttled_before = _published('throttled_login')
+
+        await throttler.check(_LOGIN)
+        await throttler.check(_LOGIN)
+        with pytest.raises(TooManyLoginAttemptsError):
+            await throttler.check(_LOGIN)
+
+        assert _published('allowed') == allowed_before + 2
+        assert _published('throttled_login') == throttled_before + 1
@@ -0,0 +1,86 @@
+import pytest
+from passlib.context import CryptContext
+
+from src.auth.utils.password_manager import PasswordManager
+
+_PASSWORD = 'password'  # noqa: S105
+
+
+def _sha256_context(rounds: int) -> CryptContext:
+    return CryptContext(
+        schemes=['sha256_crypt', 'md5_crypt'],
+        deprecated='auto',
+        sha256_crypt__rounds=rounds,
+        sha256_crypt__min_rounds=rounds,
+    )
+
+
+@pytest.fixture
+def password_manager():
+    return PasswordManager(_sha256_context(rounds=2000))
+
+
+class TestPasswordManager:
+    def test_hash_and_compare(self, password_manager: PasswordManager):
+        password_hash = password_manager.hash(_PASSWORD)
+
+        assert password_manager.compare(_PASSWORD, password_hash)
+        assert not password_manager.compare('wrong', password_hash)
+        assert not password_manager.needs_update(password_hash)
+
+    def test_verify_and_update_current_hash(
+        self,
+        password_manager: PasswordManager,
+    ):
+        password_hash = password_manager.hash(_PASSWORD)
+
+        assert password_manager.verify_and_update(
+            _PASSWORD,
+            password_hash,
+        ) == (True, None)
+
+    def test_verify_and_update_outdated_cost(
+        self,
+        password_manager: PasswordManager,
+    ):
+        outdated_hash = PasswordManager(_sha256_context(rounds=1000)).hash(
+            _PASSWORD,
+        )
+        assert password_manager.needs_update(outdated_hash)
+
+        is_valid, new_hash = password_manager.verify_and_update(
+            _PASSWORD,
+            outdated_hash,
+        )
+
+        assert is_valid
+        assert new_hash is not None
+        assert not password_manager.needs_update(new_hash)
+        assert password_manager.compare(_PASSWORD, new_hash)
+
+    def test_verify_and_update_deprecated_scheme(
+        self,
+        password_manager: PasswordManager,
+    ):
+        legacy_hash = CryptContext(schemes=['md5_crypt']).hash(_PASSWORD)
+
+        is_valid, new_hash = password_manager.verify_and_update(
+            _PASSWORD,
+            legacy_hash,
+        )
+
+        assert is_valid
+        assert new_hash.startswith('$5$')
+
+    def test_verify_and_update_wrong_password(
+        self,
+        password_manager: PasswordManager,
+    ):
+        outdated_hash = PasswordManager(_sha256_context(rounds=1000)).hash(
+            _PASSWORD,
+        )
+
+        assert password_manager.verify_and_update(
+            'wrong',
+            outdated_hash,
+        ) == (False, None)
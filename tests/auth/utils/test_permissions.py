@@ -0,0 +1,86 @@
+import uuid
+
+import pytest
+
+from src.auth.utils.constants import PERMISSIONS_CLAIM, ROLE_CLAIM
+from src.auth.utils.permissions import (
+    Permissions,
+    has_permissions,
+    permissions_for_role,
+    permissions_from_claims,
+)
+from src.auth.utils.tokens.access_token_decoder import AccessTokenDecoder
+from src.auth.utils.tokens.token_factory import TokenFactory
+from tests.auth.utils.tokens.jwt_config import ALGORITHM_HS256, SECRET_KEY_HS256
+
+
+class TestPermissions:
+    @pytest.mark.parametrize('role, expected', [
+        ('reader', Permissions.read),
+        ('writer', Permissions.read | Permissions.write),
+        (
+            'admin',
+            Permissions.read | Permissions.write | Permissions.manage_users,
+        ),
+        ('unknown', Permissions.none),
+        (None, Permissions.none),
+    ])
+    def test_permissions_for_role(
+        self,
+        role: str,
+        expected: Permissions,
+    ):
+        assert permissions_for_role(role) == expected
+
+    @pytest.mark.parametrize('role, required, expected', [
+        ('reader', Permissions.read, True),
+        ('reader', Permissions.write, False),
+        ('writer', Permissions.read | Permissions.write, True),
+        ('writer', Permissions.manage_users, False),
+        ('admin', Permissions.manage_users, True),
+    ])
+    def test_has_permissions(
+        self,
+        role: str,
+        required: Permissions,
+        expected: bool,
+    ):
+        payload = {PERMISSIONS_CLAIM: int(permissions_for_role(role))}
+        assert has_permissions(payload, required) is expected
+
+    def test_payload_without_claims(self):
+        assert permissions_from_claims({}) == Permissions.none
+        assert not has_permissions({}, Permissions.read)
+
+
+class TestRoleClaims:
+    @pytest.fixture
+    def token_factory(self):
+        return TokenFactory(60, SECRET_KEY_HS256, ALGORITHM_HS256)
+
+    @pytest.fixture
+    def token_decoder(self):
+        return AccessTokenDecoder(SECRET_KEY_HS256, ALGORITHM_HS256)
+
+    def test_role_claims_round_trip(
+        self,
+        token_factory: TokenFactory,
+        token_decoder: AccessTokenDecoder,
+    ):
+        tokens = token_factory.create_token(uuid.uuid4(), 'writer')
+        payload = token_decoder.decode_token(tokens.access_token)
+
+        assert payload[ROLE_CLAIM] == 'writer'
+        assert has_permissions(payload, Permissions.write)
+        assert not has_permissions(payload, Permissions.manage_users)
+
+    def test_token_without_role(
+        self,
+        token_factory: TokenFactory,
+        token_decoder: AccessTokenDecoder,
+    ):
+        tokens = token_factory.create_token(uuid.uuid4())
+        payload = token_decoder.decode_token(tokens.access_token)
+
+        assert ROLE_CLAIM not in payload
+        assert PERMISSIONS_CLAIM not in payload
@@ -4,6 +4,7 @@ from typing import Any, Union
 import pytest
 from freezegun import freeze_time
 from jose import jwt
+from loguru import logger
 
 from src.auth.utils.exceptions import (
     InvalidAccessTokenError,
@@ -29,6 +30,14 @@ def token_decoder(request):
     return AccessTokenDecoder(verification_key=key, algorithm_name=algorithm)
 
 
+@pytest.fixture
+def records():
+    captured = []
+    sink_id = logger.add(captured.append, format='{message}')
+    yield captured
+    logger.remove(sink_id)
+
+
 def _create_access_token(algorithm: str, payload: dict):
     if algorithm == ALGORITHM_HS256:
         return jwt.encode(payload, SECRET_KEY_HS256, algorithm=algorithm)
@@ -36,7 +45,7 @@ def _create_access_token(algorithm: str, payload: dict):
         return jwt.encode(payload, SECRET_KEY_RSA, algorithm=algorithm)
 
 
-class TestAccessTokenDecoder:
+class TestAccessTokenDecoder:  # noqa: WPS214
     @pytest.mark.parametrize('verification_key', [
         SECRET_KEY_HS256,
         PUBLIC_KEY_RSA,
@@ -147,3 +156,61 @@ class TestAccessTokenDecoder:
 
         with pytest.raises(InvalidAccessTokenError):
             token_decoder.decode_token(access_token)
+
+    def test_decode_tokens_batch(
+        self,
+        token_decoder: AccessTokenDecoder,
+    ):
+        algorithm = token_decoder._algorithm_name
+        current_time = datetime.now(timezone.utc)
+        valid_token = _create_access_token(algorithm, {
+            'sub': '1',
+            'exp': current_time + timedelta(hours=1),
+        })
+        expired_token = _create_access_token(algorithm, {
+            'sub': '2',
+            'exp': current_time - timedelta(hours=1),
+        })
+
+        introspections = token_decoder.decode_tokens(
+            [valid_token, expired_token, 'not a token'],
+        )
+
+        assert introspections[0].active
+        assert introspections[0].claims['sub'] == '1'
+        assert introspections[1].error == 'expired'
+        assert introspections[2].error == 'invalid'
+        assert not introspections[2].active
+
+    def test_cached_token_expires(
+        self,
+        token_decoder: AccessTokenDecoder,
+    ):
+        algorithm = token_decoder._algorithm_name
+        current_time = datetime.now(timezone.utc)
+        access_token = _create_access_token(algorithm, {
+            'sub': '1',
+            'exp': current_time + timedelta(minutes=5),
+        })
+
+        assert token_decoder.decode_token(access_token)['sub'] == '1'
+        with freeze_time(current_time + timedelta(minutes=6)):
+            with pytest.raises(TokenExpiredError):
+                token_decoder.decode_token(access_token)
+
+    def test_rejected_token_is_not_logged(
+        self,
+        token_decoder: AccessTokenDecoder,
+        records: list,
+    ):
+        algorithm = token_decoder._algorithm_name
+        access_token = _create_access_token(algorithm, {
+            'sub': '1',
+            'exp': datetime.now(timezone.utc) - timedelta(hours=1),
+        })
+
+        with pytest.raises(TokenExpiredError):
+            token_decoder.decode_token(access_token)
+
+        assert records
+        assert all(access_token not in record for record in records)
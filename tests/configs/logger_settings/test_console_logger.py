@@ -0,0 +1,52 @@
+import io
+import json
+from types import MappingProxyType
+
+import pytest
+from loguru import logger
+
+from src.configs.logger_settings.console_logger import (  # noqa: WPS450
+    _JsonConsoleSink,
+)
+
+
+class _BrokenStream(io.BytesIO):
+    def write(self, lines):  # noqa: WPS110
+        raise OSError('Поток вывода закрыт')
+
+
+@pytest.fixture
+def log_to():
+    handler_ids = []
+
+    def add_sink(sink):  # noqa: WPS430
+        handler_ids.append(logger.add(sink, level='DEBUG'))
+        return sink
+
+    yield add_sink
+    for handler_id in handler_ids:
+        logger.remove(handler_id)
+
+
+class TestJsonConsoleSink:
+    def test_serializes_mapping_labels(self, log_to):
+        stream = io.BytesIO()
+        sink = log_to(_JsonConsoleSink(stream))
+
+        logger.info(
+            'Склад обновлен',
+            labels=MappingProxyType({'module': 'console'}),
+        )
+        sink.close()
+
+        record = json.loads(stream.getvalue().splitlines()[-1])
+        assert record['message'] == 'Склад обновлен'
+        assert record['extra']['labels'] == {'module': 'console'}
+
+    def test_counts_records_lost_on_write_error(self, log_to):
+        sink = log_to(_JsonConsoleSink(_BrokenStream()))
+
+        logger.info('Склад обновлен')
+        sink.close()
+
+        assert sink.dropped == 1
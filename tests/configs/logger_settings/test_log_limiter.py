@@ -0,0 +1,117 @@
+import time
+
+from src.configs.logger_settings.log_limiter import (
+    SUPPRESSED_CALLSITE_KEY,
+    LogLimit,
+    LogLimiter,
+    SuppressedLogs,
+)
+
+_WAIT_TIMEOUT_SECONDS = 5
+
+
+def _record(message: str = 'message', line: int = 1, labels=None) -> dict:
+    return {
+        'name': 'module',
+        'function': 'function',
+        'line': line,
+        'message': message,
+        'extra': {'labels': labels or {}},
+    }
+
+
+def _wait_for(condition) -> bool:
+    deadline = time.monotonic() + _WAIT_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def _passed(limiter: LogLimiter, record: dict) -> bool:
+    limiter.patch(record)
+    return limiter.filter(record)
+
+
+class TestLogLimiter:
+    def test_burst_is_limited_per_callsite(self):
+        limiter = LogLimiter(
+            default_limit=LogLimit(rate=0, burst=3),
+            limits={},
+            max_message_length=100,
+        )
+
+        first_callsite = [_passed(limiter, _record()) for _ in range(5)]
+        second_callsite = _passed(limiter, _record(line=2))
+
+        assert first_callsite == [True, True, True, False, False]
+        assert second_callsite
+
+    def test_next_record_reports_suppressed(self):
+        limiter = LogLimiter(
+            default_limit=LogLimit(rate=10, burst=1),
+            limits={},
+            max_message_length=100,
+        )
+        for _ in range(4):
+            _passed(limiter, _record())
+
+        time.sleep(0.15)
+        record = _record()
+
+        assert _passed(limiter, record)
+        assert record['extra']['suppressed'] == 3
+
+    def test_silent_callsite_is_flushed(self):
+        reported = []
+        limiter = LogLimiter(
+            default_limit=LogLimit(rate=0, burst=1),
+            limits={},
+            max_message_length=100,
+            flush_interval=0.05,
+            report=reported.append,
+        )
+        for _ in range(4):
+            _passed(limiter, _record())
+
+        assert _wait_for(lambda: reported)
+        assert reported == [SuppressedLogs('module', 'function', 1, 3)]
+        assert not limiter.flush_suppressed()
+
+    def test_summary_is_not_limited(self):
+        limiter = LogLimiter(
+            default_limit=LogLimit(rate=0, burst=1),
+            limits={},
+            max_message_length=100,
+        )
+        _passed(limiter, _record())
+        summary = _record()
+        summary['extra'][SUPPRESSED_CALLSITE_KEY] = 'module:function:1'
+
+        assert _passed(limiter, summary)
+
+    def test_label_limit_overrides_default(self):
+        limiter = LogLimiter(
+            default_limit=LogLimit(rate=0, burst=10),
+            limits={'service=auth': LogLimit(rate=0, burst=1)},
+            max_message_length=100,
+        )
+        labels = {'service': 'auth'}
+
+        assert _passed(limiter, _record(labels=labels))
+        assert not _passed(limiter, _record(labels=labels))
+
+    def test_long_message_is_truncated(self):
+        limiter = LogLimiter(
+            default_limit=LogLimit(rate=0, burst=1),
+            limits={},
+            max_message_length=10,
+        )
+        record = _record(message='x' * 25)
+
+        limiter.patch(record)
+
+        assert record['message'] == '{0}... (усечено символов: 15)'.format(
+            'x' * 10,
+        )
@@ -0,0 +1,263 @@
+import json
+import os
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from loguru import logger
+
+from src.configs.logger_settings.loki_logger import (  # noqa: WPS450
+    _build_push_payload,
+    _CustomLoguruFormatter,
+    _loki_handlers,
+    _LokiBatchShipper,
+)
+from src.configs.logger_settings.loki_spool import LokiSpool
+
+_WAIT_TIMEOUT_SECONDS = 5
+
+
+class _LokiStubHandler(BaseHTTPRequestHandler):
+    def do_POST(self):  # noqa: N802
+        content_length = int(self.headers['Content-Length'])
+        payload = json.loads(self.rfile.read(content_length))
+        time.sleep(self.server.delay)
+        status = self.server.status
+        if status == HTTPStatus.NO_CONTENT:
+            self.server.payloads.append(payload)
+            self.server.received.extend(
+                stream_value[1]
+                for stream in payload['streams']
+                for stream_value in stream['values']
+            )
+        self.send_response(status)
+        self.end_headers()
+
+    def log_message(self, *args):
+        """Не пишет запросы заглушки в stderr."""
+
+
+@pytest.fixture
+def loki_stub():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _LokiStubHandler)
+    server.status = HTTPStatus.NO_CONTENT
+    server.received = []
+    server.payloads = []
+    server.delay = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _wait_for(condition) -> bool:
+    deadline = time.monotonic() + _WAIT_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+@pytest.fixture
+def spool(tmp_path):
+    return LokiSpool(
+        directory=str(tmp_path),
+        segment_max_bytes=512,
+        max_segments=100,
+    )
+
+
+@pytest.fixture
+def make_shipper(loki_stub):
+    sinks = []
+
+    def factory(**options) -> _LokiBatchShipper:  # noqa: WPS430
+        loki_shipper = _LokiBatchShipper(
+            url='http://127.0.0.1:{0}/loki/api/v1/push'.format(
+                loki_stub.server_port,
+            ),
+            labels={'app': 'test'},
+            formatter=_CustomLoguruFormatter(),
+            timeout=1,
+            **options,
+        )
+        sinks.append((logger.add(loki_shipper), loki_shipper))
+        return loki_shipper
+
+    yield factory
+    for sink_id, loki_shipper in sinks:
+        logger.remove(sink_id)
+        loki_shipper.close()
+
+
+@pytest.fixture
+def shipper(make_shipper, spool):
+    return make_shipper(
+        flush_interval=0.05,
+        spool=spool,
+        retry_interval=0.1,
+    )
+
+
+class TestLokiBatchShipper:
+    def test_outage_is_spooled_and_replayed(
+        self,
+        loki_stub,
+        spool,
+        shipper,
+        tmp_path,
+    ):
+        loki_stub.status = HTTPStatus.SERVICE_UNAVAILABLE
+        for message_number in range(20):
+            logger.info('message {0}', message_number)
+        assert _wait_for(lambda: shipper.stats['spooled'] == 20)
+        assert list(tmp_path.iterdir())
+
+        loki_stub.status = HTTPStatus.NO_CONTENT
+        assert _wait_for(lambda: len(loki_stub.received) == 20)
+
+        messages = {
+            json.loads(line)['message'] for line in loki_stub.received
+        }
+        assert messages == {
+            'message {0}'.format(number) for number in range(20)
+        }
+        assert _wait_for(lambda: not spool.has_pending())
+
+    def test_full_queue_drops_on_caller_thread(
+        self,
+        loki_stub,
+        make_shipper,
+        spool,
+        tmp_path,
+    ):
+        loki_stub.delay = 0.5
+        loki_shipper = make_shipper(
+            batch_size=1,
+            max_queue_size=1,
+            spool=spool,
+        )
+
+        logger.info('message 0')
+        assert _wait_for(lambda: loki_shipper.stats['queued'] == 0)
+        logger.info('message 1')
+        logger.info('message 2')
+
+        assert loki_shipper.stats['dropped'] == 1
+        assert not list(tmp_path.iterdir())
+
+    def test_batch_is_limited_by_size(self, loki_stub, make_shipper):
+        make_shipper(batch_size=5, flush_interval=_WAIT_TIMEOUT_SECONDS)
+        for message_number in range(12):
+            logger.info('message {0}', message_number)
+
+        assert _wait_for(lambda: len(loki_stub.payloads) == 2)
+        assert [
+            len(payload['streams'][0]['values'])
+            for payload in loki_stub.payloads
+        ] == [5, 5]
+
+    def test_partial_batch_is_flushed_by_interval(
+        self,
+        loki_stub,
+        make_shipper,
+    ):
+        loki_shipper = make_shipper(batch_size=100, flush_interval=0.1)
+        for message_number in range(3):
+            logger.info('message {0}', message_number)
+
+        assert _wait_for(lambda: loki_shipper.stats['sent'] == 3)
+        assert len(loki_stub.payloads) == 1
+
+    def test_entries_are_grouped_by_labels(self, loki_stub, make_shipper):
+        make_shipper(flush_interval=0.2)
+        logger.info('plain')
+        logger.bind(labels={'module': 'auth'}).info('labeled')
+
+        assert _wait_for(lambda: len(loki_stub.received) == 2)
+        streams = {
+            stream['stream'].get('module'): [
+                json.loads(stream_value[1])['message']
+                for stream_value in stream['values']
+            ]
+            for payload in loki_stub.payloads
+            for stream in payload['streams']
+        }
+        assert streams == {None: ['plain'], 'auth': ['labeled']}
+        assert all(
+            stream['stream']['app'] == 'test'
+            for payload in loki_stub.payloads
+            for stream in payload['streams']
+        )
+
+    def test_unexpected_error_keeps_shipping(
+        self,
+        loki_stub,
+        make_shipper,
+        monkeypatch,
+    ):
+        calls = []
+
+        def fail_once(batch):  # noqa: WPS430
+            calls.append(batch)
+            if len(calls) == 1:
+                raise RuntimeError('unexpected')
+            return _build_push_payload(batch)
+
+        monkeypatch.setattr(
+            'src.configs.logger_settings.loki_logger._build_push_payload',
+            fail_once,
+        )
+        loki_shipper = make_shipper(flush_interval=0.05)
+        logger.info('lost')
+        assert _wait_for(lambda: loki_shipper.stats['errors'] == 1)
+
+        logger.info('shipped')
+
+        assert _wait_for(lambda: len(loki_stub.received) == 1)
+        assert 'shipped' in loki_stub.received[0]
+
+    def test_no_handler_without_url(self):
+        assert not _loki_handlers(None)
+
+
+class TestLokiSpool:
+    def test_overflow_drops_oldest_segments(self, tmp_path):
+        spool = LokiSpool(
+            directory=str(tmp_path),
+            segment_max_bytes=64,
+            max_segments=2,
+        )
+        for payload_number in range(10):
+            spool.append({'number': payload_number, 'padding': 'x' * 40})
+
+        replayed = []
+        for _ in range(3):
+            spool.replay(replayed.append, max_payloads=100)
+
+        assert not list(tmp_path.iterdir())
+        assert spool.stats['dropped'] == 8
+        assert [payload['number'] for payload in replayed] == [8, 9]
+
+    def test_overflow_keeps_segments_of_live_workers(self, tmp_path):
+        foreign_segment = tmp_path / '{0}-000000000001.jsonl'.format(
+            os.getppid(),
+        )
+        foreign_segment.write_text(
+            '{0}\n'.format(json.dumps({'streams': []})),
+            encoding='utf-8',
+        )
+        spool = LokiSpool(
+            directory=str(tmp_path),
+            segment_max_bytes=64,
+            max_segments=2,
+        )
+        for payload_number in range(10):
+            spool.append({'number': payload_number, 'padding': 'x' * 40})
+
+        assert foreign_segment.exists()
+        assert spool.stats['dropped'] == 8
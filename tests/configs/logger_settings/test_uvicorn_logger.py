@@ -0,0 +1,99 @@
+import logging
+from types import MappingProxyType, SimpleNamespace
+
+import pytest
+from loguru import logger
+
+from src.configs.logger_settings.uvicorn_logger import (  # noqa: WPS450
+    AccessLogTimingMiddleware,
+    _InterceptHandler,
+)
+
+_MODULE = 'src.configs.logger_settings.uvicorn_logger'
+_USER_ROUTE = '/users/{user_id}'
+
+
+@pytest.fixture
+def records():
+    captured = []
+    sink_id = logger.add(captured.append, format='{message}')
+    yield captured
+    logger.remove(sink_id)
+
+
+def _log_record(name: str, message: str, args: tuple) -> logging.LogRecord:
+    return logging.LogRecord(
+        name=name,
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=1,
+        msg=message,
+        args=args,
+        exc_info=None,
+    )
+
+
+def _access_record(path: str, status: int) -> logging.LogRecord:
+    return _log_record(
+        name='uvicorn.access',
+        message='access',
+        args=('127.0.0.1:5000', 'GET', path, '1.1', status),
+    )
+
+
+async def _serve_and_log(route_path: str, access_record: logging.LogRecord):
+    async def app(scope, receive, send):  # noqa: WPS430
+        scope['route'] = SimpleNamespace(path=route_path)
+        _InterceptHandler().emit(access_record)
+
+    scope = {'type': 'http', 'method': 'GET'}
+    await AccessLogTimingMiddleware(app)(scope, None, None)
+
+
+class TestInterceptHandler:
+    def test_access_record_has_structured_fields(self, records):
+        log_record = _log_record(
+            name='uvicorn.access',
+            message='access',
+            args=('127.0.0.1:5000', 'GET', '/auth/login?next={x}', '1.1', 200),
+        )
+
+        _InterceptHandler().emit(log_record)
+
+        record = records[-1].record
+        assert record['message'] == (
+            '127.0.0.1:5000 - "GET /auth/login?next={x} HTTP/1.1" 200'
+        )
+        assert record['level'].name == 'INFO'
+        assert record['extra']['method'] == 'GET'
+        assert record['extra']['path'] == '/auth/login'
+        assert record['extra']['status'] == 200
+
+    def test_error_record_keeps_message(self, records):
+        log_record = _log_record(
+            name='uvicorn.error',
+            message='Started server process [42] {braces}',
+            args=(),
+        )
+
+        _InterceptHandler().emit(log_record)
+
+        assert records[-1].record['message'] == (
+            'Started server process [42] {braces}'
+        )
+
+    @pytest.mark.asyncio
+    async def test_samples_by_route_template(self, records, monkeypatch):
+        monkeypatch.setattr(
+            '{0}._ACCESS_LOG_ROUTE_SAMPLE_RATES'.format(_MODULE),
+            MappingProxyType({_USER_ROUTE: 0}),
+        )
+
+        await _serve_and_log(_USER_ROUTE, _access_record('/users/42', 200))
+        await _serve_and_log(_USER_ROUTE, _access_record('/users/7', 500))
+        await _serve_and_log('/health', _access_record('/health', 200))
+
+        assert [record.record['extra']['path'] for record in records] == [
+            '/users/7',
+            '/health',
+        ]
@@ -0,0 +1,7 @@
+import pytest
+from fakeredis import FakeAsyncRedis
+
+
+@pytest.fixture
+def redis():
+    return FakeAsyncRedis(decode_responses=True)
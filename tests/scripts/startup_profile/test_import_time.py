@@ -0,0 +1,23 @@
+from src.scripts.startup_profile.import_time import (
+    ImportTiming,
+    parse_import_time,
+)
+
+
+class TestParseImportTime:
+    def test_parses_timings_and_depth(self):
+        lines = [
+            'import time: self [us] | cumulative | imported package',
+            'import time:       120 |        120 |     encodings.aliases',
+            'import time:       300 |        420 |   encodings',
+            'import time:        80 |        500 | src.api',
+        ]
+
+        assert parse_import_time(lines) == [
+            ImportTiming('encodings.aliases', 120, 120, 2),
+            ImportTiming('encodings', 300, 420, 1),
+            ImportTiming('src.api', 80, 500, 0),
+        ]
+
+    def test_skips_unrelated_lines(self):
+        assert not parse_import_time(['Traceback', ''])
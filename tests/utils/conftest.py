@@ -0,0 +1,19 @@
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture
+def make_client():
+    def factory(  # noqa: WPS430
+        router: APIRouter,
+        middleware=None,
+        **options,
+    ) -> TestClient:
+        app = FastAPI()
+        if middleware is not None:
+            app.add_middleware(middleware, **options)
+        app.include_router(router)
+        return TestClient(app)
+
+    return factory
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from src.utils.adaptive_limiter import AdaptiveLimiter, RouteClassPolicy
+
+_CRITICAL = RouteClassPolicy(share=1, queue_timeout=1)
+_BULK = RouteClassPolicy(share=0.5, queue_timeout=0)
+_QUEUED_BULK = RouteClassPolicy(share=0.5, queue_timeout=1)
+
+
+def _limiter(initial_limit: int = 4) -> AdaptiveLimiter:
+    return AdaptiveLimiter(
+        initial_limit=initial_limit,
+        min_limit=1,
+        max_limit=10,
+        target_latency=0.1,
+    )
+
+
+async def _occupy(limiter: AdaptiveLimiter, slots: int) -> None:
+    for _ in range(slots):
+        await limiter.acquire(_CRITICAL)
+
+
+class TestAdaptiveLimiter:
+    @pytest.mark.asyncio
+    async def test_bulk_is_shed_before_critical(self):
+        limiter = _limiter()
+
+        assert await limiter.acquire(_BULK)
+        assert await limiter.acquire(_BULK)
+        assert not await limiter.acquire(_BULK)
+        assert await limiter.acquire(_CRITICAL)
+
+    @pytest.mark.asyncio
+    async def test_critical_waiter_gets_freed_slot_first(self):
+        limiter = _limiter(initial_limit=2)
+        await _occupy(limiter, 2)
+        bulk = asyncio.create_task(limiter.acquire(_QUEUED_BULK))
+        critical = asyncio.create_task(limiter.acquire(_CRITICAL))
+        await asyncio.sleep(0)
+
+        limiter.release(0.01)
+
+        assert await critical
+        assert not bulk.done()
+        bulk.cancel()
+
+    @pytest.mark.asyncio
+    async def test_timed_out_waiter_holds_no_slot(self):
+        limiter = _limiter(initial_limit=2)
+        await _occupy(limiter, 2)
+
+        assert not await limiter.acquire(
+            RouteClassPolicy(share=1, queue_timeout=0.01),
+        )
+        limiter.release(0.01)
+        limiter.release(0.01)
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_limit_backs_off_on_slow_requests(self):
+        limiter = _limiter()
+        await _occupy(limiter, 3)
+
+        limiter.release(1)
+
+        assert limiter.limit == 3
+
+    @pytest.mark.asyncio
+    async def test_limit_grows_on_fast_requests(self):
+        limiter = _limiter(initial_limit=1)
+        await _occupy(limiter, 1)
+
+        limiter.release(0.01)
+
+        assert limiter.limit == 2
@@ -0,0 +1,44 @@
+from sqlalchemy import Column, DateTime, Integer, MetaData
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import declarative_base
+
+from src.utils.base_dao import BaseDAO
+
+_Base = declarative_base(metadata=MetaData())
+
+
+class _Part(_Base):
+    __tablename__ = 'parts'
+
+    part_id = Column(Integer, primary_key=True)
+    updated_at = Column(DateTime)
+
+
+class _PartDAO(BaseDAO):
+    model = _Part
+
+
+class _VersionedPartDAO(BaseDAO):
+    model = _Part
+    version_column = _Part.updated_at
+
+
+def _compiled_version_query(dao: type[BaseDAO]) -> str:
+    query = dao._version_query(part_id=1)  # noqa: WPS437
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+class TestVersionQuery:
+    def test_takes_max_xmin_without_sorting(self):
+        compiled = _compiled_version_query(_PartDAO)
+
+        assert 'max(CAST(CAST(parts.xmin AS TEXT) AS BIGINT))' in compiled
+        assert 'ORDER BY' not in compiled
+        assert 'count(*)' in compiled
+        assert 'WHERE parts.part_id = ' in compiled
+
+    def test_uses_version_column(self):
+        compiled = _compiled_version_query(_VersionedPartDAO)
+
+        assert 'max(parts.updated_at)' in compiled
+        assert 'xmin' not in compiled
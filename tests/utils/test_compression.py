@@ -0,0 +1,126 @@
+import gzip
+from types import MappingProxyType
+from typing import Final
+
+import pytest
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse, StreamingResponse
+
+from src.utils.compression import CompressionMiddleware, negotiate_encoding
+
+_LARGE_TEXT = 'склад ' * 1000
+_GZIP: Final = MappingProxyType({'accept-encoding': 'gzip'})
+
+_router = APIRouter()
+
+
+async def _lines():
+    for line_number in range(100):
+        yield 'строка {0}\n'.format(line_number)
+
+
+@_router.get('/large')
+async def _large() -> PlainTextResponse:
+    return PlainTextResponse(_LARGE_TEXT)
+
+
+@_router.get('/small')
+async def _small() -> PlainTextResponse:
+    return PlainTextResponse('ok')
+
+
+@_router.get('/binary')
+async def _binary() -> PlainTextResponse:
+    return PlainTextResponse(
+        _LARGE_TEXT,
+        media_type='application/octet-stream',
+    )
+
+
+@_router.get('/partial')
+async def _partial() -> PlainTextResponse:
+    return PlainTextResponse(
+        _LARGE_TEXT,
+        status_code=206,
+        headers={'content-range': 'bytes 0-99/12000'},
+    )
+
+
+@_router.get('/stream')
+async def _stream() -> StreamingResponse:
+    return StreamingResponse(_lines(), media_type='text/plain')
+
+
+@pytest.fixture
+def client(make_client):
+    return make_client(
+        _router,
+        CompressionMiddleware,
+        encodings=('gzip',),
+        content_types={'text/plain': 100},
+    )
+
+
+class TestNegotiateEncoding:
+    def test_highest_weight_wins(self):
+        accept_encoding = 'gzip;q=0.5, br;q=0.9'
+
+        assert negotiate_encoding(accept_encoding, ('gzip', 'br')) == 'br'
+
+    def test_server_preference_breaks_ties(self):
+        assert negotiate_encoding('gzip, br', ('br', 'gzip')) == 'br'
+
+    def test_rejected_encodings(self):
+        assert negotiate_encoding('gzip;q=0, identity', ('gzip',)) is None
+        assert negotiate_encoding('*', ('gzip',)) == 'gzip'
+
+
+class TestCompressionMiddleware:
+    def test_compresses_large_response(self, client):
+        response = client.get(
+            '/large',
+            headers={'accept-encoding': 'gzip'},
+        )
+
+        assert response.headers['content-encoding'] == 'gzip'
+        assert response.headers['vary'] == 'Accept-Encoding'
+        assert response.text == _LARGE_TEXT
+
+    def test_skips_small_and_other_types(self, client):
+        headers = {'accept-encoding': 'gzip'}
+
+        small = client.get('/small', headers=headers)
+        binary = client.get('/binary', headers=headers)
+
+        assert 'content-encoding' not in small.headers
+        assert 'content-encoding' not in binary.headers
+
+    def test_streams_chunks(self, client):
+        with client.stream(
+            'GET',
+            '/stream',
+            headers={'accept-encoding': 'gzip'},
+        ) as response:
+            response_headers = response.headers
+            raw_body = b''.join(response.iter_raw())
+
+        assert response_headers['content-encoding'] == 'gzip'
+        assert 'content-length' not in response_headers
+        assert gzip.decompress(raw_body).decode().count('строка') == 100
+
+    def test_varies_on_uncompressed_responses(self, client):
+        small = client.get('/small', headers=_GZIP)
+        identity = client.get('/large', headers={'accept-encoding': 'identity'})
+        binary = client.get('/binary', headers=_GZIP)
+
+        assert small.headers['vary'] == 'Accept-Encoding'
+        assert identity.headers['vary'] == 'Accept-Encoding'
+        assert 'content-encoding' not in identity.headers
+        assert 'vary' not in binary.headers
+
+    def test_skips_partial_content(self, client):
+        response = client.get('/partial', headers=_GZIP)
+
+        assert response.status_code == 206
+        assert 'content-encoding' not in response.headers
+        assert response.text == _LARGE_TEXT
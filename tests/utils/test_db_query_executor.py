@@ -0,0 +1,79 @@
+import contextlib
+import time
+from types import MappingProxyType
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Table, select
+from sqlalchemy.exc import DBAPIError
+
+from src.utils.db_query_executor import execute_query
+from src.utils.deadline import SESSION_DEADLINE_KEY
+from src.utils.metrics import DB_QUERY_DURATION
+
+_PARTS = Table('parts', MetaData(), Column('part_id', Integer))
+_COUNT_SAMPLE = 'db_query_duration_seconds_count'
+_QUERY_LABELS = MappingProxyType({'table': 'parts', 'statement': 'select'})
+
+
+class _Session:
+    def __init__(self, error: Exception = None, deadline: float = None):
+        self.info = {SESSION_DEADLINE_KEY: deadline}  # noqa: WPS110
+        self.statements = []
+        self._error = error
+
+    @contextlib.asynccontextmanager
+    async def begin(self):
+        yield
+
+    async def execute(self, query, data_in=None):
+        self.statements.append(query)
+        if self._error is not None:
+            raise self._error
+        return []
+
+
+def _observations(outcome: str) -> float:
+    for metric in DB_QUERY_DURATION.collect():
+        for sample in metric.samples:
+            if sample.name != _COUNT_SAMPLE:
+                continue
+            if sample.labels == {**_QUERY_LABELS, 'outcome': outcome}:
+                return sample.value
+    return 0
+
+
+class TestExecuteQuery:
+    @pytest.mark.asyncio
+    async def test_observes_successful_query(self):
+        observed_before = _observations('ok')
+
+        await execute_query(_Session(), select(_PARTS))
+
+        assert _observations('ok') == observed_before + 1
+
+    @pytest.mark.asyncio
+    async def test_observes_failed_query(self):
+        observed_before = _observations('error')
+        session = _Session(DBAPIError('SELECT', {}, Exception('timeout')))
+
+        with pytest.raises(DBAPIError):
+            await execute_query(session, select(_PARTS))
+
+        assert _observations('error') == observed_before + 1
+
+    @pytest.mark.asyncio
+    async def test_loose_deadline_keeps_connection_timeout(self):
+        session = _Session(deadline=time.monotonic() + 60)
+
+        await execute_query(session, select(_PARTS))
+
+        assert len(session.statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_tight_deadline_sets_statement_timeout(self):
+        session = _Session(deadline=time.monotonic() + 1)
+
+        await execute_query(session, select(_PARTS))
+
+        assert len(session.statements) == 2
+        assert 'statement_timeout' in str(session.statements[0])
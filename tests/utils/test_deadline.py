@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+from fastapi import APIRouter
+
+from src.utils.deadline import DeadlineMiddleware, current_deadline
+
+_router = APIRouter()
+
+
+@_router.get('/parts')
+async def _list_parts() -> dict:
+    return {'has_deadline': current_deadline() is not None}
+
+
+@_router.get('/slow')
+async def _slow() -> dict:
+    await asyncio.sleep(0.2)
+    return {}
+
+
+@pytest.fixture
+def client(make_client):
+    return make_client(
+        _router,
+        DeadlineMiddleware,
+        route_timeouts={'/slow': 0.05},
+    )
+
+
+class TestDeadlineMiddleware:
+    def test_sets_deadline_for_request(self, client):
+        response = client.get('/parts')
+
+        assert response.json() == {'has_deadline': True}
+
+    def test_times_out_after_deadline(self, client):
+        by_route = client.get('/slow')
+        by_header = client.get(
+            '/slow',
+            headers={'X-Request-Timeout-Ms': '1000'},
+        )
+
+        assert by_route.status_code == 504
+        assert by_header.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_cancels_app_on_client_disconnect(self):
+        cancelled = asyncio.Event()
+        sent_messages = []
+
+        async def app(scope, receive, send):  # noqa: WPS430
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def receive():  # noqa: WPS430
+            return {'type': 'http.disconnect'}
+
+        async def send(message):  # noqa: WPS430
+            sent_messages.append(message)
+
+        scope = {'type': 'http', 'path': '/parts', 'headers': []}
+        await DeadlineMiddleware(app)(scope, receive, send)
+
+        assert cancelled.is_set()
+        assert not sent_messages
+
+    @pytest.mark.asyncio
+    async def test_keeps_started_response_past_deadline(self):
+        sent_messages = []
+
+        async def app(scope, receive, send):  # noqa: WPS430
+            await send({'type': 'http.response.start', 'status': 200})
+            await asyncio.sleep(0.1)
+            await send({'type': 'http.response.body', 'body': b'parts'})
+
+        async def receive():  # noqa: WPS430
+            await asyncio.Event().wait()
+
+        async def send(message):  # noqa: WPS430
+            sent_messages.append(message)
+
+        scope = {'type': 'http', 'path': '/parts', 'headers': []}
+        await DeadlineMiddleware(app, default_timeout=0.01)(
+            scope,
+            receive,
+            send,
+        )
+
+        assert [message['type'] for message in sent_messages] == [
+            'http.response.start',
+            'http.response.body',
+        ]
@@ -0,0 +1,62 @@
+import pytest
+from fastapi import APIRouter, Request, Response
+
+from src.utils.etag import check_not_modified, etag_matches, make_weak_etag
+
+
+@pytest.fixture
+def versions():
+    return ['3:100']
+
+
+@pytest.fixture
+def client(make_client, versions):
+    router = APIRouter()
+
+    @router.get('/parts')
+    async def list_parts(  # noqa: WPS430
+        request: Request,
+        response: Response,
+    ) -> list[str]:
+        check_not_modified(request, response, versions[-1])
+        return ['болт', 'гайка']
+
+    return make_client(router)
+
+
+class TestEtagMatches:
+    def test_weak_comparison(self):
+        etag = make_weak_etag('/parts', '', '3:100')
+
+        assert etag.startswith('W/"')
+        assert etag_matches(etag.removeprefix('W/'), etag)
+        assert etag_matches('"other", {0}'.format(etag), etag)
+        assert etag_matches('*', etag)
+        assert not etag_matches('W/"other"', etag)
+
+
+class TestCheckNotModified:
+    def test_not_modified_without_body(self, client):
+        etag = client.get('/parts').headers['etag']
+
+        response = client.get('/parts', headers={'if-none-match': etag})
+
+        assert response.status_code == 304
+        assert response.headers['etag'] == etag
+        assert not response.content
+
+    def test_changed_version(self, client, versions):
+        etag = client.get('/parts').headers['etag']
+
+        versions.append('4:101')
+        response = client.get('/parts', headers={'if-none-match': etag})
+
+        assert response.status_code == 200
+        assert response.headers['etag'] != etag
+        assert response.json() == ['болт', 'гайка']
+
+    def test_query_changes_etag(self, client):
+        assert (
+            client.get('/parts?page=1').headers['etag'] !=
+            client.get('/parts?page=2').headers['etag']
+        )
@@ -0,0 +1,85 @@
+import json
+import uuid
+from decimal import Decimal
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from src.utils.json_response import SERIALIZERS, FastJSONResponse
+
+
+class _Part(BaseModel):
+    part_id: uuid.UUID
+    name: str
+
+
+class _Other(BaseModel):
+    title: str
+
+
+SERIALIZERS.register(_Part)
+
+
+class TestDumpJson:
+    def test_registered_model_list(self):
+        parts = [
+            _Part(part_id=uuid.uuid4(), name='Болт'),
+            _Part(part_id=uuid.uuid4(), name='Винт'),
+        ]
+        expected = [part.model_dump(mode='json') for part in parts]
+
+        assert json.loads(SERIALIZERS.dump(parts)) == expected
+
+    def test_mixed_list_falls_back_to_orjson(self):
+        part = _Part(part_id=uuid.uuid4(), name='Гайка')
+        mixed = [part, _Other(title='Склад')]
+
+        assert json.loads(SERIALIZERS.dump(mixed)) == [
+            part.model_dump(mode='json'),
+            {'title': 'Склад'},
+        ]
+
+    def test_plain_content(self):
+        part_id = uuid.uuid4()
+
+        assert json.loads(SERIALIZERS.dump({'id': part_id, 'count': 2})) == {
+            'id': str(part_id),
+            'count': 2,
+        }
+
+    def test_decimals_and_non_str_keys(self):
+        payload = {1: Decimal('2.5'), 'total': Decimal('3')}
+
+        assert json.loads(SERIALIZERS.dump(payload)) == {
+            '1': 2.5,
+            'total': 3,
+        }
+
+
+class TestFastJSONResponse:
+    def test_default_response_class(self):
+        app = FastAPI(default_response_class=FastJSONResponse)
+
+        @app.get('/parts', response_model=list[_Part])
+        async def read_parts() -> list[_Part]:  # noqa: WPS430
+            return [_Part(part_id=uuid.UUID(int=1), name='Шайба')]
+
+        response = TestClient(app).get('/parts')
+
+        assert response.headers['content-type'] == 'application/json'
+        assert response.json() == [
+            {'part_id': str(uuid.UUID(int=1)), 'name': 'Шайба'},
+        ]
+
+    def test_explicit_response_skips_encoder(self):
+        app = FastAPI()
+        parts = [_Part(part_id=uuid.UUID(int=1), name='Шайба')]
+
+        @app.get('/parts', response_model=list[_Part])
+        def read_parts() -> FastJSONResponse:  # noqa: WPS430
+            return FastJSONResponse(parts)
+
+        response = TestClient(app).get('/parts')
+
+        assert response.content == SERIALIZERS.dump(parts)
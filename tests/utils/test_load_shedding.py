@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+
+from src.utils.adaptive_limiter import AdaptiveLimiter, RouteClassPolicy
+from src.utils.load_shedding import LoadSheddingMiddleware
+
+_OCCUPYING = RouteClassPolicy(share=1, queue_timeout=0)
+
+_router = APIRouter()
+
+
+@_router.get('/parts')
+async def _list_parts() -> list[str]:
+    return []
+
+
+@_router.post('/auth/refresh')
+async def _refresh() -> dict:
+    return {}
+
+
+@_router.get('/health/ready')
+async def _ready() -> dict:
+    return {}
+
+
+async def _slow_chunks():
+    yield b'first'
+    await asyncio.sleep(0.2)
+    yield b'second'
+
+
+@_router.get('/export')
+async def _export() -> StreamingResponse:
+    return StreamingResponse(_slow_chunks())
+
+
+@pytest.fixture
+def limiter():
+    return AdaptiveLimiter(4, 1, 10, target_latency=1)
+
+
+@pytest.fixture
+def client(make_client, limiter):
+    return make_client(
+        _router,
+        LoadSheddingMiddleware,
+        limiter=limiter,
+        route_classes={'/auth/refresh': 'critical'},
+        excluded_paths=('/health',),
+    )
+
+
+class TestLoadSheddingMiddleware:
+    def test_sheds_bulk_reads_under_load(self, client, limiter):
+        for _ in range(3):
+            asyncio.run(limiter.acquire(_OCCUPYING))
+
+        shed = client.get('/parts')
+        refresh = client.post('/auth/refresh')
+        health = client.get('/health/ready')
+
+        assert shed.status_code == 503
+        assert shed.headers['retry-after'] == '1'
+        assert refresh.status_code == 200
+        assert health.status_code == 200
+        assert limiter.in_flight == 3
+
+    def test_slow_body_does_not_lower_limit(self, make_client):
+        limiter = AdaptiveLimiter(4, 1, 10, target_latency=0.05)
+        client = make_client(_router, LoadSheddingMiddleware, limiter=limiter)
+
+        response = client.get('/export')
+
+        assert response.content == b'firstsecond'
+        assert limiter.limit == 4
@@ -0,0 +1,37 @@
+import asyncio
+import contextlib
+import time
+
+import pytest
+from loguru import logger
+
+from src.utils.loop_monitor import LoopLagMonitor
+
+
+def _block_loop() -> None:
+    time.sleep(0.3)
+
+
+@pytest.fixture
+def records():
+    captured = []
+    sink_id = logger.add(captured.append, format='{message}')
+    yield captured
+    logger.remove(sink_id)
+
+
+class TestLoopLagMonitor:
+    @pytest.mark.asyncio
+    async def test_logs_stack_of_blocking_call(self, records):
+        monitor = LoopLagMonitor(interval=0.01, block_threshold=0.1)
+        monitor_task = asyncio.create_task(monitor.run())
+        await asyncio.sleep(0.05)
+
+        _block_loop()
+        await asyncio.sleep(0.05)
+        monitor_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await monitor_task
+
+        assert len(records) == 1
+        assert '_block_loop' in records[0]
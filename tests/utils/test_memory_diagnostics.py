@@ -0,0 +1,36 @@
+import pytest
+
+from src.utils.memory_diagnostics import MemoryDiagnostics
+
+
+@pytest.fixture
+def diagnostics():
+    memory_diagnostics = MemoryDiagnostics()
+    yield memory_diagnostics
+    memory_diagnostics.stop()
+
+
+def _allocate() -> list[bytearray]:
+    return [bytearray(1024) for _ in range(1000)]
+
+
+class TestMemoryDiagnostics:
+    def test_reports_growth_since_previous_snapshot(self, diagnostics):
+        diagnostics.start(frames=1)
+        allocated = _allocate()
+
+        top_allocation = diagnostics.top_allocations('lineno', limit=1)[0]
+        next_allocations = diagnostics.top_allocations('lineno', limit=10)
+
+        assert len(allocated) == 1000
+        assert top_allocation.traceback[0].filename == __file__
+        assert top_allocation.size_diff >= 1024 * 1000
+        assert all(
+            statistic.size_diff < 1024 * 1000
+            for statistic in next_allocations
+        )
+
+    def test_reports_nothing_without_tracing(self, diagnostics):
+        assert not diagnostics.top_allocations('filename', limit=10)
+        assert len(diagnostics.gc_generations()) == 3
+        assert diagnostics.object_counts(limit=1)
@@ -0,0 +1,70 @@
+import os
+
+import pytest
+from fastapi import APIRouter
+
+from src.utils.metrics import (
+    HTTP_REQUEST_DURATION,
+    MetricsMiddleware,
+    mark_process_dead,
+)
+
+_COUNT_SAMPLE = 'http_request_duration_seconds_count'
+
+_router = APIRouter()
+
+
+@_router.get('/items/{item_id}')
+async def _read_item(item_id: int) -> dict:
+    return {'item_id': item_id}
+
+
+@pytest.fixture
+def client(make_client):
+    return make_client(_router, MetricsMiddleware)
+
+
+def _observations(route: str, status: str) -> float:
+    for metric in HTTP_REQUEST_DURATION.collect():
+        for sample in metric.samples:
+            sample_key = (
+                sample.name,
+                sample.labels['route'],
+                sample.labels['status'],
+            )
+            if sample_key == (_COUNT_SAMPLE, route, status):
+                return sample.value
+    return 0
+
+
+class TestMetricsMiddleware:
+    def test_requests_are_labelled_by_route_template(self, client):
+        observed_before = _observations('/items/{item_id}', '200')
+
+        client.get('/items/1')
+        client.get('/items/2')
+
+        assert _observations('/items/{item_id}', '200') == (
+            observed_before + 2
+        )
+
+    def test_unknown_path_is_grouped(self, client):
+        observed_before = _observations('<unmatched>', '404')
+
+        client.get('/missing/path')
+
+        assert _observations('<unmatched>', '404') == observed_before + 1
+
+
+class TestMarkProcessDead:
+    def test_removes_live_values_of_worker(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            'src.utils.metrics._MULTIPROCESS_DIR',
+            str(tmp_path),
+        )
+        live_values = tmp_path / 'gauge_livesum_{0}.db'.format(os.getpid())
+        live_values.touch()
+
+        mark_process_dead()
+
+        assert not live_values.exists()
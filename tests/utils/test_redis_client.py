@@ -0,0 +1,38 @@
+import pytest
+
+from src.utils.redis_client import LuaScript, LuaScripts, get_many, set_many
+
+_INCREMENT_SCRIPT = "return redis.call('INCRBY', KEYS[1], ARGV[1])"
+
+
+class TestBatchHelpers:
+    @pytest.mark.asyncio
+    async def test_round_trips_values_in_batches(self, redis):
+        key_values = {'a': 1, 'b': 2, 'c': 3}
+        await set_many(redis, key_values, ttl_seconds=60, batch_size=2)
+
+        stored = await get_many(redis, ['a', 'missing', 'b', 'c'], batch_size=3)
+
+        assert stored == ['1', None, '2', '3']
+        assert 0 < await redis.ttl('c') <= 60
+
+
+class TestLuaScript:
+    @pytest.mark.asyncio
+    async def test_loads_unknown_script_on_first_call(self, redis):
+        script = LuaScript(_INCREMENT_SCRIPT)
+
+        first = await script(redis, keys=['counter'], args=[2])
+        second = await script(redis, keys=['counter'], args=[3])
+
+        assert (first, second) == (2, 5)
+
+    @pytest.mark.asyncio
+    async def test_registry_preloads_scripts(self, redis):
+        scripts = LuaScripts()
+        script = scripts.register(_INCREMENT_SCRIPT)
+
+        await scripts.load(redis)
+
+        assert scripts.register(_INCREMENT_SCRIPT) is script
+        assert await redis.script_exists(script.sha) == [True]
@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+from fastapi import APIRouter
+from starlette.datastructures import Headers
+
+from src.utils.request_profiler import RequestProfilerMiddleware
+
+pytest.importorskip('pyinstrument')
+
+_router = APIRouter()
+
+
+@_router.get('/parts')
+async def _list_parts() -> list[str]:
+    await asyncio.sleep(0.01)
+    return []
+
+
+def _is_admin(headers: Headers) -> bool:
+    return headers.get('authorization') == 'Bearer admin'
+
+
+@pytest.fixture
+def profiled_client(make_client, tmp_path):
+    def factory(sample_rate: float = 0, max_files: int = 10):  # noqa: WPS430
+        return make_client(
+            _router,
+            RequestProfilerMiddleware,
+            authorize=_is_admin,
+            sample_rate=sample_rate,
+            output_dir=str(tmp_path),
+            max_files=max_files,
+        )
+
+    return factory
+
+
+class TestRequestProfilerMiddleware:
+    def test_returns_report_to_admin(self, profiled_client):
+        response = profiled_client().get(
+            '/parts?profile',
+            headers={'Authorization': 'Bearer admin'},
+        )
+
+        assert response.headers['content-type'].startswith('text/html')
+        assert response.headers['x-profiled-status'] == '200'
+
+    def test_ignores_trigger_without_admin_rights(self, profiled_client):
+        response = profiled_client().get(
+            '/parts',
+            headers={'X-Profile': '1', 'Authorization': 'Bearer reader'},
+        )
+
+        assert response.headers['content-type'] == 'application/json'
+
+    def test_stores_sampled_reports(self, profiled_client, tmp_path):
+        response = profiled_client(sample_rate=1).get('/parts')
+
+        assert response.status_code == 200
+        assert len(list(tmp_path.glob('*.html'))) == 1
+
+    def test_keeps_latest_reports(self, profiled_client, tmp_path):
+        stale_report = tmp_path / '1-1-GET_parts.html'
+        stale_report.write_text('')
+        client = profiled_client(sample_rate=1, max_files=2)
+
+        for _ in range(3):
+            client.get('/parts')
+
+        reports = list(tmp_path.glob('*.html'))
+        assert len(reports) == 2
+        assert stale_report not in reports
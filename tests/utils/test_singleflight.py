@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+from freezegun import freeze_time
+
+from src.utils.singleflight import SingleFlight
+
+
+class _Operation:
+    def __init__(self, delay: float = 0.01):
+        self.calls = 0
+        self._delay = delay
+
+    async def __call__(self, argument: int) -> int:
+        self.calls += 1
+        await asyncio.sleep(self._delay)
+        return argument * 2
+
+
+async def _failing_operation():
+    await asyncio.sleep(0.01)
+    raise ValueError('boom')
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_operation(self):
+        flight = SingleFlight()
+        operation = _Operation()
+
+        outcomes = await asyncio.gather(
+            *(flight.run('key', operation, 21) for _ in range(5)),
+        )
+
+        assert outcomes == [42, 42, 42, 42, 42]
+        assert operation.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self):
+        flight = SingleFlight()
+        operation = _Operation()
+
+        outcomes = await asyncio.gather(
+            flight.run('first', operation, 1),
+            flight.run('second', operation, 2),
+        )
+
+        assert outcomes == [2, 4]
+        assert operation.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_exception_is_shared(self):
+        flight = SingleFlight()
+
+        outcomes = await asyncio.gather(
+            flight.run('key', _failing_operation),
+            flight.run('key', _failing_operation),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(outcome, ValueError) for outcome in outcomes)
+
+    @pytest.mark.asyncio
+    async def test_grace_window(self):
+        flight = SingleFlight(grace_seconds=10)
+        operation = _Operation(delay=0)
+
+        with freeze_time('2024-01-01 00:00:00') as frozen_time:
+            assert await flight.run('key', operation, 1) == 2
+            assert await flight.run('key', operation, 1) == 2
+            assert operation.calls == 1
+
+            frozen_time.tick(11)
+            assert await flight.run('key', operation, 1) == 2
+            assert operation.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_without_grace_window(self):
+        flight = SingleFlight()
+        operation = _Operation(delay=0)
+
+        await flight.run('key', operation, 1)
+        await flight.run('key', operation, 1)
+
+        assert operation.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_keeps_operation(self):
+        flight = SingleFlight()
+        operation = _Operation(delay=0.05)
+
+        first = asyncio.ensure_future(flight.run('key', operation, 1))
+        second = asyncio.ensure_future(flight.run('key', operation, 1))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        assert await second == 2
+        assert operation.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_forget_where_drops_matching_results(self):
+        flight = SingleFlight(grace_seconds=10)
+        operation = _Operation(delay=0)
+        await flight.run('first', operation, 1)
+        await flight.run('second', operation, 2)
+
+        flight.forget_where(lambda outcome: outcome == 4)
+        await flight.run('first', operation, 1)
+        await flight.run('second', operation, 2)
+
+        assert operation.calls == 3
@@ -0,0 +1,106 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from pydantic import BaseModel, TypeAdapter
+
+from src.utils.stampede_cache import CachePolicy, StampedeCache
+
+
+class _Part(BaseModel):
+    name: str
+    count: int
+
+
+_OWN_SESSION = 'own'
+_REQUEST_SESSION = 'request'
+
+
+@asynccontextmanager
+async def _own_session():
+    yield _OWN_SESSION
+
+
+class _Query:
+    def __init__(self):
+        self.calls = 0
+        self.sessions = []
+
+    async def __call__(self, session) -> dict:
+        self.calls += 1
+        self.sessions.append(session)
+        await asyncio.sleep(0.05)
+        return {'version': self.calls}
+
+
+def _cache(redis, policy: CachePolicy, **kwargs) -> StampedeCache:
+    return StampedeCache(
+        'parts',
+        redis,
+        policy,
+        session_factory=_own_session,
+        **kwargs,
+    )
+
+
+class TestStampedeCache:
+    @pytest.mark.asyncio
+    async def test_cold_misses_compute_once_across_workers(self, redis):
+        policy = CachePolicy(ttl_seconds=60)
+        workers = [_cache(redis, policy) for _ in range(2)]
+        query = _Query()
+
+        cached_values = await asyncio.gather(
+            *(
+                worker.get_or_compute('all', query)
+                for worker in workers
+                for _ in range(5)
+            ),
+        )
+
+        assert query.calls == 1
+        assert cached_values == [{'version': 1} for _ in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_serves_stale_value_while_refreshing(self, redis):
+        cache = _cache(redis, CachePolicy(ttl_seconds=0.01))
+        query = _Query()
+        await cache.get_or_compute('all', query)
+        await asyncio.sleep(0.02)
+
+        stale_values = await asyncio.gather(
+            *(cache.get_or_compute('all', query) for _ in range(5)),
+        )
+        await asyncio.sleep(0.1)
+
+        assert stale_values == [{'version': 1} for _ in range(5)]
+        assert query.calls == 2
+        assert await cache.get_or_compute('all', query) == {'version': 2}
+
+    @pytest.mark.asyncio
+    async def test_computed_value_is_loaded_like_cached(self, redis):
+        cache = _cache(
+            redis,
+            CachePolicy(ttl_seconds=60),
+            load=TypeAdapter(_Part).validate_python,
+        )
+
+        async def read_part(session) -> _Part:  # noqa: WPS430
+            return _Part(name='Болт', count=3)
+
+        computed = await cache.get_or_compute('bolt', read_part)
+        cached = await cache.get_or_compute('bolt', read_part)
+
+        assert computed == cached == _Part(name='Болт', count=3)
+
+    @pytest.mark.asyncio
+    async def test_background_refresh_opens_own_session(self, redis):
+        cache = _cache(redis, CachePolicy(ttl_seconds=0.01))
+        query = _Query()
+        await cache.get_or_compute('all', query, _REQUEST_SESSION)
+        await asyncio.sleep(0.02)
+
+        await cache.get_or_compute('all', query, _REQUEST_SESSION)
+        await asyncio.sleep(0.1)
+
+        assert query.sessions == [_REQUEST_SESSION, _OWN_SESSION]
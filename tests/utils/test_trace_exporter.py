@@ -0,0 +1,93 @@
+import threading
+import time
+
+import orjson
+import pytest
+
+from src.utils.trace_exporter import JsonFileSpanExporter
+
+_WAIT_TIMEOUT_SECONDS = 5
+
+
+def _wait_for(condition) -> bool:
+    deadline = time.monotonic() + _WAIT_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def _span(number: int) -> list[dict]:
+    return [{'name': 'span', 'number': number}]
+
+
+def _export_and_wait(exporter: JsonFileSpanExporter, number: int) -> None:
+    exporter.export(_span(number))
+    assert _wait_for(lambda: exporter.stats['exported'] == number + 1)
+
+
+@pytest.fixture
+def make_exporter():
+    exporters = []
+
+    def factory(path, **options) -> JsonFileSpanExporter:  # noqa: WPS430
+        exporter = JsonFileSpanExporter(
+            str(path),
+            max_queue_size=options.get('max_queue_size', 100),
+            max_bytes=options.get('max_bytes', 1024),
+        )
+        exporters.append(exporter)
+        return exporter
+
+    yield factory
+    for exporter in exporters:
+        exporter.close()
+
+
+class TestJsonFileSpanExporter:
+    def test_full_file_is_rotated(self, make_exporter, tmp_path):
+        trace_path = tmp_path / 'traces.jsonl'
+        exporter = make_exporter(trace_path, max_bytes=1)
+        for number in range(3):
+            _export_and_wait(exporter, number)
+
+        rotated_path = tmp_path / 'traces.jsonl.1'
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            'traces.jsonl',
+            'traces.jsonl.1',
+        ]
+        assert orjson.loads(rotated_path.read_bytes())['number'] == 1
+        assert orjson.loads(trace_path.read_bytes())['number'] == 2
+
+    def test_write_error_does_not_stop_exporter(
+        self,
+        make_exporter,
+        tmp_path,
+    ):
+        exporter = make_exporter(tmp_path / 'missing' / 'traces.jsonl')
+        exporter.export(_span(0))
+        assert _wait_for(lambda: exporter.stats['failed'] == 1)
+
+        exporter.export(_span(1))
+
+        assert _wait_for(lambda: exporter.stats['failed'] == 2)
+
+    def test_full_queue_drops_traces(
+        self,
+        make_exporter,
+        monkeypatch,
+        tmp_path,
+    ):
+        exporter = make_exporter(tmp_path / 'traces.jsonl', max_queue_size=1)
+        released = threading.Event()
+        monkeypatch.setattr(exporter, '_write', lambda _: released.wait())
+        exporter.export(_span(0))
+        assert _wait_for(lambda: exporter._queue.empty())
+
+        for number in range(1, 4):
+            exporter.export(_span(number))
+        released.set()
+
+        assert exporter.stats['dropped'] == 2
+        assert _wait_for(lambda: exporter.stats['exported'] == 2)
@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from src.utils import tracing
+
+
+class _CollectingExporter:
+    def __init__(self):
+        self.traces = []
+
+    def export(self, spans: list) -> None:
+        self.traces.append(spans)
+
+
+@pytest.fixture
+def exporter(monkeypatch):
+    collecting_exporter = _CollectingExporter()
+    monkeypatch.setattr(tracing, '_exporter', collecting_exporter)
+    return collecting_exporter
+
+
+@tracing.traced()
+def _inner() -> str:
+    return tracing.current_trace_id()
+
+
+@tracing.traced('outer')
+async def _outer() -> str:
+    await asyncio.sleep(0)
+    return _inner()
+
+
+class TestTracing:
+    @pytest.mark.asyncio
+    async def test_sampled_trace_is_exported_once(self, exporter, monkeypatch):
+        monkeypatch.setattr(tracing, 'TRACE_SAMPLE_RATE', 1)
+
+        trace_id = await _outer()
+
+        assert len(exporter.traces) == 1
+        inner_span, outer_span = exporter.traces[0]
+        assert (inner_span['name'], outer_span['name']) == ('_inner', 'outer')
+        assert inner_span['parent_id'] == outer_span['span_id']
+        assert inner_span['trace_id'] == outer_span['trace_id'] == trace_id
+
+    @pytest.mark.asyncio
+    async def test_unsampled_trace_keeps_trace_id(self, exporter, monkeypatch):
+        monkeypatch.setattr(tracing, 'TRACE_SAMPLE_RATE', 0)
+
+        trace_id = await _outer()
+
+        assert trace_id is not None
+        assert not exporter.traces
+        assert tracing.current_trace_id() is None
@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+from src.utils.warmup import WarmUp
+
+
+class TestWarmUp:
+    @pytest.mark.asyncio
+    async def test_ready_after_all_steps(self):
+        calls = []
+
+        async def first_step():  # noqa: WPS430
+            calls.append('first')
+
+        async def failing_step():  # noqa: WPS430
+            raise RuntimeError('db is down')
+
+        warm_up = WarmUp()
+        warm_up.register('first', first_step)
+        warm_up.register('failing', failing_step)
+
+        assert not warm_up.ready
+        await warm_up.run()
+
+        assert warm_up.ready
+        assert calls == ['first']
+        assert warm_up.failed_steps == ['failing']
+
+    @pytest.mark.asyncio
+    async def test_only_enabled_steps_run(self):
+        calls = []
+
+        async def step():  # noqa: WPS430
+            calls.append('step')
+
+        warm_up = WarmUp(enabled_steps=frozenset(('other',)))
+        warm_up.register('step', step)
+
+        await warm_up.run()
+
+        assert warm_up.ready
+        assert not calls
+
+    @pytest.mark.asyncio
+    async def test_required_step_is_retried_until_ready(self):
+        attempts = []
+
+        async def flaky_step():  # noqa: WPS430
+            attempts.append('attempt')
+            if len(attempts) < 3:
+                raise RuntimeError('db is down')
+
+        warm_up = WarmUp(retry_interval=0.01)
+        warm_up.register('db_pool', flaky_step, required=True)
+        run = asyncio.create_task(warm_up.run())
+        await asyncio.sleep(0)
+
+        assert not warm_up.ready
+        assert warm_up.failed_steps == ['db_pool']
+        await asyncio.wait_for(run, timeout=1)
+
+        assert warm_up.ready
+        assert not warm_up.failed_steps
+        assert len(attempts) == 3